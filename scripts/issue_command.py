@@ -3,7 +3,7 @@
 Simple issue command that uses ISSUE.md template to create GitHub issues.
 
 Usage:
-    python3 scripts/issue_command.py "feature description here"
+    python3 scripts/issue_command.py "feature description here" > prompt.md
 """
 
 import sys
@@ -17,7 +17,7 @@ def create_issue_from_template(feature_description: str) -> bool:
     # Read the ISSUE.md template
     template_path = Path("ISSUE.md")
     if not template_path.exists():
-        print("❌ ISSUE.md template not found!")
+        print("❌ ISSUE.md template not found!", file=sys.stderr)
         return False
     
     try:
@@ -27,43 +27,53 @@ def create_issue_from_template(feature_description: str) -> bool:
         # Replace #ARGUMENTS with the actual feature description
         issue_prompt = template_content.replace("#ARGUMENTS", feature_description)
         
-        # Write to a temporary file for the AI to process
-        temp_file = Path("temp_issue_prompt.md")
-        with open(temp_file, 'w') as f:
-            f.write(issue_prompt)
+        # Print the prompt to stdout so it can be piped to an AI assistant;
+        # status messages go to stderr to keep stdout clean
+        print(issue_prompt)
         
-        print(f"✅ Created issue prompt with feature: '{feature_description}'")
-        print(f"📄 Prompt saved to: {temp_file}")
-        print(f"\n📋 Next steps:")
-        print(f"   1. Use this prompt with an AI assistant")
-        print(f"   2. AI will research the repository and create a structured issue")
-        print(f"   3. AI will use 'gh issue create' to submit the issue")
+        print(
+            f"✅ Created issue prompt with feature: '{feature_description}'",
+            file=sys.stderr,
+        )
+        print(f"\n📋 Next steps:", file=sys.stderr)
+        print(f"   1. Use this prompt with an AI assistant", file=sys.stderr)
+        print(
+            f"   2. AI will research the repository and create a structured issue",
+            file=sys.stderr,
+        )
+        print(
+            f"   3. AI will use 'gh issue create' to submit the issue",
+            file=sys.stderr,
+        )
         
         return True
         
     except Exception as e:
-        print(f"❌ Error creating issue prompt: {e}")
+        print(f"❌ Error creating issue prompt: {e}", file=sys.stderr)
         return False
-    finally:
-        # Clean up temp file if it exists
-        if 'temp_file' in locals() and temp_file.exists():
-            temp_file.unlink()
 
 
 def main():
     """Main entry point."""
     if len(sys.argv) != 2:
-        print("Usage: python3 scripts/issue_command.py \"feature description\"")
-        print("Example: python3 scripts/issue_command.py \"Add Excel formula validation\"")
+        print(
+            "Usage: python3 scripts/issue_command.py \"feature description\"",
+            file=sys.stderr,
+        )
+        print(
+            "Example: python3 scripts/issue_command.py "
+            "\"Add Excel formula validation\"",
+            file=sys.stderr,
+        )
         sys.exit(1)
     
     feature_description = sys.argv[1].strip()
     
     if not feature_description:
-        print("❌ Feature description cannot be empty!")
+        print("❌ Feature description cannot be empty!", file=sys.stderr)
         sys.exit(1)
     
-    print(f"🚀 Creating issue for: {feature_description}")
+    print(f"🚀 Creating issue for: {feature_description}", file=sys.stderr)
     
     success = create_issue_from_template(feature_description)
     sys.exit(0 if success else 1)
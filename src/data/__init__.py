@@ -3,6 +3,8 @@
 from .ge_adapter import (
     ValidationResult,
     run_expectations,
+    run_expectations_df,
+    run_expectations_batch,
     is_ge_supported,
     create_sample_rule_yaml,
 )
@@ -12,6 +14,8 @@ from .data_diff_rule import DataDiffRule
 __all__ = [
     "ValidationResult",
     "run_expectations",
+    "run_expectations_df",
+    "run_expectations_batch",
     "is_ge_supported",
     "create_sample_rule_yaml",
     "DataValidationRule",
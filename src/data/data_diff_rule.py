@@ -1,17 +1,22 @@
 """Data diff rule for comparing two Excel workbooks cell-by-cell."""
 
-import tempfile
-import subprocess
+import hashlib
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import numpy as np
 import pandas as pd
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
 
 from ..structural.base import Rule, ValidationFailure
+from .ge_adapter import EXCEL_ENGINE
+
+# Read size used when hashing workbooks for the identical-file check
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 class DataDiffRule(Rule):
-    """Rule for comparing two Excel workbooks cell-by-cell using xlcompare."""
+    """Rule for comparing two Excel workbooks cell-by-cell."""
 
     def __init__(self, sheet_name: str, sheet_config: Optional[dict] = None) -> None:
         """Initialize data diff rule.
@@ -26,6 +31,11 @@ class DataDiffRule(Rule):
     def run_diff(self, old_workbook_path: Path, new_workbook_path: Path) -> List[ValidationFailure]:
         """Compare two workbooks and return cell-level differences.
         
+        Both workbooks are loaded into DataFrames indexed by the ID column and
+        diffed in-process: IDs only in the new sheet are added rows, IDs only
+        in the old sheet are deleted rows, and shared IDs are compared cell by
+        cell.
+        
         Args:
             old_workbook_path: Path to the old/baseline workbook
             new_workbook_path: Path to the new/current workbook
@@ -36,215 +46,187 @@ class DataDiffRule(Rule):
         failures = []
         
         try:
-            # Create temporary directory for xlcompare output
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Run xlcompare command with absolute paths
-                result = subprocess.run([
-                    'xlcompare', 
-                    str(old_workbook_path.resolve()), 
-                    str(new_workbook_path.resolve())
-                ], 
-                cwd=temp_path,
-                capture_output=True, 
-                text=True
-                )
-                
-                if result.returncode != 0:
-                    failures.append(ValidationFailure(
-                        type="diff_error",
-                        message=f"xlcompare failed: {result.stderr}",
-                        fix_hint="Check that both workbooks are valid Excel files"
-                    ))
-                    return failures
-                
-                # Read the generated diff.xlsx file
-                diff_file = temp_path / "diff.xlsx"
-                if not diff_file.exists():
-                    failures.append(ValidationFailure(
-                        type="diff_error", 
-                        message="xlcompare did not generate diff.xlsx",
-                        fix_hint="Check that workbooks have differences to compare"
-                    ))
-                    return failures
+            # Byte-identical workbooks cannot differ; skip parsing them
+            if self._files_identical(old_workbook_path, new_workbook_path):
+                return failures
+            
+            # Load the first sheet of each workbook
+            sheet_name, old_df = self._load_sheet(old_workbook_path)
+            _, new_df = self._load_sheet(new_workbook_path)
+            
+            if self.id_column not in old_df.columns or self.id_column not in new_df.columns:
+                failures.append(ValidationFailure(
+                    type="diff_error",
+                    sheet=sheet_name,
+                    message=f"ID column '{self.id_column}' not found in both workbooks",
+                    fix_hint="Check that both sheets have a header row with the ID column"
+                ))
+                return failures
+            
+            old_df = self._index_by_id(old_df)
+            new_df = self._index_by_id(new_df)
+            columns = new_df.columns.drop(['_row_num'])
+            
+            # Resolve row positions of the shared IDs with one hash lookup per
+            # new row; -1 marks IDs missing from the old sheet
+            old_pos = old_df.index.get_indexer(new_df.index)
+            in_old = old_pos >= 0
+            in_new = old_df.index.isin(new_df.index)
+            common_pos = np.flatnonzero(in_old)
+            old_pos = old_pos[common_pos]
+            new_row_nums = new_df['_row_num'].to_numpy()
+            old_row_nums = old_df['_row_num'].to_numpy()
+            
+            # Compare cells of rows present in both workbooks in one vectorized
+            # pass over the aligned value arrays
+            old_values = old_df.reindex(columns=columns).to_numpy(dtype=object)[old_pos]
+            new_values = new_df[columns].to_numpy(dtype=object)[common_pos]
+            old_missing = pd.isna(old_values)
+            new_missing = pd.isna(new_values)
+            changed = self._changed_mask(old_values, new_values) & ~(old_missing & new_missing)
+            
+            # Cell addresses refer to the new workbook
+            row_nums = new_row_nums[common_pos]
+            col_letters = [
+                get_column_letter(new_df.columns.get_loc(col_name) + 1)
+                for col_name in columns
+            ]
+            
+            for row_pos, col_pos in np.argwhere(changed):
+                old_str = "" if old_missing[row_pos, col_pos] else str(old_values[row_pos, col_pos])
+                new_str = "" if new_missing[row_pos, col_pos] else str(new_values[row_pos, col_pos])
+                col_name = columns[col_pos]
+                cell_address = f"{col_letters[col_pos]}{row_nums[row_pos]}"
                 
-                # Parse the diff file to extract cell changes
-                diff_failures = self._parse_diff_file(diff_file, old_workbook_path, new_workbook_path)
-                failures.extend(diff_failures)
+                failures.append(ValidationFailure(
+                    type="cell_changed",
+                    sheet=sheet_name,
+                    cell=cell_address,
+                    message=f"Cell {cell_address} changed in column '{col_name}'",
+                    expected=old_str,
+                    found=new_str,
+                    fix_hint=f"Value changed from '{old_str}' to '{new_str}'"
+                ))
+            
+            # Rows only present in the new workbook
+            for id_value, row_num in zip(new_df.index[~in_old], new_row_nums[~in_old]):
+                failures.append(ValidationFailure(
+                    type="row_added",
+                    sheet=sheet_name,
+                    message=f"New row added with {self.id_column}={id_value}",
+                    expected="",
+                    found=f"Row {row_num}",
+                    fix_hint="Row was added to the new workbook"
+                ))
+            
+            # Rows only present in the old workbook
+            for id_value, row_num in zip(old_df.index[~in_new], old_row_nums[~in_new]):
+                failures.append(ValidationFailure(
+                    type="row_deleted", 
+                    sheet=sheet_name,
+                    message=f"Row deleted with {self.id_column}={id_value}",
+                    expected=f"Row {row_num}",
+                    found="",
+                    fix_hint="Row was removed from the new workbook"
+                ))
                 
         except Exception as e:
             failures.append(ValidationFailure(
                 type="diff_error",
                 message=f"Error running diff comparison: {e}",
-                fix_hint="Check that xlcompare is installed and workbooks are accessible"
+                fix_hint="Check that both workbooks exist and are valid Excel files"
             ))
             
         return failures
 
-    def _parse_diff_file(self, diff_file: Path, old_workbook_path: Path, new_workbook_path: Path) -> List[ValidationFailure]:
-        """Parse xlcompare diff.xlsx output to extract cell-level changes.
+    def _files_identical(self, old_path: Path, new_path: Path) -> bool:
+        """Check whether two files have exactly the same content.
+        
+        Sizes are compared first; files of equal size are compared by their
+        BLAKE2b digests, which is far cheaper than parsing the workbooks.
         
         Args:
-            diff_file: Path to the xlcompare diff.xlsx file
-            old_workbook_path: Path to old workbook for reference
-            new_workbook_path: Path to new workbook for reference
+            old_path: Path to the first file
+            new_path: Path to the second file
             
         Returns:
-            List of ValidationFailure objects for each cell change
+            True if both files contain the same bytes
         """
-        failures = []
+        old_path, new_path = Path(old_path), Path(new_path)
+        if old_path.stat().st_size != new_path.stat().st_size:
+            return False
+        if old_path.resolve() == new_path.resolve():
+            return True
+        return self._file_digest(old_path) == self._file_digest(new_path)
+
+    def _file_digest(self, path: Path) -> bytes:
+        """Hash a file's content in fixed-size chunks.
         
-        try:
-            # Read the diff Excel file
-            df = pd.read_excel(diff_file)
-            
-            # Load original workbooks to get precise cell values
-            old_wb = load_workbook(old_workbook_path, data_only=True)
-            new_wb = load_workbook(new_workbook_path, data_only=True)
-            
-            # Get the first sheet (xlcompare only processes first sheet)
-            old_sheet = old_wb.active
-            new_sheet = new_wb.active
-            sheet_name = old_sheet.title
-            
-            # Find rows that have changed
-            changed_rows = df[df.get('Changed', 'No') == 'Yes']
-            
-            for _, row in changed_rows.iterrows():
-                # Get the ID to find the row number in original sheets
-                id_value = row.get(self.id_column)
-                if id_value is None:
-                    continue
-                    
-                # Find the row in original sheets
-                old_row_num = self._find_row_by_id(old_sheet, self.id_column, id_value)
-                new_row_num = self._find_row_by_id(new_sheet, self.id_column, id_value)
-                
-                if old_row_num and new_row_num:
-                    # Compare each cell in the row
-                    cell_failures = self._compare_row_cells(
-                        old_sheet, new_sheet, old_row_num, new_row_num, 
-                        sheet_name, df.columns
-                    )
-                    failures.extend(cell_failures)
-                elif new_row_num and not old_row_num:
-                    # This is a new row
-                    failures.append(ValidationFailure(
-                        type="row_added",
-                        sheet=sheet_name,
-                        message=f"New row added with {self.id_column}={id_value}",
-                        expected="",
-                        found=f"Row {new_row_num}",
-                        fix_hint="Row was added to the new workbook"
-                    ))
-                elif old_row_num and not new_row_num:
-                    # This is a deleted row
-                    failures.append(ValidationFailure(
-                        type="row_deleted", 
-                        sheet=sheet_name,
-                        message=f"Row deleted with {self.id_column}={id_value}",
-                        expected=f"Row {old_row_num}",
-                        found="",
-                        fix_hint="Row was removed from the new workbook"
-                    ))
-                        
-        except Exception as e:
-            failures.append(ValidationFailure(
-                type="diff_parse_error",
-                message=f"Error parsing diff file: {e}",
-                fix_hint="Check that diff.xlsx is a valid Excel file"
-            ))
+        Args:
+            path: Path to the file
             
-        return failures
+        Returns:
+            16-byte BLAKE2b digest of the file
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.digest()
 
-    def _find_row_by_id(self, sheet, id_column: str, id_value) -> Optional[int]:
-        """Find row number by ID column value.
+    def _load_sheet(self, workbook_path: Path) -> Tuple[str, pd.DataFrame]:
+        """Load the first sheet of a workbook into a DataFrame.
+        
+        Values are kept as the original Python objects (dtype=object) so that
+        e.g. integers are not widened to floats by column type inference.
         
         Args:
-            sheet: Excel worksheet
-            id_column: Name of the ID column
-            id_value: Value to search for
+            workbook_path: Path to the Excel workbook
             
         Returns:
-            Row number (1-based) or None if not found
+            Tuple of (sheet name, DataFrame of the sheet's values)
         """
-        try:
-            # Find the ID column index
-            id_col_idx = None
-            for col_idx, cell in enumerate(sheet[1], 1):  # Header row
-                if cell.value == id_column:
-                    id_col_idx = col_idx
-                    break
-                    
-            if id_col_idx is None:
-                return None
-                
-            # Search for the ID value
-            for row_idx in range(2, sheet.max_row + 1):  # Skip header
-                cell_value = sheet.cell(row_idx, id_col_idx).value
-                if str(cell_value) == str(id_value):
-                    return row_idx
-                    
-        except Exception:
-            pass
-        
-        return None
+        with pd.ExcelFile(workbook_path, engine=EXCEL_ENGINE) as excel_file:
+            sheet_name = excel_file.sheet_names[0]
+            df = excel_file.parse(sheet_name, dtype=object)
+        return sheet_name, df
 
-    def _compare_row_cells(self, old_sheet, new_sheet, old_row_num: int, new_row_num: int, 
-                          sheet_name: str, columns: List[str]) -> List[ValidationFailure]:
-        """Compare cells between two rows and return failures for differences.
+    def _changed_mask(self, old_values: np.ndarray, new_values: np.ndarray) -> np.ndarray:
+        """Flag cells whose values differ between two aligned value arrays.
+        
+        Values are compared by their typed equality; the string form is only
+        consulted for cells that compare equal across different types (e.g.
+        1 vs True or 1 vs 1.0), so such edits are still reported as changes.
         
         Args:
-            old_sheet: Old worksheet
-            new_sheet: New worksheet  
-            old_row_num: Row number in old sheet
-            new_row_num: Row number in new sheet
-            sheet_name: Name of the sheet
-            columns: List of column names
+            old_values: Object array of old cell values
+            new_values: Object array of new cell values with the same shape
             
         Returns:
-            List of ValidationFailure objects for cell differences
+            Boolean array that is True where the cell value changed
         """
-        failures = []
+        changed = old_values != new_values
+        type_of = np.frompyfunc(type, 1, 1)
+        mixed = ~changed & (type_of(old_values) != type_of(new_values))
+        for pos in zip(*np.nonzero(mixed)):
+            changed[pos] = str(old_values[pos]) != str(new_values[pos])
+        return changed
+
+    def _index_by_id(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Index a sheet DataFrame by the ID column.
         
-        try:
-            # Compare each column
-            for col_idx, col_name in enumerate(columns, 1):
-                if col_name == 'Changed':  # Skip the added 'Changed' column
-                    continue
-                    
-                old_value = old_sheet.cell(old_row_num, col_idx).value
-                new_value = new_sheet.cell(new_row_num, col_idx).value
-                
-                # Convert to string for comparison
-                old_str = str(old_value) if old_value is not None else ""
-                new_str = str(new_value) if new_value is not None else ""
-                
-                if old_str != new_str:
-                    # Get cell address
-                    from openpyxl.utils import get_column_letter
-                    cell_address = f"{get_column_letter(col_idx)}{new_row_num}"
-                    
-                    failures.append(ValidationFailure(
-                        type="cell_changed",
-                        sheet=sheet_name,
-                        cell=cell_address,
-                        message=f"Cell {cell_address} changed in column '{col_name}'",
-                        expected=old_str,
-                        found=new_str,
-                        fix_hint=f"Value changed from '{old_str}' to '{new_str}'"
-                    ))
-                    
-        except Exception as e:
-            failures.append(ValidationFailure(
-                type="cell_compare_error",
-                sheet=sheet_name,
-                message=f"Error comparing row cells: {e}",
-                fix_hint="Check that both sheets have the same structure"
-            ))
+        Records each row's 1-based Excel row number in a '_row_num' column,
+        drops rows without an ID and keeps the first row for duplicate IDs.
+        
+        Args:
+            df: DataFrame loaded by _load_sheet
             
-        return failures
+        Returns:
+            DataFrame indexed by ID value
+        """
+        df = df.assign(_row_num=df.index + 2)  # Header is row 1
+        df = df[df[self.id_column].notna()].set_index(self.id_column, drop=False)
+        return df[~df.index.duplicated()]
 
     def run(self, workbook: Workbook) -> List[ValidationFailure]:
         """Standard run method for Rule interface (not used for diff).
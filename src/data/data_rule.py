@@ -1,13 +1,22 @@
 """Data validation rule wrapper for Great Expectations integration."""
 
-import tempfile
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from openpyxl import Workbook
 
 from ..structural.base import Rule, ValidationFailure
-from .ge_adapter import run_expectations, is_ge_supported
+from .ge_adapter import (
+    get_read_options,
+    get_target_sheet,
+    is_ge_supported,
+    load_rule_config,
+    run_expectations_df,
+    worksheet_to_dataframe,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DataValidationRule(Rule):
@@ -18,15 +27,35 @@ class DataValidationRule(Rule):
     the Rule interface.
     """
 
-    def __init__(self, rule_file_path: str, sheet_config: Any) -> None:
+    def __init__(
+        self,
+        rule_file_path: str,
+        sheet_config: Any,
+        frame_cache: Optional[Dict[Tuple[Any, ...], "pd.DataFrame"]] = None,
+    ) -> None:
         """Initialize data validation rule.
 
         Args:
             rule_file_path: Path to the YAML file containing GE expectations
             sheet_config: Configuration object (not used for data validation)
+            frame_cache: Optional dictionary shared by the rules run against
+                one workbook, so rules reading the same sheet with the same
+                row/column limits reuse one DataFrame
         """
         super().__init__("", sheet_config)  # Sheet name determined from rule file
         self.rule_file_path = Path(rule_file_path)
+        self._frame_cache = frame_cache
+
+        # Parse the rule file once; run() reports any error if this fails
+        self._rule_config: Optional[Dict[str, Any]] = None
+        try:
+            self._rule_config = load_rule_config(self.rule_file_path)
+        except Exception:
+            pass
+
+        # Sheet name reported on failures
+        target_config = (self._rule_config or {}).get("target", {})
+        self._sheet_name = target_config.get("sheet", "Data")
 
     def run(self, workbook: Workbook) -> List[ValidationFailure]:
         """Execute Great Expectations validation against workbook data.
@@ -56,30 +85,25 @@ class DataValidationRule(Rule):
             return failures
 
         try:
-            # Save workbook to temporary file for GE processing
-            with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
-                temp_path = Path(tmp_file.name)
-                workbook.save(temp_path)
-
-            try:
-                # Run Great Expectations validation
-                validation_result = run_expectations(temp_path, self.rule_file_path)
-
-                # Convert GE failures to ValidationFailure objects
-                if not validation_result.success:
-                    ge_failures = validation_result.get_failures()
-                    for ge_failure in ge_failures:
-                        failure = self._convert_ge_failure_to_validation_failure(
-                            ge_failure
-                        )
-                        failures.append(failure)
-
-            finally:
-                # Clean up temporary file
-                try:
-                    temp_path.unlink()
-                except OSError:
-                    pass
+            # Build the target sheet's DataFrame straight from the workbook
+            # instead of saving it to disk for pandas to read back
+            rule_config = self._rule_config or load_rule_config(self.rule_file_path)
+            sheet_name = get_target_sheet(rule_config)
+            df = self._load_frame(workbook, sheet_name, get_read_options(rule_config))
+
+            # Run Great Expectations validation
+            validation_result = run_expectations_df(
+                df, self.rule_file_path, rule_config
+            )
+
+            # Convert GE failures to ValidationFailure objects
+            if not validation_result.success:
+                ge_failures = validation_result.get_failures()
+                for ge_failure in ge_failures:
+                    failure = self._convert_ge_failure_to_validation_failure(
+                        ge_failure
+                    )
+                    failures.append(failure)
 
         except Exception as e:
             failures.append(
@@ -92,6 +116,38 @@ class DataValidationRule(Rule):
 
         return failures
 
+    def _load_frame(
+        self, workbook: Workbook, sheet_name: Union[str, int], read_options: Dict[str, Any]
+    ) -> "pd.DataFrame":
+        """Build the target sheet's DataFrame, reusing a cached one if possible.
+
+        Args:
+            workbook: The Excel workbook to validate
+            sheet_name: Target sheet name or index
+            read_options: Row/column limits from get_read_options
+
+        Returns:
+            DataFrame containing the target sheet's data
+        """
+        usecols = read_options.get("usecols")
+        cache_key = (
+            sheet_name,
+            read_options.get("nrows"),
+            tuple(usecols) if usecols is not None else None,
+        )
+        if self._frame_cache is not None and cache_key in self._frame_cache:
+            return self._frame_cache[cache_key]
+
+        if isinstance(sheet_name, int):
+            worksheet = workbook.worksheets[sheet_name]
+        else:
+            worksheet = workbook[sheet_name]
+        df = worksheet_to_dataframe(worksheet, **read_options)
+
+        if self._frame_cache is not None:
+            self._frame_cache[cache_key] = df
+        return df
+
     def _convert_ge_failure_to_validation_failure(
         self, ge_failure: dict
     ) -> ValidationFailure:
@@ -112,34 +168,19 @@ class DataValidationRule(Rule):
         observed_value = result.get("observed_value")
         unexpected_count = result.get("unexpected_count", 0)
 
-        # Determine sheet name from rule file or use default
-        sheet_name = "Data"  # Default, could be extracted from rule config
-        try:
-            import yaml
-
-            with open(self.rule_file_path, "r") as f:
-                rule_config = yaml.safe_load(f)
-                target_config = rule_config.get("target", {})
-                sheet_name = target_config.get("sheet", "Data")
-        except Exception:
-            pass  # Use default sheet name if can't read rule file
-
         # Create ValidationFailure with proper fields for JSON output
         failure = ValidationFailure(
             type="expectation_failed",
-            sheet=sheet_name,
+            sheet=self._sheet_name,
             message=f"{expectation_type} failed on column '{column}'",
             expected=expectation_type,
             found=f"unexpected_count: {unexpected_count}",
+            expectation=expectation_type,
+            column=column,
+            unexpected_count=unexpected_count,
+            observed_value=str(observed_value) if observed_value else None,
         )
 
-        # Add custom fields as attributes for JSON serialization
-        setattr(failure, "expectation", expectation_type)
-        setattr(failure, "column", column)
-        setattr(failure, "unexpected_count", unexpected_count)
-        if observed_value:
-            setattr(failure, "observed_value", str(observed_value))
-
         return failure
 
     def to_dict(self) -> dict:
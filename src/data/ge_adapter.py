@@ -1,20 +1,44 @@
 """Great Expectations adapter for data validation in Excel files."""
 
+import datetime
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
+try:
+    # LibYAML-backed loader; several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 try:
     import pandas as pd
+    from pandas.io.parsers import TextParser
 except ImportError:
     pd = None  # type: ignore
+    TextParser = None  # type: ignore
 
 try:
     import great_expectations as ge
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
 except ImportError:
     ge = None  # type: ignore
+    ExpectationConfiguration = None  # type: ignore
+
+try:
+    import python_calamine  # type: ignore # noqa: F401
+
+    # Rust-based reader: much faster and lighter than openpyxl for .xlsx
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +47,8 @@ logger = logging.getLogger(__name__)
 class ValidationResult:
     """Container for Great Expectations validation results."""
 
+    __slots__ = ("success", "results", "statistics", "rule_path")
+
     def __init__(
         self,
         success: bool,
@@ -95,10 +121,7 @@ def run_expectations(
         ...     print(result.get_failure_summary())
     """
     # Validate dependencies
-    if pd is None:
-        raise ImportError("pandas is required for Excel data validation")
-    if ge is None:
-        raise ImportError("great-expectations is required for data validation")
+    _check_dependencies()
 
     # Convert paths to Path objects
     xlsx_path = Path(xlsx_path)
@@ -111,108 +134,353 @@ def run_expectations(
         raise FileNotFoundError(f"Rule file not found: {rule_yaml_path}")
 
     try:
-        # Load and parse rule configuration
-        with open(rule_yaml_path, "r", encoding="utf-8") as f:
-            rule_config = yaml.safe_load(f)
+        rule_config = load_rule_config(rule_yaml_path)
+        sheet_name = get_target_sheet(rule_config)
 
-        # Validate rule structure
-        if not isinstance(rule_config, dict):
-            raise ValueError("Rule file must contain a YAML dictionary")
+        # Load Excel data into pandas DataFrame
+        logger.info(f"Loading Excel file: {xlsx_path}, sheet: {sheet_name}")
+        df = pd.read_excel(
+            xlsx_path,
+            sheet_name=sheet_name,
+            engine=EXCEL_ENGINE,
+            **get_read_options(rule_config),
+        )
 
-        rule_type = rule_config.get("rule_type")
-        if rule_type != "data_validation":
-            raise ValueError(f"Expected rule_type 'data_validation', got '{rule_type}'")
+        return _validate_dataframe(df, rule_config, rule_yaml_path, sheet_name)
 
-        expectations_config = rule_config.get("expectations", [])
-        if not expectations_config:
-            raise ValueError("Rule file must contain 'expectations' list")
+    except Exception as e:
+        if isinstance(e, (ImportError, FileNotFoundError, ValueError)):
+            raise
+        raise RuntimeError(f"Great Expectations validation failed: {e}") from e
 
-        target_config = rule_config.get("target", {})
-        sheet_name = target_config.get("sheet", 0)  # Default to first sheet
 
-        # Load Excel data into pandas DataFrame
-        logger.info(f"Loading Excel file: {xlsx_path}, sheet: {sheet_name}")
-        df = pd.read_excel(xlsx_path, sheet_name=sheet_name)
-
-        if df.empty:
-            raise ValueError(f"Excel sheet '{sheet_name}' contains no data")
-
-        logger.info(f"Loaded {len(df)} rows, {len(df.columns)} columns")
-
-        # Create Great Expectations context and data source
-        context = ge.get_context()
-        data_source = context.data_sources.add_pandas(name="excel_datasource")
-        data_asset = data_source.add_dataframe_asset(name="excel_dataframe")
-        batch_definition = data_asset.add_batch_definition_whole_dataframe("excel_batch")
-        batch = batch_definition.get_batch(batch_parameters={"dataframe": df})
-        
-        # Get validator for adding expectations
-        validator = context.get_validator(batch=batch)
-
-        # Add expectations from rule configuration
-        for expectation_config in expectations_config:
-            expectation_type = expectation_config.get("expectation_type")
-            kwargs = expectation_config.get("kwargs", {})
-            meta = expectation_config.get("meta", {})
-
-            if not expectation_type:
-                logger.warning("Skipping expectation without type")
-                continue
-
-            # Add expectation to validator
-            try:
-                getattr(validator, expectation_type)(**kwargs, meta=meta)
-                logger.debug(f"Added expectation: {expectation_type}")
-            except AttributeError:
-                logger.error(f"Unknown expectation type: {expectation_type}")
-                continue
-            except Exception as e:
-                logger.error(f"Failed to add expectation {expectation_type}: {e}")
-                continue
-
-        # Run validation
-        logger.info(f"Running {len(expectations_config)} expectations")
-        validation_result = validator.validate(catch_exceptions=True)
-
-        # Process results
-        success = validation_result.success
-        results = validation_result.results
-        statistics = validation_result.statistics
-
-        # Apply success threshold if specified
-        validation_config = rule_config.get("validation", {})
-        success_threshold = validation_config.get("success_threshold")
-
-        if success_threshold is not None:
-            success_rate = statistics.get("successful_expectations", 0) / max(
-                statistics.get("evaluated_expectations", 1), 1
-            )
-            if success_rate < success_threshold:
-                success = False
-                logger.warning(
-                    f"Success rate {success_rate:.2%} below threshold "
-                    f"{success_threshold:.2%}"
-                )
-
-        logger.info(
-            f"Validation completed: {statistics.get('successful_expectations', 0)}/"
-            f"{statistics.get('evaluated_expectations', 0)} passed"
-        )
+def run_expectations_df(
+    df: "pd.DataFrame",
+    rule_yaml_path: Union[str, Path],
+    rule_config: Optional[Dict[str, Any]] = None,
+) -> ValidationResult:
+    """Run Great Expectations validations on an in-memory DataFrame.
 
-        return ValidationResult(
-            success=success,
-            results=results,
-            statistics=statistics,
-            rule_path=str(rule_yaml_path),
-        )
+    Same as run_expectations, but skips reading the Excel file so callers
+    that already hold the sheet data (e.g. an open openpyxl workbook) don't
+    have to write it back to disk first.
+
+    Args:
+        df: DataFrame containing the target sheet's data
+        rule_yaml_path: Path to YAML file containing GE expectations
+        rule_config: Already-parsed rule configuration, if the caller has
+            loaded it with load_rule_config; skips re-reading the file
+
+    Returns:
+        ValidationResult with success status and detailed results
+
+    Raises:
+        ImportError: If pandas or great-expectations not available
+        FileNotFoundError: If the YAML file doesn't exist
+        ValueError: If invalid rule format or empty data
+        RuntimeError: If validation execution fails
+    """
+    _check_dependencies()
+
+    rule_yaml_path = Path(rule_yaml_path)
+    if rule_config is None and not rule_yaml_path.exists():
+        raise FileNotFoundError(f"Rule file not found: {rule_yaml_path}")
+
+    try:
+        if rule_config is None:
+            rule_config = load_rule_config(rule_yaml_path)
+        sheet_name = get_target_sheet(rule_config)
+
+        return _validate_dataframe(df, rule_config, rule_yaml_path, sheet_name)
 
     except Exception as e:
         if isinstance(e, (ImportError, FileNotFoundError, ValueError)):
             raise
-        elif isinstance(e, yaml.YAMLError):
-            raise RuntimeError(f"Great Expectations validation failed: {e}") from e
-        else:
-            raise RuntimeError(f"Great Expectations validation failed: {e}") from e
+        raise RuntimeError(f"Great Expectations validation failed: {e}") from e
+
+
+def run_expectations_batch(
+    xlsx_path: Union[str, Path],
+    rule_yaml_paths: List[Union[str, Path]],
+    max_workers: Optional[int] = None,
+) -> List[ValidationResult]:
+    """Run several rule files against the same Excel file in parallel.
+
+    Rule files are independent and validation is CPU-bound, so each one is
+    run by run_expectations in its own worker process. A single rule file
+    (or max_workers=1) is run in-process to avoid the pool start-up cost.
+
+    Args:
+        xlsx_path: Path to Excel file to validate
+        rule_yaml_paths: Paths to YAML files containing GE expectations
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        List of ValidationResult objects, in the order of rule_yaml_paths
+
+    Raises:
+        Same exceptions as run_expectations, for the first failing rule file
+    """
+    rule_yaml_paths = list(rule_yaml_paths)
+    workers = min(max_workers or os.cpu_count() or 1, len(rule_yaml_paths))
+
+    if workers <= 1:
+        return [run_expectations(xlsx_path, path) for path in rule_yaml_paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(run_expectations, repeat(xlsx_path), rule_yaml_paths)
+        )
+
+
+def load_rule_config(rule_yaml_path: Union[str, Path]) -> Dict[str, Any]:
+    """Load and validate a data validation rule file.
+
+    Args:
+        rule_yaml_path: Path to YAML file containing GE expectations
+
+    Returns:
+        Parsed rule configuration dictionary
+
+    Raises:
+        ValueError: If the file is not a data validation rule
+    """
+    with open(rule_yaml_path, "r", encoding="utf-8") as f:
+        rule_config = yaml.load(f, Loader=SafeLoader)
+
+    # Validate rule structure
+    if not isinstance(rule_config, dict):
+        raise ValueError("Rule file must contain a YAML dictionary")
+
+    rule_type = rule_config.get("rule_type")
+    if rule_type != "data_validation":
+        raise ValueError(f"Expected rule_type 'data_validation', got '{rule_type}'")
+
+    if not rule_config.get("expectations", []):
+        raise ValueError("Rule file must contain 'expectations' list")
+
+    return rule_config
+
+
+def get_target_sheet(rule_config: Dict[str, Any]) -> Union[str, int]:
+    """Get the target sheet of a rule configuration.
+
+    Args:
+        rule_config: Parsed rule configuration dictionary
+
+    Returns:
+        Sheet name, or 0 for the first sheet if no target is configured
+    """
+    target_config = rule_config.get("target", {})
+    return target_config.get("sheet", 0)  # Default to first sheet
+
+
+def worksheet_to_dataframe(
+    worksheet: Any,
+    nrows: Optional[int] = None,
+    usecols: Optional[List[str]] = None,
+) -> "pd.DataFrame":
+    """Build a DataFrame from an openpyxl worksheet.
+
+    The result matches what pd.read_excel returns for a saved copy of the
+    workbook: cells are converted like pandas' openpyxl reader does, and the
+    rows go through pandas' own TextParser, so duplicate headers are
+    deduplicated (id, id.1), empty cells become NaN and column dtypes are
+    inferred the same way. Formula cells become NaN, as openpyxl doesn't
+    store computed values when saving.
+
+    Args:
+        worksheet: openpyxl worksheet to convert
+        nrows: Optional number of data rows to read
+        usecols: Optional list of column names to keep
+
+    Returns:
+        DataFrame containing the worksheet's data
+
+    Raises:
+        ValueError: If a column in usecols is not in the worksheet
+    """
+    parent = getattr(worksheet, "parent", None)
+    if getattr(parent, "read_only", False) and (
+        worksheet.max_row is None or worksheet.max_column is None
+    ):
+        # Read-only sheets are sized from the file's <dimension> tag; without
+        # it rows would come back unpadded (or not at all), so size it by scan
+        worksheet.calculate_dimension(force=True)
+
+    max_row = nrows + 1 if nrows is not None else None
+    data: List[List[Any]] = []
+    last_row_with_data = -1
+    for row_number, row in enumerate(worksheet.iter_rows(max_row=max_row)):
+        converted_row = [_convert_cell(cell) for cell in row]
+        while converted_row and converted_row[-1] == "":
+            # Trim trailing empty cells
+            converted_row.pop()
+        if converted_row:
+            last_row_with_data = row_number
+        data.append(converted_row)
+
+    # Trim trailing empty rows
+    data = data[: last_row_with_data + 1]
+    if not data:
+        return pd.DataFrame()
+
+    # Extend rows to the widest row
+    width = max(len(row) for row in data)
+    data = [row + [""] * (width - len(row)) for row in data]
+
+    parser = TextParser(
+        data, header=0, nrows=nrows, usecols=usecols, skip_blank_lines=False
+    )
+    return parser.read(nrows=nrows)
+
+
+def _convert_cell(cell: Any) -> Any:
+    """Convert a worksheet cell as pd.read_excel's openpyxl reader does.
+
+    Args:
+        cell: openpyxl cell
+
+    Returns:
+        Cell value; "" for empty and formula cells, NaN for error cells,
+        int for integral numbers and datetime for dates
+    """
+    if cell.value is None or cell.data_type == "f":
+        return ""
+    if cell.data_type == "e":
+        return float("nan")
+    if cell.data_type == "n":
+        value = int(cell.value)
+        if value == cell.value:
+            return value
+        return float(cell.value)
+    if type(cell.value) is datetime.date:
+        # Saved dates are read back as datetimes
+        return datetime.datetime.combine(cell.value, datetime.time())
+    return cell.value
+
+
+def get_read_options(rule_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the row/column limits of a rule configuration's target.
+
+    ``target.nrows`` limits validation to the first N data rows and
+    ``target.usecols`` to a list of column names, so rules that only touch
+    part of a large sheet don't pay to parse all of it.
+
+    Args:
+        rule_config: Parsed rule configuration dictionary
+
+    Returns:
+        Keyword arguments for pd.read_excel (may be empty)
+    """
+    target_config = rule_config.get("target", {})
+    return {
+        key: target_config[key]
+        for key in ("nrows", "usecols")
+        if target_config.get(key) is not None
+    }
+
+
+def _check_dependencies() -> None:
+    """Raise ImportError if pandas or great-expectations is missing."""
+    if pd is None:
+        raise ImportError("pandas is required for Excel data validation")
+    if ge is None:
+        raise ImportError("great-expectations is required for data validation")
+
+
+def _validate_dataframe(
+    df: "pd.DataFrame",
+    rule_config: Dict[str, Any],
+    rule_yaml_path: Path,
+    sheet_name: Union[str, int],
+) -> ValidationResult:
+    """Run the expectations of a rule configuration against a DataFrame.
+
+    Args:
+        df: DataFrame containing the target sheet's data
+        rule_config: Parsed rule configuration dictionary
+        rule_yaml_path: Path to the rule file (recorded in the result)
+        sheet_name: Target sheet, used in error messages
+
+    Returns:
+        ValidationResult with success status and detailed results
+    """
+    expectations_config = rule_config.get("expectations", [])
+
+    if df.empty:
+        raise ValueError(f"Excel sheet '{sheet_name}' contains no data")
+
+    logger.info(f"Loaded {len(df)} rows, {len(df.columns)} columns")
+
+    # Create Great Expectations context and data source
+    context = ge.get_context()
+    data_source = context.data_sources.add_pandas(name="excel_datasource")
+    data_asset = data_source.add_dataframe_asset(name="excel_dataframe")
+    batch_definition = data_asset.add_batch_definition_whole_dataframe("excel_batch")
+    batch = batch_definition.get_batch(batch_parameters={"dataframe": df})
+    
+    # Build every expectation up front and validate them as one suite; adding
+    # them one by one through a validator evaluates each on the batch as it
+    # is added, on top of the final validation run
+    expectations = []
+    for expectation_config in expectations_config:
+        expectation_type = expectation_config.get("expectation_type")
+        kwargs = expectation_config.get("kwargs", {})
+        meta = expectation_config.get("meta", {})
+
+        if not expectation_type:
+            logger.warning("Skipping expectation without type")
+            continue
+
+        try:
+            expectations.append(
+                ExpectationConfiguration(
+                    type=expectation_type, kwargs=kwargs, meta=meta
+                ).to_domain_obj()
+            )
+            logger.debug(f"Added expectation: {expectation_type}")
+        except Exception as e:
+            logger.error(f"Failed to add expectation {expectation_type}: {e}")
+            continue
+
+    suite = ge.ExpectationSuite(name="excel_suite", expectations=expectations)
+
+    # Run validation
+    logger.info(f"Running {len(expectations)} expectations")
+    validation_result = batch.validate(suite, result_format="BASIC")
+
+    # Process results
+    success = validation_result.success
+    results = validation_result.results
+    statistics = validation_result.statistics
+
+    # Apply success threshold if specified
+    validation_config = rule_config.get("validation", {})
+    success_threshold = validation_config.get("success_threshold")
+
+    if success_threshold is not None:
+        success_rate = statistics.get("successful_expectations", 0) / max(
+            statistics.get("evaluated_expectations", 1), 1
+        )
+        if success_rate < success_threshold:
+            success = False
+            logger.warning(
+                f"Success rate {success_rate:.2%} below threshold "
+                f"{success_threshold:.2%}"
+            )
+
+    logger.info(
+        f"Validation completed: {statistics.get('successful_expectations', 0)}/"
+        f"{statistics.get('evaluated_expectations', 0)} passed"
+    )
+
+    return ValidationResult(
+        success=success,
+        results=results,
+        statistics=statistics,
+        rule_path=str(rule_yaml_path),
+    )
 
 
 def is_ge_supported() -> bool:
@@ -1,11 +1,19 @@
 """Unified reporting module for SheetCheck validation results."""
 
+import importlib
+from typing import Any
+
 from .base import BaseReporter
-from .json_reporter import JSONReporter
-from .xml_reporter import XMLReporter
-from .markdown_reporter import MarkdownReporter
 from .factory import ReporterFactory, create_reporters
 
+# Reporter classes are imported on first access so that using one format
+# doesn't load the others (and their optional encoders)
+_LAZY_REPORTERS = {
+    "JSONReporter": "json_reporter",
+    "XMLReporter": "xml_reporter",
+    "MarkdownReporter": "markdown_reporter",
+}
+
 __all__ = [
     "BaseReporter",
     "JSONReporter", 
@@ -13,4 +21,12 @@ __all__ = [
     "MarkdownReporter",
     "ReporterFactory",
     "create_reporters",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import reporter classes lazily on attribute access."""
+    if name in _LAZY_REPORTERS:
+        module = importlib.import_module(f".{_LAZY_REPORTERS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
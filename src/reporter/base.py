@@ -2,15 +2,24 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, TYPE_CHECKING
+from typing import Any, BinaryIO, Dict, List, Optional, TextIO, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..structural.base import ValidationFailure
 
+# Buffer size for report files, so large reports reach the disk in a few
+# large writes rather than many 8 KiB ones
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class BaseReporter(ABC):
     """Abstract base class for all report generators."""
     
+    # Reporters that render failures from their to_dict() form set this and
+    # implement generate_report_stream_from_dicts, so the dictionaries can be
+    # built once and shared when several formats are written
+    uses_failure_dicts = False
+    
     def __init__(self, output_dir: Path = Path("reports")):
         """Initialize reporter with output directory.
         
@@ -31,6 +40,17 @@ class BaseReporter(ABC):
         """Default filename for this report format."""
         return f"results.{self.file_extension}"
     
+    @property
+    def writes_bytes(self) -> bool:
+        """Whether report files are written in binary mode.
+        
+        Reporters whose serializer produces UTF-8 bytes return True while that
+        serializer is available and implement generate_report_bytes_from_dicts;
+        their files skip the text layer's encode pass and always use "\\n"
+        line endings.
+        """
+        return False
+    
     @abstractmethod
     def generate_report(
         self,
@@ -50,6 +70,77 @@ class BaseReporter(ABC):
         """
         pass
     
+    def generate_report_stream(
+        self,
+        fp: TextIO,
+        structural_failures: List["ValidationFailure"],
+        data_failures: List["ValidationFailure"],
+        visual_failures: List["ValidationFailure"],
+    ) -> None:
+        """Generate report content and write it to an open text file.
+        
+        The default writes the result of generate_report; reporters that can
+        serialize straight to a file override this to avoid building the
+        whole report as one string first.
+        
+        Args:
+            fp: Text file object to write the report to
+            structural_failures: List of structural validation failures
+            data_failures: List of data validation failures
+            visual_failures: List of visual validation failures
+        """
+        fp.write(
+            self.generate_report(structural_failures, data_failures, visual_failures)
+        )
+    
+    def generate_report_stream_from_dicts(
+        self,
+        fp: TextIO,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> None:
+        """Write report content built from failure dictionaries.
+        
+        Only available on reporters with uses_failure_dicts set.
+        
+        Args:
+            fp: Text file object to write the report to
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+            
+        Raises:
+            NotImplementedError: If the reporter renders failure objects
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not render failure dictionaries"
+        )
+    
+    def generate_report_bytes_from_dicts(
+        self,
+        fp: BinaryIO,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> None:
+        """Write UTF-8 report content built from failure dictionaries.
+        
+        Only available on reporters with writes_bytes set.
+        
+        Args:
+            fp: Binary file object to write the report to
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+            
+        Raises:
+            NotImplementedError: If the reporter only writes text
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not write binary reports"
+        )
+    
     def write_to_file(
         self,
         structural_failures: List["ValidationFailure"],
@@ -68,16 +159,53 @@ class BaseReporter(ABC):
         Returns:
             Path to the generated report file
         """
-        report_content = self.generate_report(
-            structural_failures, data_failures, visual_failures
-        )
+        if self.writes_bytes:
+            return self.write_dicts_to_file(
+                [failure.to_dict() for failure in structural_failures],
+                [failure.to_dict() for failure in data_failures],
+                [failure.to_dict() for failure in visual_failures],
+                filename,
+            )
         
-        if filename is None:
-            filename = self.default_filename
+        output_path = self.output_dir / (filename or self.default_filename)
+        
+        with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            self.generate_report_stream(
+                f, structural_failures, data_failures, visual_failures
+            )
+            
+        return output_path
+    
+    def write_dicts_to_file(
+        self,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+        filename: Optional[str] = None,
+    ) -> Path:
+        """Write a report built from failure dictionaries to file.
+        
+        Args:
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+            filename: Optional custom filename
             
-        output_path = self.output_dir / filename
+        Returns:
+            Path to the generated report file
+        """
+        output_path = self.output_dir / (filename or self.default_filename)
+        
+        if self.writes_bytes:
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                self.generate_report_bytes_from_dicts(
+                    f, structural_dicts, data_dicts, visual_dicts
+                )
+            return output_path
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report_content)
+        with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            self.generate_report_stream_from_dicts(
+                f, structural_dicts, data_dicts, visual_dicts
+            )
             
         return output_path
\ No newline at end of file
@@ -1,22 +1,27 @@
 """Reporter factory for creating appropriate reporter instances."""
 
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Type
+from typing import Dict, List, Type, TYPE_CHECKING
 
 from .base import BaseReporter
-from .json_reporter import JSONReporter
-from .xml_reporter import XMLReporter
-from .markdown_reporter import MarkdownReporter
+
+if TYPE_CHECKING:
+    from ..structural.base import ValidationFailure
 
 
 class ReporterFactory:
     """Factory class for creating reporter instances."""
     
-    _REPORTERS: Dict[str, Type[BaseReporter]] = {
-        "json": JSONReporter,
-        "xml": XMLReporter,
-        "md": MarkdownReporter,
-        "markdown": MarkdownReporter,
+    # Reporter classes as "module:ClassName"; modules are only imported
+    # when their format is requested
+    _REPORTERS: Dict[str, str] = {
+        "json": "json_reporter:JSONReporter",
+        "xml": "xml_reporter:XMLReporter",
+        "md": "markdown_reporter:MarkdownReporter",
+        "markdown": "markdown_reporter:MarkdownReporter",
     }
     
     @classmethod
@@ -48,8 +53,67 @@ class ReporterFactory:
             available = ", ".join(cls.get_available_formats())
             raise ValueError(f"Unsupported format '{format_name}'. Available formats: {available}")
         
-        reporter_class = cls._REPORTERS[format_name]
+        reporter_class = _load_reporter_class(cls._REPORTERS[format_name])
         return reporter_class(output_dir)
+    
+    @staticmethod
+    def run_all(
+        reporters: List[BaseReporter],
+        structural_failures: List["ValidationFailure"],
+        data_failures: List["ValidationFailure"],
+        visual_failures: List["ValidationFailure"],
+    ) -> List[Path]:
+        """Write the reports of several reporters for the same failures.
+        
+        Each failure is converted with to_dict() at most once; the resulting
+        dictionaries are shared by every reporter that renders from them.
+        Reporters share no mutable state, so when there are several they
+        write their files concurrently.
+        
+        Args:
+            reporters: Reporters to write reports with
+            structural_failures: List of structural validation failures
+            data_failures: List of data validation failures
+            visual_failures: List of visual validation failures
+            
+        Returns:
+            Paths of the written report files, in the order of reporters
+        """
+        failure_dicts = None
+        if any(reporter.uses_failure_dicts for reporter in reporters):
+            failure_dicts = (
+                [failure.to_dict() for failure in structural_failures],
+                [failure.to_dict() for failure in data_failures],
+                [failure.to_dict() for failure in visual_failures],
+            )
+        
+        def write_report(reporter: BaseReporter) -> Path:
+            if failure_dicts is not None and reporter.uses_failure_dicts:
+                return reporter.write_dicts_to_file(*failure_dicts)
+            return reporter.write_to_file(structural_failures, data_failures, visual_failures)
+        
+        # Reporters writing the same file (e.g. "md,markdown") must not race
+        output_files = {reporter.output_dir / reporter.default_filename for reporter in reporters}
+        if len(reporters) <= 1 or len(output_files) < len(reporters):
+            return [write_report(reporter) for reporter in reporters]
+        
+        with ThreadPoolExecutor(max_workers=len(reporters)) as executor:
+            return list(executor.map(write_report, reporters))
+
+
+@lru_cache(maxsize=None)
+def _load_reporter_class(reporter_path: str) -> Type[BaseReporter]:
+    """Import a reporter class from its "module:ClassName" path.
+    
+    Args:
+        reporter_path: Module (relative to this package) and class name
+        
+    Returns:
+        The reporter class
+    """
+    module_name, class_name = reporter_path.split(":")
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)
 
 
 def create_reporters(format_list: str, output_dir: Path = Path("reports")) -> List[BaseReporter]:
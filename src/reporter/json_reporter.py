@@ -1,22 +1,51 @@
 """JSON format reporter."""
 
 import json
-from typing import List, TYPE_CHECKING
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, TextIO, TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 from .base import BaseReporter
 
 if TYPE_CHECKING:
     from ..structural.base import ValidationFailure
 
+# Reports for runs without failures (the common CI case), prebuilt once
+_EMPTY_RESULT = {"structuralFailures": [], "dataFailures": [], "visualFailures": []}
+_EMPTY_JSON = json.dumps(_EMPTY_RESULT, indent=2)
+_EMPTY_JSON_COMPACT = json.dumps(_EMPTY_RESULT, separators=(",", ":"))
+
 
 class JSONReporter(BaseReporter):
     """Reporter that generates JSON format output."""
     
+    uses_failure_dicts = True
+    
+    def __init__(self, output_dir: Path = Path("reports"), compact: bool = False):
+        """Initialize reporter with output directory.
+        
+        Args:
+            output_dir: Directory to write reports to
+            compact: Write JSON without indentation or spaces, for reports
+                consumed by tools rather than read by people
+        """
+        super().__init__(output_dir)
+        self.compact = compact
+    
     @property
     def file_extension(self) -> str:
         """File extension for JSON reports."""
         return "json"
     
+    @property
+    def writes_bytes(self) -> bool:
+        """Report files are written in binary mode when orjson is installed."""
+        return orjson is not None
+    
     def generate_report(
         self,
         structural_failures: List["ValidationFailure"],
@@ -33,10 +62,148 @@ class JSONReporter(BaseReporter):
         Returns:
             JSON report content as string
         """
-        result = {
-            "structuralFailures": [failure.to_dict() for failure in structural_failures],
-            "dataFailures": [failure.to_dict() for failure in data_failures],
-            "visualFailures": [failure.to_dict() for failure in visual_failures],
-        }
+        return self.generate_report_from_dicts(
+            [failure.to_dict() for failure in structural_failures],
+            [failure.to_dict() for failure in data_failures],
+            [failure.to_dict() for failure in visual_failures],
+        )
+    
+    def generate_report_from_dicts(
+        self,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> str:
+        """Generate JSON report content from failure dictionaries.
+        
+        Args:
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+            
+        Returns:
+            JSON report content as string
+        """
+        if not (structural_dicts or data_dicts or visual_dicts):
+            return _EMPTY_JSON_COMPACT if self.compact else _EMPTY_JSON
         
-        return json.dumps(result, indent=2)
\ No newline at end of file
+        result = self._build_result(structural_dicts, data_dicts, visual_dicts)
+        
+        if orjson is not None:
+            return self._encode_orjson(result).decode("utf-8")
+        if self.compact:
+            return json.dumps(result, separators=(",", ":"))
+        return json.dumps(result, indent=2)
+    
+    def generate_report_stream(
+        self,
+        fp: TextIO,
+        structural_failures: List["ValidationFailure"],
+        data_failures: List["ValidationFailure"],
+        visual_failures: List["ValidationFailure"],
+    ) -> None:
+        """Generate JSON report content and write it to an open text file.
+        
+        Args:
+            fp: Text file object to write the report to
+            structural_failures: List of structural validation failures
+            data_failures: List of data validation failures
+            visual_failures: List of visual validation failures
+        """
+        self.generate_report_stream_from_dicts(
+            fp,
+            [failure.to_dict() for failure in structural_failures],
+            [failure.to_dict() for failure in data_failures],
+            [failure.to_dict() for failure in visual_failures],
+        )
+    
+    def generate_report_stream_from_dicts(
+        self,
+        fp: TextIO,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> None:
+        """Write JSON report content built from failure dictionaries.
+        
+        Args:
+            fp: Text file object to write the report to
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+        """
+        if not (structural_dicts or data_dicts or visual_dicts):
+            fp.write(_EMPTY_JSON_COMPACT if self.compact else _EMPTY_JSON)
+            return
+        
+        result = self._build_result(structural_dicts, data_dicts, visual_dicts)
+        
+        if orjson is None:
+            if self.compact:
+                json.dump(result, fp, separators=(",", ":"))
+            else:
+                json.dump(result, fp, indent=2)
+            return
+        
+        # Written through the text layer so newline translation matches the
+        # json.dump fallback on every platform
+        fp.write(self._encode_orjson(result).decode("utf-8"))
+    
+    def generate_report_bytes_from_dicts(
+        self,
+        fp: BinaryIO,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> None:
+        """Write the orjson-encoded report to an open binary file.
+        
+        Args:
+            fp: Binary file object to write the report to
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+        """
+        if not (structural_dicts or data_dicts or visual_dicts):
+            fp.write((_EMPTY_JSON_COMPACT if self.compact else _EMPTY_JSON).encode("utf-8"))
+            return
+        
+        result = self._build_result(structural_dicts, data_dicts, visual_dicts)
+        fp.write(self._encode_orjson(result))
+    
+    def _encode_orjson(self, result: Dict[str, Any]) -> bytes:
+        """Encode a report document with orjson.
+        
+        Args:
+            result: Report document built by _build_result
+            
+        Returns:
+            UTF-8 encoded JSON, indented unless compact output was requested
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if not self.compact:
+            option |= orjson.OPT_INDENT_2
+        # C encoder; several times faster than json.dumps on large reports
+        return orjson.dumps(result, option=option)
+    
+    def _build_result(
+        self,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the JSON report document.
+        
+        Args:
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+            
+        Returns:
+            Dictionary with one list of failure dictionaries per category
+        """
+        return {
+            "structuralFailures": structural_dicts,
+            "dataFailures": data_dicts,
+            "visualFailures": visual_dicts,
+        }
@@ -1,21 +1,25 @@
 """Markdown format reporter."""
 
-from typing import List, TYPE_CHECKING
+import io
+from typing import Callable, List, TextIO, TYPE_CHECKING
 
 from .base import BaseReporter
 
 if TYPE_CHECKING:
     from ..structural.base import ValidationFailure
 
+# Report for runs without failures (the common CI case)
+_EMPTY_REPORT = "# SheetCheck Validation Report\n\n✅ **All validations passed!**\n"
+
 
 class MarkdownReporter(BaseReporter):
     """Reporter that generates human-readable Markdown format output."""
-    
+
     @property
     def file_extension(self) -> str:
         """File extension for Markdown reports."""
         return "md"
-    
+
     def generate_report(
         self,
         structural_failures: List["ValidationFailure"],
@@ -23,105 +27,134 @@ class MarkdownReporter(BaseReporter):
         visual_failures: List["ValidationFailure"],
     ) -> str:
         """Generate Markdown report content.
-        
+
         Args:
             structural_failures: List of structural validation failures
             data_failures: List of data validation failures
             visual_failures: List of visual validation failures
-            
+
         Returns:
             Markdown report content as string
         """
-        report_lines = []
-        
-        # Title and summary
+        buf = io.StringIO()
+        self._write_report(buf.write, structural_failures, data_failures, visual_failures)
+        return buf.getvalue()
+
+    def generate_report_stream(
+        self,
+        fp: TextIO,
+        structural_failures: List["ValidationFailure"],
+        data_failures: List["ValidationFailure"],
+        visual_failures: List["ValidationFailure"],
+    ) -> None:
+        """Generate Markdown report content and write it to an open text file.
+
+        Args:
+            fp: Text file object to write the report to
+            structural_failures: List of structural validation failures
+            data_failures: List of data validation failures
+            visual_failures: List of visual validation failures
+        """
+        self._write_report(fp.write, structural_failures, data_failures, visual_failures)
+
+    def _write_report(
+        self,
+        w: Callable[[str], object],
+        structural_failures: List["ValidationFailure"],
+        data_failures: List["ValidationFailure"],
+        visual_failures: List["ValidationFailure"],
+    ) -> None:
+        """Write the Markdown report through a write callable.
+
+        Every line is written with its newline; blank separator lines are
+        written before each block so the report ends with a single newline.
+
+        Args:
+            w: Write function of the output buffer or file
+            structural_failures: List of structural validation failures
+            data_failures: List of data validation failures
+            visual_failures: List of visual validation failures
+        """
         total_failures = len(structural_failures) + len(data_failures) + len(visual_failures)
-        report_lines.append("# SheetCheck Validation Report")
-        report_lines.append("")
-        
         if total_failures == 0:
-            report_lines.append("✅ **All validations passed!**")
-            report_lines.append("")
-        else:
-            report_lines.append(f"❌ **{total_failures} validation failure(s) found**")
-            report_lines.append("")
-            
-            # Summary table
-            report_lines.append("## Summary")
-            report_lines.append("")
-            report_lines.append("| Category | Failures |")
-            report_lines.append("|----------|----------|")
-            report_lines.append(f"| Structural | {len(structural_failures)} |")
-            report_lines.append(f"| Data | {len(data_failures)} |")
-            report_lines.append(f"| Visual | {len(visual_failures)} |")
-            report_lines.append(f"| **Total** | **{total_failures}** |")
-            report_lines.append("")
-        
+            w(_EMPTY_REPORT)
+            return
+
+        # Title and summary
+        w("# SheetCheck Validation Report\n")
+        w("\n")
+        w(f"❌ **{total_failures} validation failure(s) found**\n")
+        w("\n")
+
+        # Summary table
+        w("## Summary\n")
+        w("\n")
+        w("| Category | Failures |\n")
+        w("|----------|----------|\n")
+        w(f"| Structural | {len(structural_failures)} |\n")
+        w(f"| Data | {len(data_failures)} |\n")
+        w(f"| Visual | {len(visual_failures)} |\n")
+        w(f"| **Total** | **{total_failures}** |\n")
+
         # Structural failures section
         if structural_failures:
-            report_lines.append("## Structural Failures")
-            report_lines.append("")
+            w("\n")
+            w("## Structural Failures\n")
             for i, failure in enumerate(structural_failures, 1):
-                report_lines.extend(self._format_failure(i, failure))
-                report_lines.append("")
-        
+                w("\n")
+                self._format_failure(w, i, failure)
+
         # Data failures section
         if data_failures:
-            report_lines.append("## Data Validation Failures")
-            report_lines.append("")
+            w("\n")
+            w("## Data Validation Failures\n")
             for i, failure in enumerate(data_failures, 1):
-                report_lines.extend(self._format_failure(i, failure))
-                report_lines.append("")
-        
+                w("\n")
+                self._format_failure(w, i, failure)
+
         # Visual failures section
         if visual_failures:
-            report_lines.append("## Visual Validation Failures")
-            report_lines.append("")
+            w("\n")
+            w("## Visual Validation Failures\n")
             for i, failure in enumerate(visual_failures, 1):
-                report_lines.extend(self._format_failure(i, failure))
-                report_lines.append("")
-        
-        return "\n".join(report_lines)
-    
-    def _format_failure(self, index: int, failure: "ValidationFailure") -> List[str]:
-        """Format a single failure for Markdown output.
-        
+                w("\n")
+                self._format_failure(w, i, failure)
+
+    def _format_failure(
+        self, w: Callable[[str], object], index: int, failure: "ValidationFailure"
+    ) -> None:
+        """Write a single failure in Markdown format.
+
         Args:
+            w: Write function of the output buffer or file
             index: Failure index number
             failure: ValidationFailure to format
-            
-        Returns:
-            List of formatted lines for this failure
         """
-        lines = []
-        lines.append(f"### {index}. {failure.type}")
-        lines.append("")
-        
+        w(f"### {index}. {failure.type}\n")
+        w("\n")
+
         # Add failure details
-        if hasattr(failure, 'message') and failure.message:
-            lines.append(f"**Message:** {failure.message}")
-            lines.append("")
-            
-        if hasattr(failure, 'sheet') and failure.sheet:
-            lines.append(f"**Sheet:** {failure.sheet}")
-            
-        if hasattr(failure, 'cell') and failure.cell:
-            lines.append(f"**Cell:** {failure.cell}")
-            
-        if hasattr(failure, 'range') and failure.range:
-            lines.append(f"**Range:** {failure.range}")
-            
-        if hasattr(failure, 'object') and failure.object:
-            lines.append(f"**Object:** {failure.object}")
-            
-        if hasattr(failure, 'expected') and failure.expected:
-            lines.append(f"**Expected:** `{failure.expected}`")
-            
-        if hasattr(failure, 'found'):
-            lines.append(f"**Found:** `{failure.found}`")
-            
-        if hasattr(failure, 'fix_hint') and failure.fix_hint:
-            lines.append("")
-            lines.append(f"💡 **Fix hint:** {failure.fix_hint}")
-        
-        return lines
\ No newline at end of file
+        if failure.message:
+            w(f"**Message:** {failure.message}\n")
+            w("\n")
+
+        if failure.sheet:
+            w(f"**Sheet:** {failure.sheet}\n")
+
+        if failure.cell:
+            w(f"**Cell:** {failure.cell}\n")
+
+        if failure.range:
+            w(f"**Range:** {failure.range}\n")
+
+        if failure.object:
+            w(f"**Object:** {failure.object}\n")
+
+        if failure.expected:
+            w(f"**Expected:** `{failure.expected}`\n")
+
+        w(f"**Found:** `{failure.found}`\n")
+
+        if failure.fix_hint:
+            w("\n")
+            w(f"💡 **Fix hint:** {failure.fix_hint}\n")
@@ -1,22 +1,74 @@
 """XML format reporter."""
 
-import xml.etree.ElementTree as ET
-from typing import List, TYPE_CHECKING
+import io
+import re
+from typing import Any, BinaryIO, Callable, Dict, List, TextIO, Tuple, TYPE_CHECKING
+from xml.sax.saxutils import escape
+
+try:
+    # C serializer with built-in pretty printing
+    from lxml import etree as ET
+
+    HAS_LXML = True
+except ImportError:
+    ET = None  # type: ignore
+
+    HAS_LXML = False
 
 from .base import BaseReporter
 
 if TYPE_CHECKING:
     from ..structural.base import ValidationFailure
 
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+# Section element names, in document order
+_SECTIONS = ("StructuralFailures", "DataFailures", "VisualFailures")
+
+# Attribute value escapes matching ElementTree/lxml (besides &, < and >)
+_ATTRIBUTE_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#09;"}
+
+# Characters XML 1.0 does not allow (control characters other than tab,
+# newline and carriage return, surrogates, U+FFFE and U+FFFF)
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+# Report for runs without failures (the common CI case), prebuilt once
+_EMPTY_REPORT = (
+    "<ValidationResults>\n"
+    + "".join(f"  <{section_name} />\n" for section_name in _SECTIONS)
+    + "</ValidationResults>"
+)
+
+
+def _xml_text(text: str) -> str:
+    """Replace characters XML does not allow with their backslash escape.
+
+    Args:
+        text: Attribute value or element text
+
+    Returns:
+        Text that can be written to an XML document
+    """
+    return _INVALID_XML_CHARS.sub(
+        lambda match: match.group().encode("unicode_escape").decode("ascii"), text
+    )
+
 
 class XMLReporter(BaseReporter):
     """Reporter that generates XML format output."""
-    
+
+    uses_failure_dicts = True
+
     @property
     def file_extension(self) -> str:
         """File extension for XML reports."""
         return "xml"
-    
+
+    @property
+    def writes_bytes(self) -> bool:
+        """Report files are written in binary mode when lxml is installed."""
+        return HAS_LXML
+
     def generate_report(
         self,
         structural_failures: List["ValidationFailure"],
@@ -24,53 +76,214 @@ class XMLReporter(BaseReporter):
         visual_failures: List["ValidationFailure"],
     ) -> str:
         """Generate XML report content.
-        
+
         Args:
             structural_failures: List of structural validation failures
             data_failures: List of data validation failures
             visual_failures: List of visual validation failures
-            
+
         Returns:
             XML report content as string
         """
-        root = ET.Element("ValidationResults")
-        
-        # Add structural failures
-        structural_elem = ET.SubElement(root, "StructuralFailures")
-        for failure in structural_failures:
-            self._add_failure_element(structural_elem, failure)
-            
-        # Add data failures
-        data_elem = ET.SubElement(root, "DataFailures")
-        for failure in data_failures:
-            self._add_failure_element(data_elem, failure)
-            
-        # Add visual failures
-        visual_elem = ET.SubElement(root, "VisualFailures")
-        for failure in visual_failures:
-            self._add_failure_element(visual_elem, failure)
-        
-        # Convert to string with proper formatting
-        ET.indent(root, space="  ", level=0)
-        return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(
-            root, encoding="unicode"
+        buf = io.StringIO()
+        self.generate_report_stream(buf, structural_failures, data_failures, visual_failures)
+        return buf.getvalue()
+
+    def generate_report_stream(
+        self,
+        fp: TextIO,
+        structural_failures: List["ValidationFailure"],
+        data_failures: List["ValidationFailure"],
+        visual_failures: List["ValidationFailure"],
+    ) -> None:
+        """Generate XML report content and write it to an open text file.
+
+        Args:
+            fp: Text file object to write the report to
+            structural_failures: List of structural validation failures
+            data_failures: List of data validation failures
+            visual_failures: List of visual validation failures
+        """
+        self.generate_report_stream_from_dicts(
+            fp,
+            [failure.to_dict() for failure in structural_failures],
+            [failure.to_dict() for failure in data_failures],
+            [failure.to_dict() for failure in visual_failures],
         )
-    
-    def _add_failure_element(self, parent: ET.Element, failure: "ValidationFailure") -> None:
+
+    def generate_report_stream_from_dicts(
+        self,
+        fp: TextIO,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> None:
+        """Write XML report content built from failure dictionaries.
+
+        Args:
+            fp: Text file object to write the report to
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+        """
+        fp.write(XML_DECLARATION)
+        if not (structural_dicts or data_dicts or visual_dicts):
+            fp.write(_EMPTY_REPORT)
+        elif HAS_LXML:
+            root = self._build_tree(structural_dicts, data_dicts, visual_dicts)
+            fp.write(self._serialize_tree(root).decode("utf-8"))
+        else:
+            self._write_xml(fp.write, structural_dicts, data_dicts, visual_dicts)
+
+    def generate_report_bytes_from_dicts(
+        self,
+        fp: BinaryIO,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> None:
+        """Write the lxml-serialized report to an open binary file.
+
+        Args:
+            fp: Binary file object to write the report to
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+        """
+        fp.write(XML_DECLARATION.encode("utf-8"))
+        if not (structural_dicts or data_dicts or visual_dicts):
+            fp.write(_EMPTY_REPORT.encode("utf-8"))
+            return
+
+        root = self._build_tree(structural_dicts, data_dicts, visual_dicts)
+        fp.write(self._serialize_tree(root))
+
+    def _build_tree(
+        self,
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> "ET._Element":
+        """Build the lxml report tree.
+
+        Args:
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+
+        Returns:
+            Root ValidationResults element
+        """
+        root = ET.Element("ValidationResults")
+        sections = (structural_dicts, data_dicts, visual_dicts)
+
+        for section_name, failure_dicts in zip(_SECTIONS, sections):
+            section_elem = ET.SubElement(root, section_name)
+            for failure_dict in failure_dicts:
+                self._add_failure_element(section_elem, failure_dict)
+
+        return root
+
+    def _serialize_tree(self, root: "ET._Element") -> bytes:
+        """Serialize the lxml report tree in the format of _write_xml.
+
+        lxml writes empty elements as <X/>, tabs in attribute values as &#9;
+        and ends the document with a newline, where ElementTree (and so
+        _write_xml and _EMPTY_REPORT) write <X />, &#09; and no final newline.
+        Escaped values cannot contain "/>" or "&#9;", so both are rewritten
+        with plain replacements.
+
+        Args:
+            root: Root ValidationResults element
+
+        Returns:
+            UTF-8 encoded, indented report document without the XML declaration
+        """
+        xml = ET.tostring(root, encoding="UTF-8", pretty_print=True)
+        return xml.replace(b"/>", b" />").replace(b"&#9;", b"&#09;").rstrip(b"\n")
+
+    def _add_failure_element(self, parent: "ET._Element", failure_dict: Dict[str, Any]) -> None:
         """Add a failure element to the parent XML element.
-        
+
         Args:
             parent: Parent XML element
-            failure: ValidationFailure to add
+            failure_dict: ValidationFailure converted with to_dict
         """
-        failure_elem = ET.SubElement(parent, "Failure")
-        failure_dict = failure.to_dict()
-        
+        attributes, children = self._split_fields(failure_dict)
+        failure_elem = ET.SubElement(parent, "Failure", attributes)
+
+        for key, value in children:
+            ET.SubElement(failure_elem, key).text = value
+
+    def _split_fields(self, failure_dict: Dict[str, Any]) -> Tuple[Dict[str, str], List[Tuple[str, str]]]:
+        """Split failure fields into Failure attributes and child elements.
+
+        Scalar fields are short (cell="B2", type="formula_mismatch"), so they
+        are written as attributes; nested dictionaries (e.g. the expected
+        type/colors of a CF rule) stay child elements holding their string
+        form. Empty strings are skipped, None is kept as "None". Characters
+        XML does not allow (e.g. a "\\x0b" read from a cell) are written as
+        their backslash escape.
+
+        Args:
+            failure_dict: ValidationFailure converted with to_dict
+
+        Returns:
+            Tuple of (attribute dict, list of (child name, text) pairs)
+        """
+        attributes: Dict[str, str] = {}
+        children: List[Tuple[str, str]] = []
+
         for key, value in failure_dict.items():
-            if value != "":  # Allow None values but skip empty strings
-                elem = ET.SubElement(failure_elem, key)
-                if isinstance(value, dict):
-                    # Handle nested dictionaries by converting to string
-                    elem.text = str(value)
-                else:
-                    elem.text = str(value)
\ No newline at end of file
+            if isinstance(value, dict):
+                children.append((key, _xml_text(str(value))))
+            elif value != "":
+                attributes[key] = _xml_text(str(value))
+
+        return attributes, children
+
+    def _write_xml(
+        self,
+        w: Callable[[str], object],
+        structural_dicts: List[Dict[str, Any]],
+        data_dicts: List[Dict[str, Any]],
+        visual_dicts: List[Dict[str, Any]],
+    ) -> None:
+        """Write the indented report document without building a tree.
+
+        Used when lxml is unavailable. The document is shallow and fixed
+        (root, three sections, failures with their fields), so it is emitted
+        in a single pass instead of building an ElementTree and indenting it.
+
+        Args:
+            w: Write function of the output buffer or file
+            structural_dicts: Structural failures converted with to_dict
+            data_dicts: Data validation failures converted with to_dict
+            visual_dicts: Visual validation failures converted with to_dict
+        """
+        sections = (structural_dicts, data_dicts, visual_dicts)
+        w("<ValidationResults>\n")
+
+        for section_name, failure_dicts in zip(_SECTIONS, sections):
+            if not failure_dicts:
+                w(f"  <{section_name} />\n")
+                continue
+
+            w(f"  <{section_name}>\n")
+            for failure_dict in failure_dicts:
+                attributes, children = self._split_fields(failure_dict)
+                attribute_text = "".join(
+                    f' {key}="{escape(value, _ATTRIBUTE_ENTITIES)}"'
+                    for key, value in attributes.items()
+                )
+                if not children:
+                    w(f"    <Failure{attribute_text} />\n")
+                    continue
+
+                w(f"    <Failure{attribute_text}>\n")
+                for key, text in children:
+                    w(f"      <{key}>{escape(text)}</{key}>\n")
+                w("    </Failure>\n")
+            w(f"  </{section_name}>\n")
+
+        w("</ValidationResults>")
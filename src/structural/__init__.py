@@ -5,7 +5,7 @@ from typing import Dict, Type
 from .base import Rule
 from .conditional import ConditionalFormattingRule
 from .formula import CellFormulaRule
-from .object_pos import ObjectPositionRule
+from .object_pos import ObjectPositionRule, run_object_position_rules
 from .sheet_exists import SheetExistsRule
 
 
@@ -1,13 +1,25 @@
 """Base classes for structural validation rules."""
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Union
 
 from openpyxl import Workbook
 
+# Large diffs create one failure per changed cell; use __slots__ where the
+# dataclass decorator supports it (Python 3.10+) to avoid a per-instance dict
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Intern exact str values, returning anything else unchanged."""
+    if value.__class__ is str:
+        return sys.intern(value)
+    return value
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationFailure:
     """Represents a validation failure."""
 
@@ -21,6 +33,21 @@ class ValidationFailure:
     range: str = ""
     object: str = ""
     tolerance: Optional[int] = None
+    # Data validation (Great Expectations) details
+    expectation: Optional[str] = None
+    column: Optional[str] = None
+    unexpected_count: Optional[int] = None
+    observed_value: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Intern the type, sheet and object names.
+
+        Large runs create many failures sharing a few of these strings;
+        interning lets them share one object and compare by identity.
+        """
+        self.type = _intern(self.type)
+        self.sheet = _intern(self.sheet)
+        self.object = _intern(self.object)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format for JSON output."""
@@ -51,17 +78,15 @@ class ValidationFailure:
         if self.tolerance is not None:
             result["tolerance"] = self.tolerance
 
-        # Include any additional custom attributes for data validation
-        for attr_name in [
-            "expectation",
-            "column",
-            "unexpected_count",
-            "observed_value",
-        ]:
-            if hasattr(self, attr_name):
-                attr_value = getattr(self, attr_name)
-                if attr_value is not None:
-                    result[attr_name] = attr_value
+        # Include data validation details if set
+        if self.expectation is not None:
+            result["expectation"] = self.expectation
+        if self.column is not None:
+            result["column"] = self.column
+        if self.unexpected_count is not None:
+            result["unexpected_count"] = self.unexpected_count
+        if self.observed_value is not None:
+            result["observed_value"] = self.observed_value
 
         return result
 
@@ -1,13 +1,40 @@
 """Conditional formatting validation rule."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from openpyxl import Workbook
+from openpyxl.formatting.formatting import ConditionalFormatting
+from openpyxl.worksheet.cell_range import MultiCellRange
 from openpyxl.worksheet.worksheet import Worksheet
 
 from .base import Rule, ValidationFailure
 
 
+@lru_cache(maxsize=256)
+def _normalize_color(color: str) -> str:
+    """Normalize color to consistent format for comparison.
+
+    Workbooks reuse a small palette, so results are memoized.
+
+    Args:
+        color: Color string (hex with or without # or ARGB prefix)
+
+    Returns:
+        Normalized color string (uppercase hex without prefixes)
+    """
+    # Remove # if present
+    if color.startswith("#"):
+        color = color[1:]
+
+    # Remove ARGB prefix (00) if present (Excel adds this)
+    if len(color) == 8 and color.startswith("00"):
+        color = color[2:]
+
+    # Convert to uppercase for consistent comparison
+    return color.upper()
+
+
 class ConditionalFormattingRule(Rule):
     """Rule to validate that expected conditional formatting rules exist."""
 
@@ -34,21 +61,45 @@ class ConditionalFormattingRule(Rule):
                 return failures
 
             sheet = workbook[self.sheet_name]
+            cf_by_range = self._index_cf_by_range(sheet)
 
             # Validate each expected CF rule
             for expected_cf_rule in self.sheet_config.expect_cf_rules:
-                failures.extend(self._validate_cf_rule(sheet, expected_cf_rule))
+                failures.extend(
+                    self._validate_cf_rule(sheet, expected_cf_rule, cf_by_range)
+                )
 
         return failures
 
+    def _index_cf_by_range(
+        self, sheet: Worksheet
+    ) -> Dict[MultiCellRange, List[ConditionalFormatting]]:
+        """Group a sheet's conditional formatting sets by their range.
+
+        Args:
+            sheet: The worksheet object
+
+        Returns:
+            Dict mapping each range to the CF sets applied to it
+        """
+        cf_by_range: Dict[MultiCellRange, List[ConditionalFormatting]] = {}
+        for cf_set in sheet.conditional_formatting:
+            cf_by_range.setdefault(cf_set.sqref, []).append(cf_set)
+        return cf_by_range
+
     def _validate_cf_rule(
-        self, sheet: Worksheet, expected_cf_rule: Dict[str, Any]
+        self,
+        sheet: Worksheet,
+        expected_cf_rule: Dict[str, Any],
+        cf_by_range: Optional[Dict[MultiCellRange, List[ConditionalFormatting]]] = None,
     ) -> List[ValidationFailure]:
         """Validate a specific conditional formatting rule.
 
         Args:
             sheet: The worksheet object
             expected_cf_rule: Expected CF rule configuration from YAML
+            cf_by_range: CF sets grouped by range (see _index_cf_by_range);
+                built from the sheet if not given
 
         Returns:
             List of validation failures for this CF rule
@@ -61,7 +112,7 @@ class ConditionalFormattingRule(Rule):
 
         # Find matching CF rule in the worksheet
         found_cf_rule = self._find_matching_cf_rule(
-            sheet, expected_range, expected_type, expected_colors
+            sheet, expected_range, expected_type, expected_colors, cf_by_range
         )
 
         if found_cf_rule is None:
@@ -87,6 +138,7 @@ class ConditionalFormattingRule(Rule):
         expected_range: str,
         expected_type: str,
         expected_colors: List[str],
+        cf_by_range: Optional[Dict[MultiCellRange, List[ConditionalFormatting]]] = None,
     ) -> Optional[Dict[str, Any]]:
         """Find a conditional formatting rule that matches the expected criteria.
 
@@ -95,30 +147,38 @@ class ConditionalFormattingRule(Rule):
             expected_range: Expected range (e.g., "C2:C50")
             expected_type: Expected rule type (e.g., "colorScale")
             expected_colors: Expected colors list
+            cf_by_range: CF sets grouped by range (see _index_cf_by_range);
+                built from the sheet if not given
 
         Returns:
             Dict describing the found rule, or None if not found
         """
         # Normalize expected colors
-        normalized_expected_colors = [
-            self._normalize_color(color) for color in expected_colors
-        ]
+        normalized_expected_colors = tuple(
+            _normalize_color(color) for color in expected_colors
+        )
 
-        # Iterate through all conditional formatting sets
-        for cf_set in sheet.conditional_formatting:
-            # Check if range matches
-            if cf_set.sqref != expected_range:
-                continue
+        if cf_by_range is None:
+            cf_by_range = self._index_cf_by_range(sheet)
+
+        # Look up the CF sets of the expected range; ranges hash by their
+        # normalized form, so this matches like comparing sqref to the range
+        try:
+            range_key = MultiCellRange(expected_range)
+        except (TypeError, ValueError):
+            return None
 
+        for cf_set in cf_by_range.get(range_key, []):
             # Check each rule in this CF set
             for rule in cf_set.cfRule:
                 if rule.type == expected_type:
                     if expected_type == "colorScale" and rule.colorScale:
                         # Extract colors from the color scale
-                        found_colors = []
-                        for color in rule.colorScale.color:
-                            if color.rgb:
-                                found_colors.append(self._normalize_color(color.rgb))
+                        found_colors = tuple(
+                            _normalize_color(color.rgb)
+                            for color in rule.colorScale.color
+                            if color.rgb
+                        )
 
                         # Compare colors
                         if found_colors == normalized_expected_colors:
@@ -142,16 +202,7 @@ class ConditionalFormattingRule(Rule):
         Returns:
             Normalized color string (uppercase hex without prefixes)
         """
-        # Remove # if present
-        if color.startswith("#"):
-            color = color[1:]
-
-        # Remove ARGB prefix (00) if present (Excel adds this)
-        if len(color) == 8 and color.startswith("00"):
-            color = color[2:]
-
-        # Convert to uppercase for consistent comparison
-        return color.upper()
+        return _normalize_color(color)
 
     def _denormalize_color(self, color: str) -> str:
         """Convert normalized color back to standard hex format.
@@ -1,12 +1,17 @@
 """Cell formula validation rule."""
 
-from typing import List
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from openpyxl import Workbook
+from openpyxl.utils.cell import coordinate_to_tuple
 from openpyxl.worksheet.worksheet import Worksheet
 
 from .base import Rule, ValidationFailure
 
+# Runs of whitespace inside a formula, collapsed to a single space
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class CellFormulaRule(Rule):
     """Rule to validate that cell formulas match expected values."""
@@ -31,21 +36,75 @@ class CellFormulaRule(Rule):
                 return failures
 
             sheet = workbook[self.sheet_name]
+            expected_formulas = {
+                cell_address: cell_config["formula"]
+                for cell_address, cell_config in self.sheet_config.cells.items()
+                if isinstance(cell_config, dict) and "formula" in cell_config
+            }
+            cells = self._prefetch_cells(sheet, expected_formulas)
 
             # Validate each cell configuration
-            for cell_address, cell_config in self.sheet_config.cells.items():
-                if isinstance(cell_config, dict) and "formula" in cell_config:
-                    expected_formula = cell_config["formula"]
-                    failures.extend(
-                        self._validate_cell_formula(
-                            sheet, cell_address, expected_formula
-                        )
+            for cell_address, expected_formula in expected_formulas.items():
+                failures.extend(
+                    self._validate_cell_formula(
+                        sheet, cell_address, expected_formula, cells.get(cell_address)
                     )
+                )
 
         return failures
 
+    def _prefetch_cells(self, sheet: Worksheet, cell_addresses: Iterable[str]) -> Dict[str, Any]:
+        """Read the given cells of a read-only worksheet in one pass.
+
+        Read-only worksheets stream the sheet XML on every cell lookup, so
+        looking up N cells individually parses the sheet N times. Instead the
+        rows spanning the requested cells are read once. Regular worksheets
+        keep their cells in memory and are not prefetched.
+
+        Args:
+            sheet: The worksheet object
+            cell_addresses: Cell addresses (e.g., "B2") to read
+
+        Returns:
+            Dictionary mapping cell addresses to cells; addresses that are not
+            single cell coordinates are left out
+        """
+        if not getattr(sheet.parent, "read_only", False):
+            return {}
+
+        positions: Dict[str, Tuple[int, int]] = {}
+        for cell_address in cell_addresses:
+            try:
+                positions[cell_address] = coordinate_to_tuple(cell_address)
+            except (TypeError, ValueError):
+                continue
+        if not positions:
+            return {}
+
+        min_row = min(row for row, _ in positions.values())
+        max_row = max(row for row, _ in positions.values())
+        min_col = min(col for _, col in positions.values())
+        max_col = max(col for _, col in positions.values())
+
+        rows = list(
+            sheet.iter_rows(
+                min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+            )
+        )
+        cells: Dict[str, Any] = {}
+        for cell_address, (row, col) in positions.items():
+            row_index = row - min_row
+            col_index = col - min_col
+            if row_index < len(rows) and col_index < len(rows[row_index]):
+                cells[cell_address] = rows[row_index][col_index]
+        return cells
+
     def _validate_cell_formula(
-        self, sheet: Worksheet, cell_address: str, expected_formula: str
+        self,
+        sheet: Worksheet,
+        cell_address: str,
+        expected_formula: str,
+        cell: Optional[Any] = None,
     ) -> List[ValidationFailure]:
         """Validate a specific cell's formula.
 
@@ -53,6 +112,8 @@ class CellFormulaRule(Rule):
             sheet: The worksheet object
             cell_address: Cell address (e.g., "B2")
             expected_formula: Expected formula string
+            cell: The cell, if already read (see _prefetch_cells); looked up
+                on the sheet otherwise
 
         Returns:
             List of validation failures for this cell
@@ -60,7 +121,8 @@ class CellFormulaRule(Rule):
         failures: List[ValidationFailure] = []
 
         try:
-            cell = sheet[cell_address]
+            if cell is None:
+                cell = sheet[cell_address]
             actual_value = cell.value
 
             # Normalize expected formula for comparison
@@ -119,15 +181,6 @@ class CellFormulaRule(Rule):
         if not formula:
             return ""
 
-        # Remove leading/trailing whitespace and convert to lowercase
-        normalized = formula.strip().lower()
-
-        # Normalize sheet reference format (Excel uses \! but YAML might use !)
-        normalized = normalized.replace("\\!", "!")
-
-        # Remove extra whitespace inside the formula
-        # Split by spaces and rejoin with single spaces
-        parts = normalized.split()
-        normalized = " ".join(parts)
-
-        return normalized
+        # Trim and lowercase, normalize sheet references (Excel uses \! but
+        # YAML might use !) and collapse inner whitespace in one regex pass
+        return _WHITESPACE_RE.sub(" ", formula.strip().lower().replace("\\!", "!"))
@@ -1,7 +1,11 @@
 """Object position validation rule."""
 
+import atexit
 import math
-from typing import Any, Dict, List, Optional
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 from openpyxl import Workbook
 
@@ -12,74 +16,88 @@ try:
 except ImportError:
     xw = None
 
+# Excel instance shared by all object checks in this process; starting Excel
+# takes seconds, so it is started on first use and quit at interpreter exit
+_shared_app: Optional[Any] = None
+
+
+def _get_shared_app() -> Any:
+    """Get the shared hidden Excel instance, starting it on first use.
+
+    Returns:
+        The xlwings App
+    """
+    global _shared_app
+    if _shared_app is None:
+        _shared_app = xw.App(visible=False, add_book=False)
+    return _shared_app
+
+
+def _quit_shared_app() -> None:
+    """Quit the shared Excel instance, if one was started."""
+    global _shared_app
+    app, _shared_app = _shared_app, None
+    if app is not None:
+        try:
+            app.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_quit_shared_app)
+
 
 class ObjectPositionRule(Rule):
     """Rule to validate Excel objects positioned within expected coordinates."""
 
-    def run(self, workbook: Workbook) -> List[ValidationFailure]:
+    def run(
+        self, workbook: Workbook, source_path: Optional[Union[str, Path]] = None
+    ) -> List[ValidationFailure]:
         """Check if objects are positioned within expected tolerances.
 
         Args:
             workbook: The Excel workbook to validate
+            source_path: Optional path of the unmodified file the workbook was
+                loaded from; opened directly instead of saving a copy
 
         Returns:
             List of validation failures, empty if all objects are positioned correctly
         """
-        failures: List[ValidationFailure] = []
-
-        # Check if xlwings is available
-        if xw is None:
-            # Skip object position validation if xlwings is not available
-            return failures
+        return run_object_position_rules(workbook, [self], source_path)
 
-        # Check if this sheet has object configurations
-        if hasattr(self.sheet_config, "objects") and self.sheet_config.objects:
-            # Check if the sheet exists in the workbook
-            if self.sheet_name not in workbook.sheetnames:
-                # Skip object validation if sheet doesn't exist
-                # (sheet existence should be handled by SheetExistsRule)
-                return failures
+    def validate_open_sheet(self, sheet: Any) -> List[ValidationFailure]:
+        """Check the expected objects against a sheet opened with xlwings.
 
-            # Save the workbook to a temporary file to access with xlwings
-            temp_path = f"/tmp/temp_workbook_{id(workbook)}.xlsx"
-            workbook.save(temp_path)
+        Args:
+            sheet: The xlwings worksheet object
 
-            try:
-                # Open with xlwings to access shape objects
-                with xw.App(visible=False) as app:
-                    wb = app.books.open(temp_path)
-                    try:
-                        sheet = wb.sheets[self.sheet_name]
-
-                        # Validate each expected object
-                        for expected_object in self.sheet_config.objects:
-                            failures.extend(
-                                self._validate_object(sheet, expected_object)
-                            )
-                    finally:
-                        wb.close()
-            except Exception:
-                # If xlwings fails, skip object validation
-                pass
-            finally:
-                # Clean up temp file
-                import os
+        Returns:
+            List of validation failures, empty if all objects are positioned correctly
+        """
+        failures: List[ValidationFailure] = []
+        shapes_by_name = self._index_shapes_by_name(sheet)
 
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    pass
+        # Validate each expected object
+        for expected_object in self.sheet_config.objects:
+            failures.extend(
+                self._validate_object(sheet, expected_object, shapes_by_name)
+            )
 
         return failures
 
     def _validate_object(
-        self, sheet: Any, expected_object: Dict[str, Any]
+        self,
+        sheet: Any,
+        expected_object: Dict[str, Any],
+        shapes_by_name: Optional[Dict[str, Any]] = None,
     ) -> List[ValidationFailure]:
         """Validate a specific object position.
 
         Args:
             sheet: The xlwings worksheet object
             expected_object: Expected object configuration from YAML
+            shapes_by_name: Shapes keyed by name (see _index_shapes_by_name);
+                built from the sheet if not given
 
         Returns:
             List of validation failures for this object
@@ -93,7 +111,9 @@ class ObjectPositionRule(Rule):
         tolerance = expected_position.get("tolerance", 5)
 
         # Find the shape by name
-        shape = self._find_shape_by_name(sheet, object_name)
+        if shapes_by_name is None:
+            shapes_by_name = self._index_shapes_by_name(sheet)
+        shape = shapes_by_name.get(object_name)
 
         if shape is None:
             # Object is missing
@@ -119,8 +139,8 @@ class ObjectPositionRule(Rule):
 
         if top_diff > tolerance or left_diff > tolerance:
             # Calculate movement distance for fix hint
-            total_movement = math.sqrt(
-                (actual_left - expected_left) ** 2 + (actual_top - expected_top) ** 2
+            total_movement = math.hypot(
+                actual_left - expected_left, actual_top - expected_top
             )
 
             # Determine movement direction
@@ -144,23 +164,27 @@ class ObjectPositionRule(Rule):
 
         return failures
 
-    def _find_shape_by_name(self, sheet: Any, shape_name: str) -> Optional[Any]:
-        """Find a shape by its name in the worksheet.
+    def _index_shapes_by_name(self, sheet: Any) -> Dict[str, Any]:
+        """Map the sheet's shapes by name.
+
+        Every shape access goes through xlwings (a COM call on Windows), so
+        the shapes are enumerated once per sheet rather than once per
+        expected object.
 
         Args:
             sheet: The xlwings worksheet object
-            shape_name: Name of the shape to find
 
         Returns:
-            The shape object if found, None otherwise
+            Dictionary mapping shape names to shape objects (the first shape
+            wins if names repeat); empty if the shapes cannot be read
         """
+        shapes_by_name: Dict[str, Any] = {}
         try:
             for shape in sheet.shapes:
-                if shape.name == shape_name:
-                    return shape
+                shapes_by_name.setdefault(shape.name, shape)
         except Exception:
             pass
-        return None
+        return shapes_by_name
 
     def _get_movement_hint(
         self, expected_left: int, expected_top: int, actual_left: int, actual_top: int
@@ -184,3 +208,80 @@ class ObjectPositionRule(Rule):
             return "left" if left_diff > 0 else "right"
         else:
             return "up" if top_diff > 0 else "down"
+
+
+def run_object_position_rules(
+    workbook: Workbook,
+    rules: List[ObjectPositionRule],
+    source_path: Optional[Union[str, Path]] = None,
+) -> List[ValidationFailure]:
+    """Run object position rules for several sheets in one xlwings session.
+
+    Saving the workbook and starting Excel cost far more than reading a few
+    shapes, so the workbook is saved and opened once for all sheets instead
+    of once per rule. When the file the workbook was loaded from is given,
+    Excel opens it directly and no copy is saved.
+
+    Args:
+        workbook: The Excel workbook to validate
+        rules: Object position rules to run
+        source_path: Optional path of the unmodified file the workbook was
+            loaded from
+
+    Returns:
+        List of validation failures from all rules
+    """
+    failures: List[ValidationFailure] = []
+
+    # Check if xlwings is available
+    if xw is None:
+        # Skip object position validation if xlwings is not available
+        return failures
+
+    # Keep rules with object configurations whose sheet exists
+    # (sheet existence should be handled by SheetExistsRule)
+    rules = [
+        rule
+        for rule in rules
+        if getattr(rule.sheet_config, "objects", None)
+        and rule.sheet_name in workbook.sheetnames
+    ]
+    if not rules:
+        return failures
+
+    temp_path = None
+    try:
+        if source_path is not None:
+            book_path = str(Path(source_path).resolve())
+        else:
+            # Save the workbook to a temporary file to access with xlwings
+            with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
+                temp_path = temp_file.name
+            workbook.save(temp_path)
+            book_path = temp_path
+
+        # Open with xlwings to access shape objects
+        wb = _get_shared_app().books.open(book_path)
+        try:
+            for rule in rules:
+                try:
+                    sheet = wb.sheets[rule.sheet_name]
+                    failures.extend(rule.validate_open_sheet(sheet))
+                except Exception:
+                    # If xlwings fails on this sheet, skip its objects
+                    continue
+        finally:
+            wb.close()
+    except Exception:
+        # If xlwings fails, skip object validation; drop the shared Excel
+        # instance so the next check starts a fresh one
+        _quit_shared_app()
+    finally:
+        # Clean up temp file
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    return failures
@@ -1,6 +1,6 @@
 """Sheet existence validation rule."""
 
-from typing import List
+from typing import Collection, List
 
 from openpyxl import Workbook
 
@@ -16,6 +16,21 @@ class SheetExistsRule(Rule):
         Args:
             workbook: The Excel workbook to validate
 
+        Returns:
+            List of validation failures, empty if sheet exists
+        """
+        return self.check_sheet_names(workbook.sheetnames)
+
+    def check_sheet_names(self, sheet_names: Collection[str]) -> List[ValidationFailure]:
+        """Check if the required sheet is among the given sheet names.
+
+        Callers validating many sheets can build a set of the workbook's
+        sheet names once and pass it here, instead of each rule listing the
+        workbook's sheets again.
+
+        Args:
+            sheet_names: Names of the sheets in the workbook
+
         Returns:
             List of validation failures, empty if sheet exists
         """
@@ -23,9 +38,6 @@ class SheetExistsRule(Rule):
 
         # Check if this sheet is required to exist
         if hasattr(self.sheet_config, "must_exist") and self.sheet_config.must_exist:
-            # Get all sheet names in the workbook
-            sheet_names = workbook.sheetnames
-
             # Check if our required sheet exists
             if self.sheet_name not in sheet_names:
                 failure = ValidationFailure(
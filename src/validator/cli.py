@@ -1,6 +1,9 @@
+import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 from openpyxl import load_workbook
@@ -8,12 +11,28 @@ from openpyxl.workbook import Workbook
 
 from . import __version__
 from .config import load_rules, RuleConfigError, RuleConfig
-from ..structural import get_structural_rules
+from ..structural import get_structural_rules, run_object_position_rules
 from ..structural.base import ValidationFailure
-from ..data import DataValidationRule
-from ..data.data_diff_rule import DataDiffRule
 from ..visual import capture, pixel_diff
-from ..reporter import create_reporters
+from ..reporter import ReporterFactory, create_reporters
+
+# Structural rule classes, resolved from the registry once at import
+_RULE_REGISTRY = get_structural_rules()
+_SHEET_EXISTS_RULE = _RULE_REGISTRY.get("sheet_exists")
+_OBJECT_POSITION_RULE = _RULE_REGISTRY.get("object_position")
+
+# Per-sheet workbook rules in the order they run after the existence check,
+# keyed by the sheet config attribute that enables them
+_SHEET_RULES = (
+    ("cells", _RULE_REGISTRY.get("cell_formula")),
+    ("expect_cf_rules", _RULE_REGISTRY.get("conditional_formatting")),
+)
+
+# Worker threads comparing captured screenshots against their baselines
+_DIFF_WORKERS = 4
+
+# Environment variable that turns visual validation off ("1", "true", "yes")
+_SKIP_VISUAL_ENV = "SHEETCHECK_SKIP_VISUAL"
 
 
 @click.command()
@@ -63,15 +82,18 @@ def main(
         click.echo(f"Diff mode: Comparing {workbook} vs {workbook2}")
         click.echo(f"Reports: {report}")
         
-        # Run diff comparison
+        # Run diff comparison (src.data pulls in pandas and Great
+        # Expectations, so it is only imported by the modes that use it)
+        from ..data.data_diff_rule import DataDiffRule
+
         diff_rule = DataDiffRule("Sheet1", None)
         diff_failures = diff_rule.run_diff(workbook, workbook2)
         
         # Generate reports
         try:
             reporters = create_reporters(report, Path("reports"))
-            for reporter in reporters:
-                output_path = reporter.write_to_file([], diff_failures, [])
+            output_paths = ReporterFactory.run_all(reporters, [], diff_failures, [])
+            for reporter, output_path in zip(reporters, output_paths):
                 click.echo(f"{reporter.__class__.__name__[:-8]} report written to {output_path}")
         except ValueError as e:
             click.echo(f"Error creating reports: {e}", err=True)
@@ -115,31 +137,41 @@ def main(
         click.echo(f"Error loading rules: {e}", err=True)
         raise click.Abort()
 
-    # Load the workbook
+    # Load the workbook; read-only mode streams cells from the file instead
+    # of materializing every cell, unless a rule needs the full object model
     try:
-        wb = load_workbook(workbook, data_only=False)
-        sheet_list = ", ".join(wb.sheetnames)
-        click.echo(f"Loaded workbook with {len(wb.sheetnames)} sheet(s): {sheet_list}")
+        wb = load_workbook(
+            workbook,
+            read_only=not needs_full_workbook(config),
+            data_only=False,
+            keep_links=False,
+        )
+        sheet_names = wb.sheetnames  # openpyxl rebuilds this list on each access
+        sheet_list = ", ".join(sheet_names)
+        click.echo(f"Loaded workbook with {len(sheet_names)} sheet(s): {sheet_list}")
     except Exception as e:
         click.echo(f"Error loading workbook: {e}", err=True)
         raise click.Abort()
 
-    # Run validation
-    structural_failures = run_structural_validation(wb, config)
-    data_failures = run_data_validation(wb, config)
-    visual_failures = run_visual_validation(
-        wb, config, workbook, renderer, update_baseline
-    )
+    # Run validation; read-only workbooks keep the file open until closed
+    try:
+        structural_failures = run_structural_validation(wb, config, workbook)
+        data_failures = run_data_validation(wb, config)
+        visual_failures = run_visual_validation(
+            wb, config, workbook, renderer, update_baseline
+        )
+    finally:
+        wb.close()
 
     all_failures = structural_failures + data_failures + visual_failures
 
     # Generate reports using unified reporter system
     try:
         reporters = create_reporters(report, Path("reports"))
-        for reporter in reporters:
-            output_path = reporter.write_to_file(
-                structural_failures, data_failures, visual_failures
-            )
+        output_paths = ReporterFactory.run_all(
+            reporters, structural_failures, data_failures, visual_failures
+        )
+        for reporter, output_path in zip(reporters, output_paths):
             click.echo(f"{reporter.__class__.__name__[:-8]} report written to {output_path}")
     except ValueError as e:
         click.echo(f"Error creating reports: {e}", err=True)
@@ -177,53 +209,66 @@ def main(
             sys.exit(0)
 
 
+def needs_full_workbook(config: RuleConfig) -> bool:
+    """Check whether any rule needs a fully loaded (non read-only) workbook.
+
+    Conditional formatting rules read worksheet.conditional_formatting,
+    which openpyxl's read-only worksheets don't provide. Object position
+    rules open the source file in Excel, so they work on either.
+
+    Args:
+        config: The rule configuration
+
+    Returns:
+        True if the workbook must be loaded in full, False if read-only suffices
+    """
+    return any(sheet_cfg.expect_cf_rules for sheet_cfg in config.sheets.values())
+
+
 def run_structural_validation(
-    workbook: Workbook, config: RuleConfig
+    workbook: Workbook, config: RuleConfig, workbook_path: Optional[Path] = None
 ) -> List[ValidationFailure]:
     """Run all structural validation rules.
 
     Args:
         workbook: The loaded Excel workbook
         config: The rule configuration
+        workbook_path: Optional path the workbook was loaded from, opened
+            directly by rules that need Excel instead of saving a copy
 
     Returns:
         List of validation failures
     """
     failures = []
-    rule_registry = get_structural_rules()
+    object_rules = []
+    present_sheets = frozenset(workbook.sheetnames)
 
     for sheet_name, sheet_config in config.sheets.items():
-        # Check if sheet existence rule should be applied
-        if hasattr(sheet_config, "must_exist") and sheet_config.must_exist:
-            rule_class = rule_registry.get("sheet_exists")
-            if rule_class:
-                rule = rule_class(sheet_name, sheet_config)
-                sheet_failures = rule.run(workbook)
-                failures.extend(sheet_failures)
-
-        # Check if cell formula validation should be applied
-        if hasattr(sheet_config, "cells") and sheet_config.cells:
-            rule_class = rule_registry.get("cell_formula")
-            if rule_class:
+        # Check required sheets against the workbook's sheet names, built once
+        if _SHEET_EXISTS_RULE and sheet_config.must_exist:
+            rule = _SHEET_EXISTS_RULE(sheet_name, sheet_config)
+            failures.extend(rule.check_sheet_names(present_sheets))
+
+        # The remaining rules inspect the sheet itself; a missing sheet is
+        # reported by the existence check alone
+        if sheet_name not in present_sheets:
+            continue
+
+        # Apply each per-sheet rule whose configuration key is set
+        for config_key, rule_class in _SHEET_RULES:
+            if rule_class and getattr(sheet_config, config_key):
                 rule = rule_class(sheet_name, sheet_config)
-                sheet_failures = rule.run(workbook)
-                failures.extend(sheet_failures)
-
-        # Check if conditional formatting validation should be applied
-        if hasattr(sheet_config, "expect_cf_rules") and sheet_config.expect_cf_rules:
-            rule_class = rule_registry.get("conditional_formatting")
-            if rule_class:
-                rule = rule_class(sheet_name, sheet_config)
-                sheet_failures = rule.run(workbook)
-                failures.extend(sheet_failures)
+                failures.extend(rule.run(workbook))
 
         # Check if object position validation should be applied
-        if hasattr(sheet_config, "objects") and sheet_config.objects:
-            rule_class = rule_registry.get("object_position")
-            if rule_class:
-                rule = rule_class(sheet_name, sheet_config)
-                sheet_failures = rule.run(workbook)
-                failures.extend(sheet_failures)
+        if _OBJECT_POSITION_RULE and sheet_config.objects:
+            object_rules.append(_OBJECT_POSITION_RULE(sheet_name, sheet_config))
+
+    # Object rules share one saved copy of the workbook and one Excel session
+    if object_rules:
+        failures.extend(
+            run_object_position_rules(workbook, object_rules, workbook_path)
+        )
 
     return failures
 
@@ -241,11 +286,19 @@ def run_data_validation(
         List of validation failures from data validation
     """
     failures = []
+    if not config.data_validation_rules:
+        return failures
+
+    # Imported here so runs without data rules don't load Great Expectations
+    from ..data import DataValidationRule
+
+    # Sheet DataFrames shared by rules that read the same data
+    frame_cache: Dict[Tuple[Any, ...], Any] = {}
 
     for rule_path in config.data_validation_rules:
         try:
             # Create data validation rule and run it
-            data_rule = DataValidationRule(rule_path, None)
+            data_rule = DataValidationRule(rule_path, None, frame_cache)
             rule_failures = data_rule.run(workbook)
             failures.extend(rule_failures)
 
@@ -289,35 +342,37 @@ def run_visual_validation(
     """
     failures: List[ValidationFailure] = []
 
+    # Checked before the renderer probe so CI jobs that run visual checks
+    # separately never touch the capture backends
+    if os.environ.get(_SKIP_VISUAL_ENV, "").lower() in ("1", "true", "yes"):
+        click.echo(f"Visual validation skipped: {_SKIP_VISUAL_ENV} is set")
+        return failures
+
     if not capture.is_capture_supported():
         click.echo("Visual validation skipped: No screenshot renderer available")
         return failures
 
     # Get workbook name for baseline directory
     workbook_name = workbook_path.stem
-
-    for sheet_name in workbook.sheetnames:
-        try:
-            # Generate screenshot of current sheet
-            temp_screenshot_path = Path(f"/tmp/{workbook_name}_{sheet_name}_temp.png")
-            temp_screenshot_path.parent.mkdir(parents=True, exist_ok=True)
-
-            capture.capture_sheet_png(
-                workbook_path, sheet_name, temp_screenshot_path, renderer=renderer
-            )
-
-            if update_baseline:
-                # Update mode: copy screenshot to baseline
+    sheet_names = list(workbook.sheetnames)
+
+    # Captures stay sequential (one Excel instance / browser page renders one
+    # sheet at a time), but each comparison runs on a worker thread so it
+    # overlaps with capturing the next sheet. Outcomes are kept per sheet and
+    # resolved in sheet order so the failure list doesn't depend on timing.
+    # The capture session (e.g. a running Excel instance) is opened for the
+    # first sheet that needs a screenshot and shared by the rest.
+    outcomes: List[Any] = []
+    workers = min(_DIFF_WORKERS, len(sheet_names) or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool, ExitStack() as stack:
+        session = None
+        for sheet_name in sheet_names:
+            try:
                 baseline_path = get_baseline_path(workbook_name, sheet_name)
-                update_baseline_file(temp_screenshot_path, baseline_path)
-                click.echo(f"  ✓ Baseline updated for {sheet_name}")
 
-            else:
-                # Validation mode: compare against baseline
-                baseline_path = get_baseline_path(workbook_name, sheet_name)
-
-                if not baseline_path.exists():
-                    failures.append(
+                if not update_baseline and not baseline_path.exists():
+                    # Nothing to compare against, so don't render the sheet
+                    outcomes.append(
                         ValidationFailure(
                             type="visual_baseline_missing",
                             message=f"Baseline image missing for sheet '{sheet_name}'",
@@ -326,44 +381,87 @@ def run_visual_validation(
                             sheet=sheet_name,
                         )
                     )
-                else:
-                    # Compare images using pixel diff
-                    diff_ratio = pixel_diff.diff_png(
-                        baseline_path, temp_screenshot_path, threshold=0.02
+                    continue
+
+                if session is None:
+                    session = stack.enter_context(
+                        capture.open_session(workbook_path, renderer=renderer)
                     )
 
-                    if diff_ratio > 0.01:  # More than 1% difference
-                        failures.append(
-                            ValidationFailure(
-                                type="visual_diff",
-                                message=f"Visual difference detected in sheet "
-                                f"'{sheet_name}': {diff_ratio:.2%}",
-                                fix_hint="Run with --update-baseline to accept changes",
-                                sheet=sheet_name,
-                            )
+                # Screenshots stay in memory; only baselines are written
+                image = session.capture(sheet_name)
+
+                if update_baseline:
+                    # Update mode: save screenshot as the new baseline
+                    update_baseline_image(image, baseline_path)
+                    click.echo(f"  ✓ Baseline updated for {sheet_name}")
+                    outcomes.append(None)
+                else:
+                    # Validation mode: compare against baseline in the background
+                    outcomes.append(
+                        pool.submit(
+                            pixel_diff.diff_image, baseline_path, image, threshold=0.02
                         )
-                        click.echo(f"  ✗ Visual diff in {sheet_name}: {diff_ratio:.2%}")
-                    else:
-                        click.echo(f"  ✓ Visual validation passed for {sheet_name}")
+                    )
 
-            # Clean up temporary file
-            if temp_screenshot_path.exists():
-                temp_screenshot_path.unlink()
+            except Exception as e:
+                outcomes.append(_visual_error(sheet_name, e))
 
-        except Exception as e:
-            click.echo(f"Error in visual validation for {sheet_name}: {e}", err=True)
-            failures.append(
-                ValidationFailure(
-                    type="visual_error",
-                    message=f"Visual validation failed for sheet '{sheet_name}': {e}",
-                    fix_hint="Check screenshot renderer and file permissions",
-                    sheet=sheet_name,
-                )
-            )
+    for sheet_name, outcome in zip(sheet_names, outcomes):
+        if isinstance(outcome, Future):
+            try:
+                outcome = _diff_outcome(sheet_name, outcome.result())
+            except Exception as e:
+                outcome = _visual_error(sheet_name, e)
+        if outcome is not None:
+            failures.append(outcome)
 
     return failures
 
 
+def _diff_outcome(sheet_name: str, diff_ratio: float) -> Optional[ValidationFailure]:
+    """Report the comparison result for a sheet.
+
+    Args:
+        sheet_name: Name of the compared sheet
+        diff_ratio: Ratio of differing pixels
+
+    Returns:
+        A visual_diff failure, or None if the sheet matches its baseline
+    """
+    if diff_ratio > 0.01:  # More than 1% difference
+        click.echo(f"  ✗ Visual diff in {sheet_name}: {diff_ratio:.2%}")
+        return ValidationFailure(
+            type="visual_diff",
+            message=f"Visual difference detected in sheet "
+            f"'{sheet_name}': {diff_ratio:.2%}",
+            fix_hint="Run with --update-baseline to accept changes",
+            sheet=sheet_name,
+        )
+
+    click.echo(f"  ✓ Visual validation passed for {sheet_name}")
+    return None
+
+
+def _visual_error(sheet_name: str, error: Exception) -> ValidationFailure:
+    """Report an error raised while capturing or comparing a sheet.
+
+    Args:
+        sheet_name: Name of the sheet being validated
+        error: The raised exception
+
+    Returns:
+        A visual_error failure
+    """
+    click.echo(f"Error in visual validation for {sheet_name}: {error}", err=True)
+    return ValidationFailure(
+        type="visual_error",
+        message=f"Visual validation failed for sheet '{sheet_name}': {error}",
+        fix_hint="Check screenshot renderer and file permissions",
+        sheet=sheet_name,
+    )
+
+
 def get_baseline_path(workbook_name: str, sheet_name: str) -> Path:
     """Get the baseline image path for a workbook sheet.
 
@@ -374,7 +472,29 @@ def get_baseline_path(workbook_name: str, sheet_name: str) -> Path:
     Returns:
         Path to the baseline PNG file
     """
-    return Path("baselines") / "sheets" / workbook_name / f"{sheet_name}.png"
+    return Path("baselines", "sheets", workbook_name, f"{sheet_name}.png")
+
+
+def update_baseline_image(image: Any, baseline_path: Path) -> None:
+    """Update a baseline file with a captured image.
+
+    The image is written next to the baseline and renamed over it, so an
+    interrupted run never leaves a truncated baseline behind.
+
+    Args:
+        image: PIL image of the new screenshot
+        baseline_path: Path to the baseline file to update
+    """
+    # Ensure baseline directory exists
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_path = baseline_path.with_name(f".{baseline_path.name}.{os.getpid()}.tmp")
+    try:
+        image.save(str(temp_path), "PNG")
+        os.replace(temp_path, baseline_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
 
 
 def update_baseline_file(source_path: Path, baseline_path: Path) -> None:
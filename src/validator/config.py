@@ -1,11 +1,28 @@
 """Configuration management for SheetCheck validator."""
 
+import copy
+import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import yaml
 
+from ..structural.base import _DATACLASS_SLOTS, _intern
+
+logger = logging.getLogger(__name__)
+
+try:
+    # LibYAML-backed loader; several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
+    logger.warning(
+        "PyYAML was built without LibYAML; rule files are parsed with the "
+        "slower pure-Python loader"
+    )
+
 
 class RuleConfigError(Exception):
     """Exception raised when rule configuration is invalid."""
@@ -13,16 +30,17 @@ class RuleConfigError(Exception):
     pass
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SheetCfg:
     """Configuration for a single sheet validation."""
 
     must_exist: bool = False
     cells: Dict[str, Any] = field(default_factory=dict)
     expect_cf_rules: List[Dict] = field(default_factory=list)
+    objects: List[Dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RuleConfig:
     """Complete rule configuration for workbook validation."""
 
@@ -31,6 +49,40 @@ class RuleConfig:
     data_validation_rules: List[str] = field(default_factory=list)
 
 
+# Parsed rule files keyed by (resolved path, mtime in ns, size), so a file
+# read by both detect_rule_type and load_rules (or loaded again unchanged)
+# is only parsed once
+_YAML_CACHE: Dict[Tuple[str, int, int], Any] = {}
+
+
+def _read_yaml(path: Path) -> Any:
+    """Read and parse a YAML rule file, reusing the parse of an unchanged file.
+
+    Args:
+        path: Path to YAML rule file
+
+    Returns:
+        Parsed YAML content (None for an empty file); a copy callers may modify
+
+    Raises:
+        RuleConfigError: If file cannot be read or parsed
+    """
+    try:
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if key not in _YAML_CACHE:
+            with open(path, "r", encoding="utf-8") as f:
+                _YAML_CACHE[key] = yaml.load(f, Loader=SafeLoader)
+    except FileNotFoundError as e:
+        raise RuleConfigError(f"Rules file not found: {path}") from e
+    except yaml.YAMLError as e:
+        raise RuleConfigError(f"Invalid YAML in {path}: {e}") from e
+    except (OSError, UnicodeDecodeError) as e:
+        raise RuleConfigError(f"Error reading {path}: {e}") from e
+
+    return copy.deepcopy(_YAML_CACHE[key])
+
+
 def detect_rule_type(path: Union[str, Path]) -> str:
     """Detect the type of rule from a YAML file.
 
@@ -43,18 +95,18 @@ def detect_rule_type(path: Union[str, Path]) -> str:
     Raises:
         RuleConfigError: If file cannot be read or parsed
     """
-    path = Path(path)
+    return _rule_type(_read_yaml(Path(path)))
 
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-    except FileNotFoundError:
-        raise RuleConfigError(f"Rules file not found: {path}")
-    except yaml.YAMLError as e:
-        raise RuleConfigError(f"Invalid YAML in {path}: {e}")
-    except Exception as e:
-        raise RuleConfigError(f"Error reading {path}: {e}")
 
+def _rule_type(data: Any) -> str:
+    """Detect the type of rule from parsed YAML content.
+
+    Args:
+        data: Parsed YAML content (None for an empty file)
+
+    Returns:
+        Rule type: "data_validation" or "structural"
+    """
     if data is None:
         return "structural"  # Default to structural for empty files
 
@@ -92,46 +144,49 @@ def load_rules(path: Union[str, Path]) -> RuleConfig:
         RuleConfigError: If YAML is invalid or configuration is malformed
     """
     path = Path(path)
+    data = _read_yaml(path)
 
-    # Detect rule type
-    rule_type = detect_rule_type(path)
-
-    if rule_type == "data_validation":
+    if _rule_type(data) == "data_validation":
         # For data validation rules, just store the file path
         return RuleConfig(sheets={}, data_validation_rules=[str(path)])
 
-    # Handle structural rules (original logic)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-    except FileNotFoundError:
-        raise RuleConfigError(f"Rules file not found: {path}")
-    except yaml.YAMLError as e:
-        raise RuleConfigError(f"Invalid YAML in {path}: {e}")
-    except Exception as e:
-        raise RuleConfigError(f"Error reading {path}: {e}")
+        # Parse sheets configuration; names are interned since they are
+        # matched against workbook sheet names and reused in every failure
+        sheets = {
+            _intern(sheet_name): _parse_sheet_cfg(sheet_name, sheet_config)
+            for sheet_name, sheet_config in (data or {}).get("sheets", {}).items()
+        }
+    except (RuleConfigError, AttributeError, TypeError) as e:
+        # AttributeError/TypeError: the document or its "sheets" value is
+        # not a mapping
+        raise RuleConfigError(f"Error parsing configuration from {path}: {e}") from e
 
-    if data is None:
-        data = {}
+    return RuleConfig(sheets=sheets, data_validation_rules=[])
 
-    try:
-        # Parse sheets configuration
-        sheets = {}
-        if "sheets" in data:
-            for sheet_name, sheet_config in data["sheets"].items():
-                if not isinstance(sheet_config, dict):
-                    raise RuleConfigError(
-                        f"Sheet configuration for '{sheet_name}' must be a "
-                        "dictionary"
-                    )
-
-                sheets[sheet_name] = SheetCfg(
-                    must_exist=sheet_config.get("must_exist", False),
-                    cells=sheet_config.get("cells", {}),
-                    expect_cf_rules=sheet_config.get("expect_cf_rules", []),
-                )
-
-        return RuleConfig(sheets=sheets, data_validation_rules=[])
-
-    except Exception as e:
-        raise RuleConfigError(f"Error parsing configuration from {path}: {e}")
+
+def _parse_sheet_cfg(sheet_name: str, sheet_config: Any) -> SheetCfg:
+    """Build the configuration of one sheet from its YAML mapping.
+
+    Args:
+        sheet_name: Name of the sheet
+        sheet_config: Parsed YAML value for the sheet
+
+    Returns:
+        SheetCfg for the sheet
+
+    Raises:
+        RuleConfigError: If the sheet configuration is not a mapping
+    """
+    if not isinstance(sheet_config, dict):
+        raise RuleConfigError(
+            f"Sheet configuration for '{sheet_name}' must be a dictionary"
+        )
+
+    get = sheet_config.get
+    return SheetCfg(
+        must_exist=get("must_exist", False),
+        cells=get("cells", {}),
+        expect_cf_rules=get("expect_cf_rules", []),
+        objects=get("objects", []),
+    )
@@ -1,8 +1,25 @@
 """Unified screenshot capture interface with automatic renderer selection."""
 
 import platform
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Any, Dict, Optional, Union
+
+try:
+    from PIL import Image  # type: ignore
+except ImportError:
+    Image = None  # type: ignore
+
+try:
+    from . import capture_com
+except ImportError:
+    capture_com = None  # type: ignore
+
+try:
+    from . import capture_mcp
+except ImportError:
+    capture_mcp = None  # type: ignore
 
 
 def capture_sheet_png(
@@ -32,6 +49,110 @@ def capture_sheet_png(
     Example:
         >>> capture_sheet_png("workbook.xlsx", "Dashboard", "screenshot.png")
     """
+    selected_renderer = _select_renderer(renderer)
+
+    if selected_renderer == "com":
+        capture_com.capture_sheet_png(wb_path, sheet_name, png_path)
+    else:
+        capture_mcp.capture_sheet_png(wb_path, sheet_name, png_path)
+
+
+def open_session(wb_path: Union[str, Path], renderer: str = "auto") -> Any:
+    """Open a capture session for taking screenshots of several sheets.
+
+    The COM renderer keeps one Excel instance and the workbook open for the
+    whole session. The MCP renderer converts all sheets of the workbook to
+    HTML with one Node.js run on the first capture.
+
+    Args:
+        wb_path: Path to the Excel workbook file
+        renderer: Renderer to use ("auto", "com", "mcp")
+
+    Returns:
+        Context manager whose capture(sheet_name, png_path=None) method
+        saves a screenshot of a sheet, or returns it as a PIL image when no
+        path is given
+
+    Raises:
+        ImportError: If no suitable renderer is available
+        ValueError: If the renderer name is invalid
+
+    Example:
+        >>> with open_session("workbook.xlsx") as session:
+        ...     session.capture("Dashboard", "dashboard.png")
+    """
+    selected_renderer = _select_renderer(renderer)
+
+    if selected_renderer == "com":
+        return capture_com.CaptureSession(wb_path)
+
+    return _FileCaptureSession(capture_mcp.CaptureSession(wb_path))
+
+
+class _FileCaptureSession:
+    """Session wrapper adding in-memory capture to a file-only session."""
+
+    def __init__(self, session: Any):
+        """Initialize the wrapper.
+
+        Args:
+            session: Renderer session whose capture(sheet_name, png_path)
+                can only write files
+        """
+        self._session = session
+
+    def __enter__(self) -> "_FileCaptureSession":
+        self._session.__enter__()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._session.__exit__(*exc_info)
+
+    def capture(
+        self, sheet_name: str, png_path: Optional[Union[str, Path]] = None
+    ) -> Optional["Image.Image"]:
+        """Capture a screenshot of a sheet.
+
+        Args:
+            sheet_name: Name of the sheet to capture
+            png_path: Output path for the PNG screenshot, or None to return
+                the captured image instead
+
+        Returns:
+            The captured PIL image if no png_path was given, otherwise None
+
+        Raises:
+            ImportError: If an image is requested and PIL is not available
+        """
+        if png_path is not None:
+            self._session.capture(sheet_name, png_path)
+            return None
+
+        if Image is None:
+            raise ImportError("PIL (Pillow) is required for in-memory screenshots")
+
+        # The renderer can only write files, so load its output and drop it
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir) / "capture.png"
+            self._session.capture(sheet_name, temp_path)
+            with Image.open(temp_path) as image:
+                image.load()
+                return image
+
+
+def _select_renderer(renderer: str) -> str:
+    """Resolve the renderer to use and check it is available.
+
+    Args:
+        renderer: Renderer to use ("auto", "com", "mcp")
+
+    Returns:
+        "com" or "mcp"
+
+    Raises:
+        ImportError: If the selected renderer is not available
+        ValueError: If the renderer name is invalid
+    """
     # Get renderer info to determine best option
     info = get_renderer_info()
 
@@ -48,66 +169,66 @@ def capture_sheet_png(
                 "COM renderer not available. "
                 "Requires Windows platform with xlwings and PIL."
             )
-        from . import capture_com
-
-        capture_com.capture_sheet_png(wb_path, sheet_name, png_path)
+        return selected_renderer
 
-    elif selected_renderer == "mcp":
+    if selected_renderer == "mcp":
         if not info.get("mcp_available", False):
             raise ImportError(
                 "MCP renderer not available. "
                 "Requires MCP Puppeteer server and tools."
             )
-        from . import capture_mcp
-
-        capture_mcp.capture_sheet_png(wb_path, sheet_name, png_path)
-
-    else:
-        available_renderers = [
-            name for name in ["com", "mcp"] if info.get(f"{name}_available", False)
-        ]
+        return selected_renderer
 
-        if not available_renderers:
-            raise ImportError(
-                "No screenshot renderers available. "
-                "Install xlwings+PIL (Windows) or setup MCP Puppeteer server."
-            )
+    available_renderers = [
+        name for name in ["com", "mcp"] if info.get(f"{name}_available", False)
+    ]
 
-        raise ValueError(
-            f"Invalid renderer '{selected_renderer}'. "
-            f"Available: {available_renderers}"
+    if not available_renderers:
+        raise ImportError(
+            "No screenshot renderers available. "
+            "Install xlwings+PIL (Windows) or setup MCP Puppeteer server."
         )
 
+    raise ValueError(
+        f"Invalid renderer '{selected_renderer}'. "
+        f"Available: {available_renderers}"
+    )
+
 
 def get_renderer_info() -> Dict[str, Any]:
     """Get information about available screenshot renderers.
 
+    The platform and renderer modules don't change while the process runs,
+    so they are probed once; call clear_renderer_cache() to probe again.
+
     Returns:
         Dictionary with renderer availability and platform info
     """
+    return dict(_probe_renderers())
+
+
+@lru_cache(maxsize=1)
+def _probe_renderers() -> Dict[str, Any]:
+    """Probe the platform and renderer modules.
+
+    Returns:
+        Dictionary with renderer availability and platform info
+    """
+    system = platform.system()
     info = {
-        "platform": platform.system(),
+        "platform": system,
         "com_available": False,
         "mcp_available": False,
         "preferred_renderer": "none",
     }
 
     # Check COM availability (Windows only)
-    if platform.system() == "Windows":
-        try:
-            from . import capture_com
-
-            info["com_available"] = capture_com.is_capture_supported()
-        except ImportError:
-            pass
+    if system == "Windows" and capture_com is not None:
+        info["com_available"] = capture_com.is_capture_supported()
 
     # Check MCP availability (all platforms)
-    try:
-        from . import capture_mcp
-
+    if capture_mcp is not None:
         info["mcp_available"] = capture_mcp.is_capture_supported()
-    except ImportError:
-        pass
 
     # Determine preferred renderer
     if info["com_available"]:
@@ -118,6 +239,11 @@ def get_renderer_info() -> Dict[str, Any]:
     return info
 
 
+def clear_renderer_cache() -> None:
+    """Forget the probed renderer availability."""
+    _probe_renderers.cache_clear()
+
+
 def is_capture_supported() -> bool:
     """Check if any screenshot capture method is supported.
 
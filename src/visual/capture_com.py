@@ -1,8 +1,9 @@
 """COM screenshot capture utility for Windows Excel automation."""
 
 import platform
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Union
+from typing import Optional, TYPE_CHECKING, Union
 
 try:
     import xlwings as xw
@@ -14,6 +15,9 @@ try:
 except ImportError:
     ImageGrab = None  # type: ignore
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 def capture_sheet_png(
     wb_path: Union[str, Path], sheet_name: str, png_path: Union[str, Path]
@@ -21,7 +25,9 @@ def capture_sheet_png(
     """Capture a screenshot of an Excel sheet and save as PNG.
 
     Uses Windows COM automation via xlwings to open Excel, activate the specified
-    sheet, capture a screenshot to clipboard, and save as PNG using PIL.
+    sheet, capture a screenshot to clipboard, and save as PNG using PIL. Use
+    CaptureSession to capture several sheets of one workbook without starting
+    Excel for each of them.
 
     Args:
         wb_path: Path to the Excel workbook file
@@ -38,99 +44,165 @@ def capture_sheet_png(
     Example:
         >>> capture_sheet_png("workbook.xlsx", "Dashboard", "screenshot.png")
     """
-    # Check platform compatibility
-    if platform.system() != "Windows":
-        raise NotImplementedError(
-            "COM screenshot capture is only supported on Windows platforms"
-        )
+    with CaptureSession(wb_path) as session:
+        session.capture(sheet_name, png_path)
+
+
+class CaptureSession:
+    """Excel instance with one workbook open for capturing its sheets.
+
+    Starting Excel and opening the workbook dominate the cost of a capture,
+    so a session does both once and then only activates and copies each
+    requested sheet.
+
+    Example:
+        >>> with CaptureSession("workbook.xlsx") as session:
+        ...     session.capture("Dashboard", "dashboard.png")
+        ...     session.capture("Summary", "summary.png")
+    """
+
+    def __init__(self, wb_path: Union[str, Path]):
+        """Initialize the session.
+
+        Args:
+            wb_path: Path to the Excel workbook file
+        """
+        self.wb_path = Path(wb_path)
+        self._stack = ExitStack()
+        self._wb = None
+
+    def __enter__(self) -> "CaptureSession":
+        """Start Excel and open the workbook.
+
+        Raises:
+            NotImplementedError: If not running on Windows platform
+            ImportError: If required dependencies (xlwings, PIL) are not available
+            FileNotFoundError: If the workbook file doesn't exist
+            RuntimeError: If Excel fails to open the workbook
+        """
+        # Check platform compatibility
+        if platform.system() != "Windows":
+            raise NotImplementedError(
+                "COM screenshot capture is only supported on Windows platforms"
+            )
+
+        # Check dependencies
+        if xw is None:
+            raise ImportError("xlwings is required for COM screenshot capture")
+
+        if ImageGrab is None:
+            raise ImportError("PIL (Pillow) is required for clipboard image processing")
+
+        # Validate workbook file exists
+        if not self.wb_path.exists():
+            raise FileNotFoundError(f"Workbook file not found: {self.wb_path}")
+
+        try:
+            # Open Excel application with xlwings
+            app = self._stack.enter_context(xw.App(visible=True))
+
+            # Open the workbook, closing it again when the session ends
+            self._wb = app.books.open(str(self.wb_path.absolute()))
+            self._stack.callback(self._wb.close)
+        except Exception as e:
+            self._stack.close()
+            raise RuntimeError(f"Screenshot capture failed: {e}") from e
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the workbook and quit Excel."""
+        self._wb = None
+        self._stack.close()
 
-    # Check dependencies
-    if xw is None:
-        raise ImportError("xlwings is required for COM screenshot capture")
+    def capture(
+        self, sheet_name: str, png_path: Optional[Union[str, Path]] = None
+    ) -> Optional["Image.Image"]:
+        """Capture a screenshot of a sheet of the open workbook.
 
-    if ImageGrab is None:
-        raise ImportError("PIL (Pillow) is required for clipboard image processing")
+        Args:
+            sheet_name: Name of the sheet to capture
+            png_path: Output path for the PNG screenshot, or None to return
+                the captured image without writing it
 
-    # Convert paths to Path objects for consistent handling
-    wb_path = Path(wb_path)
-    png_path = Path(png_path)
+        Returns:
+            The captured PIL image if no png_path was given, otherwise None
 
-    # Validate workbook file exists
-    if not wb_path.exists():
-        raise FileNotFoundError(f"Workbook file not found: {wb_path}")
+        Raises:
+            ValueError: If the sheet name doesn't exist in the workbook
+            RuntimeError: If the session is not open or screenshot capture fails
+        """
+        if self._wb is None:
+            raise RuntimeError("Capture session is not open")
 
-    # Ensure output directory exists
-    png_path.parent.mkdir(parents=True, exist_ok=True)
+        if png_path is not None:
+            png_path = Path(png_path)
 
-    try:
-        # Open Excel application with xlwings
-        with xw.App(visible=True) as app:
-            # Open the workbook
-            wb = app.books.open(str(wb_path.absolute()))
+            # Ensure output directory exists
+            png_path.parent.mkdir(parents=True, exist_ok=True)
 
+        try:
+            # Activate the specified sheet
             try:
-                # Activate the specified sheet
-                try:
-                    sheet = wb.sheets[sheet_name]
-                    sheet.activate()
-                except KeyError:
-                    available_sheets = [s.name for s in wb.sheets]
-                    raise ValueError(
-                        f"Sheet '{sheet_name}' not found. "
-                        f"Available sheets: {available_sheets}"
-                    )
-
-                # Ensure the sheet window is active and properly sized
-                # Select a range to ensure the sheet is fully loaded
-                sheet.range("A1").select()
-
-                # Capture the entire sheet as picture to clipboard
-                # Uses Excel's COM API to copy the active sheet as a picture
-                sheet.api.UsedRange.CopyPicture(
-                    Appearance=1, Format=2  # xlScreen  # xlPicture
+                sheet = self._wb.sheets[sheet_name]
+                sheet.activate()
+            except KeyError:
+                available_sheets = [s.name for s in self._wb.sheets]
+                raise ValueError(
+                    f"Sheet '{sheet_name}' not found. "
+                    f"Available sheets: {available_sheets}"
                 )
 
-                # Get image from clipboard using PIL
-                image = ImageGrab.grabclipboard()  # type: ignore
+            # Ensure the sheet window is active and properly sized
+            # Select a range to ensure the sheet is fully loaded
+            sheet.range("A1").select()
 
-                if image is None:
-                    raise RuntimeError(
-                        "Failed to capture image from clipboard. "
-                        "Ensure Excel is properly displaying the sheet."
-                    )
+            # Capture the entire sheet as picture to clipboard
+            # Uses Excel's COM API to copy the active sheet as a picture
+            sheet.api.UsedRange.CopyPicture(
+                Appearance=1, Format=2  # xlScreen  # xlPicture
+            )
 
-                # Save the image as PNG
-                image.save(str(png_path), "PNG")  # type: ignore
+            # Get image from clipboard using PIL
+            image = ImageGrab.grabclipboard()  # type: ignore
 
-                # Verify the PNG file was created and has reasonable size
-                if not png_path.exists():
-                    raise RuntimeError(f"Failed to create PNG file: {png_path}")
+            if image is None:
+                raise RuntimeError(
+                    "Failed to capture image from clipboard. "
+                    "Ensure Excel is properly displaying the sheet."
+                )
 
-                file_size = png_path.stat().st_size
-                if file_size < 1000:  # Less than 1KB suggests an error
-                    raise RuntimeError(
-                        f"PNG file appears corrupted or empty (size: {file_size} bytes)"
-                    )
+            if png_path is None:
+                return image
 
-            finally:
-                # Always close the workbook
-                wb.close()
+            # Save the image as PNG
+            image.save(str(png_path), "PNG")  # type: ignore
 
-    except Exception as e:
-        # Clean up any partially created files on error
-        if png_path.exists():
-            try:
-                png_path.unlink()
-            except OSError:
-                pass
-
-        # Re-raise the original exception with additional context
-        if isinstance(
-            e, (NotImplementedError, ImportError, FileNotFoundError, ValueError)
-        ):
-            raise
-        else:
-            raise RuntimeError(f"Screenshot capture failed: {e}") from e
+            # Verify the PNG file was created and has reasonable size
+            if not png_path.exists():
+                raise RuntimeError(f"Failed to create PNG file: {png_path}")
+
+            file_size = png_path.stat().st_size
+            if file_size < 1000:  # Less than 1KB suggests an error
+                raise RuntimeError(
+                    f"PNG file appears corrupted or empty (size: {file_size} bytes)"
+                )
+
+        except Exception as e:
+            # Clean up any partially created files on error
+            if png_path is not None and png_path.exists():
+                try:
+                    png_path.unlink()
+                except OSError:
+                    pass
+
+            # Re-raise the original exception with additional context
+            if isinstance(e, ValueError):
+                raise
+            else:
+                raise RuntimeError(f"Screenshot capture failed: {e}") from e
+
+        return None
 
 
 def is_capture_supported() -> bool:
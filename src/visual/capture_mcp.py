@@ -1,10 +1,15 @@
 """MCP screenshot capture utility for cross-platform Excel automation."""
 
+import hashlib
+import json
+import os
 import platform
+import re
 import subprocess
 import tempfile
+import time
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 # MCP server interaction capabilities
 try:
@@ -15,6 +20,41 @@ try:
 except ImportError:
     MCP_AVAILABLE = False
 
+# Seconds allowed for the Node.js helper to render one sheet, or a batch
+_RENDER_TIMEOUT = 30
+_BATCH_RENDER_TIMEOUT = 120
+
+# Common error patterns in string results of MCP tool calls
+_MCP_ERROR_PATTERN = re.compile(r"error|failed|timeout|refused", re.IGNORECASE)
+
+# Limits of the sheet HTML cache: entries unused for a week are removed, and
+# the least recently used ones while the cache is larger than 64 MiB
+_HTML_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+_HTML_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _default_html_cache_dir() -> Path:
+    """Get the per-user directory for cached sheet HTML.
+
+    Returns:
+        Directory under LOCALAPPDATA on Windows, otherwise XDG_CACHE_HOME or
+        ~/.cache
+    """
+    if platform.system() == "Windows":
+        base = os.environ.get("LOCALAPPDATA")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = str(Path.home() / ".cache")
+        except RuntimeError:
+            base = tempfile.gettempdir()
+    return Path(base) / "sheetcheck" / "html"
+
+
+# Generated sheet HTML, reused while the workbook and the helper are unchanged
+_HTML_CACHE_DIR = _default_html_cache_dir()
+
 
 def capture_sheet_png(
     wb_path: Union[str, Path], sheet_name: str, png_path: Union[str, Path]
@@ -38,6 +78,120 @@ def capture_sheet_png(
     Example:
         >>> capture_sheet_png("workbook.xlsx", "Dashboard", "screenshot.png")
     """
+    wb_path = Path(wb_path)
+    _check_capture_available(wb_path)
+    _capture_png(Path(png_path), lambda: _generate_html_from_excel(wb_path, sheet_name))
+
+
+def capture_sheets_png(
+    wb_path: Union[str, Path],
+    sheets: Sequence[Tuple[str, Union[str, Path]]],
+) -> None:
+    """Capture screenshots of several Excel sheets using MCP.
+
+    The workbook is converted to HTML with a single Node.js run, instead of
+    starting Node.js and parsing the workbook again for every sheet.
+
+    Args:
+        wb_path: Path to the Excel workbook file
+        sheets: (sheet name, output PNG path) pairs to capture
+
+    Raises:
+        ImportError: If MCP Puppeteer tools are not available
+        FileNotFoundError: If the workbook file doesn't exist or Node.js not found
+        ValueError: If a sheet name doesn't exist in the workbook
+        RuntimeError: If HTML generation or screenshot capture fails
+
+    Example:
+        >>> capture_sheets_png(
+        ...     "workbook.xlsx", [("Dashboard", "dash.png"), ("Data", "data.png")]
+        ... )
+    """
+    sheets = list(sheets)
+    sheet_names = [sheet_name for sheet_name, _ in sheets]
+    with CaptureSession(wb_path, sheet_names) as session:
+        for sheet_name, png_path in sheets:
+            session.capture(sheet_name, png_path)
+
+
+class CaptureSession:
+    """MCP capture session that converts the workbook to HTML once.
+
+    The HTML of the sheets is generated by one Node.js run on the first
+    capture. Screenshots are still taken one at a time, since the MCP
+    Puppeteer server shows a single page.
+    """
+
+    def __init__(
+        self, wb_path: Union[str, Path], sheet_names: Optional[Sequence[str]] = None
+    ):
+        """Initialize the session.
+
+        Args:
+            wb_path: Path to the Excel workbook file
+            sheet_names: Sheets to convert to HTML, or None for all sheets
+        """
+        self.wb_path = Path(wb_path)
+        self._sheet_names = list(sheet_names) if sheet_names is not None else []
+        self._pages: Optional[Dict[str, str]] = None
+
+    def __enter__(self) -> "CaptureSession":
+        """Check that MCP capture is possible for the workbook.
+
+        Raises:
+            ImportError: If MCP Puppeteer tools are not available
+            FileNotFoundError: If the workbook file doesn't exist
+        """
+        _check_capture_available(self.wb_path)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Drop the generated HTML."""
+        self._pages = None
+
+    def capture(self, sheet_name: str, png_path: Union[str, Path]) -> None:
+        """Capture a screenshot of a sheet and save it as PNG.
+
+        Args:
+            sheet_name: Name of the sheet to capture
+            png_path: Output path for the PNG screenshot
+
+        Raises:
+            FileNotFoundError: If Node.js is not found
+            ValueError: If the sheet name doesn't exist in the workbook
+            RuntimeError: If HTML generation or screenshot capture fails
+        """
+        _capture_png(Path(png_path), lambda: self._sheet_html(sheet_name))
+
+    def _sheet_html(self, sheet_name: str) -> str:
+        """Get the HTML of a sheet, converting the workbook on first use."""
+        if self._pages is None:
+            # Sheets cached by an earlier run don't need the workbook converted
+            cached_html = _read_cached_html(self.wb_path, sheet_name)
+            if cached_html is not None:
+                return cached_html
+            self._pages = _generate_html_batch(self.wb_path, self._sheet_names)
+
+        if sheet_name not in self._pages:
+            if not self._sheet_names:
+                raise ValueError(f"Sheet '{sheet_name}' not found in workbook")
+            # Sheets outside the requested list are converted on their own
+            self._pages[sheet_name] = _generate_html_from_excel(
+                self.wb_path, sheet_name
+            )
+        return self._pages[sheet_name]
+
+
+def _check_capture_available(wb_path: Path) -> None:
+    """Check the MCP tools and the workbook before capturing.
+
+    Args:
+        wb_path: Path to the Excel workbook file
+
+    Raises:
+        ImportError: If MCP Puppeteer tools are not available
+        FileNotFoundError: If the workbook file doesn't exist
+    """
     # Check MCP availability
     if not MCP_AVAILABLE:
         raise ImportError(
@@ -45,14 +199,23 @@ def capture_sheet_png(
             "Ensure MCP server is running and permissions are set."
         )
 
-    # Convert paths to Path objects for consistent handling
-    wb_path = Path(wb_path)
-    png_path = Path(png_path)
-
     # Validate workbook file exists
     if not wb_path.exists():
         raise FileNotFoundError(f"Workbook file not found: {wb_path}")
 
+
+def _capture_png(png_path: Path, render_html: Callable[[], str]) -> None:
+    """Render a sheet to HTML and capture a screenshot of it as PNG.
+
+    Args:
+        png_path: Output path for the PNG screenshot
+        render_html: Function returning the HTML content of the sheet
+
+    Raises:
+        FileNotFoundError: If Node.js is not found
+        ValueError: If the sheet name doesn't exist in the workbook
+        RuntimeError: If HTML generation or screenshot capture fails
+    """
     # Ensure output directory exists
     png_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -64,7 +227,7 @@ def capture_sheet_png(
 
     try:
         # Generate HTML from Excel using Node.js helper
-        html_content = _generate_html_from_excel(wb_path, sheet_name)
+        html_content = render_html()
 
         # Write HTML to temporary file
         temp_html_path.write_text(html_content, encoding="utf-8")
@@ -121,6 +284,224 @@ def _generate_html_from_excel(wb_path: Path, sheet_name: str) -> str:
         ValueError: If sheet name doesn't exist
         RuntimeError: If HTML generation fails
     """
+    html_content = _read_cached_html(wb_path, sheet_name)
+    if html_content is None:
+        html_content = _run_render_script(
+            wb_path, [sheet_name], f"sheet '{sheet_name}'", _RENDER_TIMEOUT
+        )
+        _write_cached_html(wb_path, sheet_name, html_content)
+        _prune_html_cache()
+    return html_content
+
+
+def _generate_html_batch(wb_path: Path, sheet_names: Sequence[str]) -> Dict[str, str]:
+    """Generate HTML content for several sheets with one Node.js run.
+
+    Named sheets found in the HTML cache are not converted again; if all of
+    them are cached, Node.js isn't run at all.
+
+    Args:
+        wb_path: Path to Excel workbook
+        sheet_names: Names of sheets to convert, or empty for all sheets
+
+    Returns:
+        Dictionary mapping sheet names to HTML content
+
+    Raises:
+        FileNotFoundError: If Node.js or render_html.js not found
+        ValueError: If a sheet name doesn't exist
+        RuntimeError: If HTML generation fails
+    """
+    pages: Dict[str, str] = {}
+    for sheet_name in sheet_names:
+        html_content = _read_cached_html(wb_path, sheet_name)
+        if html_content is not None:
+            pages[sheet_name] = html_content
+
+    missing_names = [name for name in sheet_names if name not in pages]
+    if sheet_names and not missing_names:
+        return pages
+
+    output = _run_render_script(
+        wb_path, ["--batch", *missing_names], "workbook", _BATCH_RENDER_TIMEOUT
+    )
+
+    try:
+        rendered_pages = json.loads(output)
+    except ValueError as e:
+        raise RuntimeError(f"HTML generation produced invalid output: {e}") from e
+    if not isinstance(rendered_pages, dict):
+        raise RuntimeError("HTML generation produced invalid output")
+
+    for sheet_name, html_content in rendered_pages.items():
+        _write_cached_html(wb_path, sheet_name, html_content)
+    _prune_html_cache()
+    pages.update(rendered_pages)
+    return pages
+
+
+def _html_cache_dir() -> Optional[Path]:
+    """Create the HTML cache directory if needed and check that it is private.
+
+    Cached pages are loaded into the browser, so entries are only trusted in
+    a directory that belongs to the current user and that no other user can
+    access.
+
+    Returns:
+        The cache directory, or None if caching has to be skipped
+    """
+    try:
+        _HTML_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        dir_stat = _HTML_CACHE_DIR.stat()
+    except OSError:
+        return None
+
+    if hasattr(os, "getuid") and (
+        dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077
+    ):
+        return None
+    return _HTML_CACHE_DIR
+
+
+def _html_cache_path(wb_path: Path, sheet_name: str) -> Optional[Path]:
+    """Get the HTML cache file of a sheet.
+
+    The key covers the workbook path, size and modification time, the sheet
+    name and the Node.js helper itself, so any change gives a new entry.
+
+    Args:
+        wb_path: Path to Excel workbook
+        sheet_name: Name of the sheet
+
+    Returns:
+        Path of the cache file, or None if the workbook can't be read or
+        the cache directory isn't usable
+    """
+    cache_dir = _html_cache_dir()
+    if cache_dir is None:
+        return None
+
+    render_script = Path(__file__).parent.parent.parent / "tools" / "render_html.js"
+    try:
+        wb_stat = wb_path.stat()
+        script_stat = render_script.stat()
+        wb_key = wb_path.resolve()
+    except OSError:
+        return None
+
+    key = hashlib.sha1(
+        f"{wb_key}|{wb_stat.st_mtime_ns}|{wb_stat.st_size}|{sheet_name}|"
+        f"{script_stat.st_mtime_ns}|{script_stat.st_size}".encode("utf-8")
+    ).hexdigest()
+    return cache_dir / f"{key}.html"
+
+
+def _read_cached_html(wb_path: Path, sheet_name: str) -> Optional[str]:
+    """Read the cached HTML of a sheet.
+
+    Args:
+        wb_path: Path to Excel workbook
+        sheet_name: Name of the sheet
+
+    Returns:
+        Cached HTML content, or None if the sheet isn't cached
+    """
+    cache_path = _html_cache_path(wb_path, sheet_name)
+    if cache_path is None:
+        return None
+    try:
+        html_content = cache_path.read_text(encoding="utf-8")
+        # Mark the entry as recently used for _prune_html_cache
+        os.utime(cache_path)
+    except (OSError, UnicodeDecodeError):
+        return None
+    return html_content
+
+
+def _write_cached_html(wb_path: Path, sheet_name: str, html_content: str) -> None:
+    """Store the HTML of a sheet in the cache.
+
+    The file is written under a temporary name and moved into place, so
+    concurrent runs never read a partial entry. Caching is best effort:
+    write errors are ignored.
+
+    Args:
+        wb_path: Path to Excel workbook
+        sheet_name: Name of the sheet
+        html_content: HTML content generated for the sheet
+    """
+    cache_path = _html_cache_path(wb_path, sheet_name)
+    if cache_path is None:
+        return
+
+    temp_path = cache_path.with_name(f".{cache_path.stem}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_text(html_content, encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+    finally:
+        if temp_path.exists():
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+
+
+def _prune_html_cache() -> None:
+    """Remove expired HTML cache entries and keep the cache within its size.
+
+    Files are ordered by modification time, which reads refresh, so the
+    least recently used sheets are removed first. Pruning is best effort:
+    errors (e.g. a file already removed by a concurrent run) are ignored.
+    """
+    cache_dir = _html_cache_dir()
+    if cache_dir is None:
+        return
+
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                try:
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+    except OSError:
+        return
+
+    expiry = time.time() - _HTML_CACHE_MAX_AGE
+    total_size = 0
+    for mtime, size, path in sorted(entries, reverse=True):
+        if mtime < expiry or total_size + size > _HTML_CACHE_MAX_BYTES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        else:
+            total_size += size
+
+
+def _run_render_script(
+    wb_path: Path, args: List[str], target: str, timeout: int
+) -> str:
+    """Run the Node.js SheetJS helper and return its output.
+
+    Args:
+        wb_path: Path to Excel workbook
+        args: Arguments passed to render_html.js after the workbook path
+        target: Description of what is rendered, for error messages
+        timeout: Seconds to wait for the helper
+
+    Returns:
+        Standard output of the helper
+
+    Raises:
+        FileNotFoundError: If Node.js or render_html.js not found
+        ValueError: If a sheet name doesn't exist
+        RuntimeError: If HTML generation fails
+    """
     # Find the Node.js helper script
     project_root = Path(__file__).parent.parent.parent
     render_script = project_root / "tools" / "render_html.js"
@@ -133,19 +514,20 @@ def _generate_html_from_excel(wb_path: Path, sheet_name: str) -> str:
 
     try:
         # Run Node.js script to convert Excel to HTML
-        cmd = ["node", str(render_script), str(wb_path), sheet_name]
+        cmd = ["node", str(render_script), str(wb_path), *args]
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             encoding="utf-8",
-            timeout=30,  # 30-second timeout
+            timeout=timeout,
         )
 
         if result.returncode != 0:
             error_msg = result.stderr.strip()
             if "Sheet" in error_msg and "not found" in error_msg:
-                raise ValueError(f"Sheet '{sheet_name}' not found in workbook")
+                # First line is "Error: Sheet '<name>' not found in workbook"
+                raise ValueError(error_msg.splitlines()[0].replace("Error: ", "", 1))
             elif "File not found" in error_msg:
                 raise FileNotFoundError(f"Workbook file not found: {wb_path}")
             else:
@@ -159,7 +541,7 @@ def _generate_html_from_excel(wb_path: Path, sheet_name: str) -> str:
 
     except subprocess.TimeoutExpired:
         raise RuntimeError(
-            f"HTML generation timed out after 30 seconds for sheet '{sheet_name}'"
+            f"HTML generation timed out after {timeout} seconds for {target}"
         )
     except FileNotFoundError as e:
         if "node" in str(e).lower():
@@ -230,9 +612,7 @@ def _is_mcp_success(result: Any) -> bool:
 
     # For string results, check for common error patterns
     if isinstance(result, str):
-        error_patterns = ["error", "failed", "timeout", "refused"]
-        result_lower = result.lower()
-        return not any(pattern in result_lower for pattern in error_patterns)
+        return _MCP_ERROR_PATTERN.search(result) is None
 
     # For other types, assume success if result exists
     return result is not None
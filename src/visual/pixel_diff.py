@@ -4,10 +4,20 @@ import math
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
+import numpy as np
+
 try:
-    from PIL import Image  # type: ignore
+    from PIL import Image, ImageChops  # type: ignore
 except ImportError:
     Image = None  # type: ignore
+    ImageChops = None  # type: ignore
+
+# Largest possible squared RGBA distance and its square root
+_MAX_SQUARED_DISTANCE = 4 * 255 * 255
+_MAX_DISTANCE = math.sqrt(_MAX_SQUARED_DISTANCE)
+
+# Rows of pixels compared at a time
+_TILE_ROWS = 128
 
 
 def diff_png(
@@ -67,10 +77,81 @@ def diff_png(
     if not actual_path.exists():
         raise FileNotFoundError(f"Actual image not found: {actual_path}")
 
+    return _diff_images(baseline_path, actual_path, threshold, diff_output_path)
+
+
+def diff_image(
+    baseline_path: Union[str, Path],
+    actual_image: "Image.Image",
+    threshold: float = 0.02,
+    diff_output_path: Optional[Union[str, Path]] = None,
+) -> float:
+    """Compare an in-memory image against a baseline PNG.
+
+    Same comparison as diff_png, for screenshots that were captured without
+    being written to disk.
+
+    Args:
+        baseline_path: Path to the baseline/expected PNG image
+        actual_image: Captured PIL image
+        threshold: Sensitivity threshold (0.0-1.0). Lower values are more sensitive.
+        diff_output_path: Optional path to save diff overlay image showing differences
+
+    Returns:
+        Float ratio (0.0-1.0) representing percentage of differing pixels.
+
+    Raises:
+        ImportError: If PIL (Pillow) is not available
+        FileNotFoundError: If the baseline image file doesn't exist
+        ValueError: If images have different dimensions or invalid threshold
+        RuntimeError: If image processing fails
+    """
+    # Validate PIL dependency
+    if Image is None:
+        raise ImportError("PIL (Pillow) is required for image comparison")
+
+    # Validate threshold
+    if not 0.0 <= threshold <= 1.0:
+        raise ValueError(f"Threshold must be between 0.0 and 1.0, got {threshold}")
+
+    baseline_path = Path(baseline_path)
+    if diff_output_path:
+        diff_output_path = Path(diff_output_path)
+
+    if not baseline_path.exists():
+        raise FileNotFoundError(f"Baseline image not found: {baseline_path}")
+
+    return _diff_images(baseline_path, actual_image, threshold, diff_output_path)
+
+
+def _diff_images(
+    baseline: Union[Path, "Image.Image"],
+    actual: Union[Path, "Image.Image"],
+    threshold: float,
+    diff_output_path: Optional[Path],
+) -> float:
+    """Count the pixels that differ between two images.
+
+    Args:
+        baseline: Path to the baseline PNG, or the loaded PIL image
+        actual: Path to the actual PNG, or the loaded PIL image
+        threshold: Validated sensitivity threshold (0.0-1.0)
+        diff_output_path: Optional path to save diff overlay image
+
+    Returns:
+        Ratio (0.0-1.0) of differing pixels
+
+    Raises:
+        ValueError: If images have different dimensions
+        RuntimeError: If image processing fails
+    """
     try:
         # Load images
-        baseline_img = Image.open(baseline_path).convert("RGBA")
-        actual_img = Image.open(actual_path).convert("RGBA")
+        if isinstance(baseline, Path):
+            baseline = Image.open(baseline)
+        if isinstance(actual, Path):
+            actual = Image.open(actual)
+        baseline_img, actual_img = _comparable_images(baseline, actual)
 
         # Validate dimensions match
         if baseline_img.size != actual_img.size:
@@ -82,8 +163,12 @@ def diff_png(
         width, height = baseline_img.size
         total_pixels = width * height
 
+        # Bounding box of the changed region; spreadsheet diffs are usually
+        # a few cells, so only that region is compared pixel by pixel
+        bbox = _difference_bbox(baseline_img, actual_img)
+
         # If images are identical, return early
-        if list(baseline_img.getdata()) == list(actual_img.getdata()):
+        if bbox is None:
             if diff_output_path:
                 # Ensure output directory exists
                 diff_output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -92,42 +177,43 @@ def diff_png(
                 diff_img.save(diff_output_path, "PNG")
             return 0.0
 
-        # Compare pixels and count differences
-        baseline_pixels = baseline_img.getdata()
-        actual_pixels = actual_img.getdata()
+        # Keep original pixels of the overlay but make them semi-transparent
+        overlay = None
+        if diff_output_path:
+            overlay = np.array(_to_rgba(actual_img), dtype=np.uint8)
+            overlay[..., 3] //= 4
 
-        diff_pixels = []
+        # Compare the changed region in bands of rows, so the int32 working
+        # arrays stay small however large the screenshots are
+        limit = _squared_distance_limit(threshold)
+        left, top, right, bottom = bbox
         different_pixel_count = 0
-
-        for i, (baseline_pixel, actual_pixel) in enumerate(
-            zip(baseline_pixels, actual_pixels)
-        ):
-            # Calculate pixel difference using Euclidean distance in RGBA space
-            pixel_diff = _calculate_pixel_difference(baseline_pixel, actual_pixel)
-
-            # Check if difference exceeds threshold
-            is_different = pixel_diff > threshold
-
-            if is_different:
-                different_pixel_count += 1
-
-            # Prepare diff pixel for overlay image
-            if diff_output_path:
-                if is_different:
-                    # Highlight different pixels in red with intensity based on diff
-                    intensity = min(255, int(pixel_diff * 255))
-                    diff_pixels.append((intensity, 0, 0, 255))
-                else:
-                    # Keep original pixel but make it semi-transparent
-                    r, g, b, a = (
-                        actual_pixel if len(actual_pixel) == 4 else (*actual_pixel, 255)
-                    )
-                    diff_pixels.append((r, g, b, a // 4))
-
-        # Generate diff overlay image if requested
-        if diff_output_path:
-            diff_img = Image.new("RGBA", (width, height))
-            diff_img.putdata(diff_pixels)
+        for tile_top in range(top, bottom, _TILE_ROWS):
+            tile_box = (left, tile_top, right, min(tile_top + _TILE_ROWS, bottom))
+
+            # Squared Euclidean distance of every pixel in RGBA space; compared
+            # against the smallest squared distance that exceeds the threshold,
+            # so the square root is only taken for overlay pixels
+            baseline_arr = np.asarray(baseline_img.crop(tile_box), dtype=np.int32)
+            actual_arr = np.asarray(actual_img.crop(tile_box), dtype=np.int32)
+            squared_distance = ((baseline_arr - actual_arr) ** 2).sum(axis=-1)
+
+            # Check which pixels differ beyond the threshold
+            is_different = squared_distance >= limit
+            different_pixel_count += int(np.count_nonzero(is_different))
+
+            if overlay is not None:
+                # Highlight different pixels in red with intensity based on diff
+                region = overlay[tile_top : tile_box[3], left:right]
+                pixel_diff = np.sqrt(squared_distance[is_different]) / _MAX_DISTANCE
+                intensity = np.minimum(pixel_diff * 255, 255)
+                region[is_different] = 0
+                region[is_different, 0] = intensity.astype(np.uint8)
+                region[is_different, 3] = 255
+
+        # Save diff overlay image if requested
+        if overlay is not None:
+            diff_img = Image.fromarray(overlay)
 
             # Ensure output directory exists
             diff_output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -144,37 +230,76 @@ def diff_png(
             raise RuntimeError(f"Image comparison failed: {e}") from e
 
 
-def _calculate_pixel_difference(
-    pixel1: Tuple[int, ...], pixel2: Tuple[int, ...]
-) -> float:
-    """Calculate normalized difference between two RGBA pixels.
+def _comparable_images(
+    baseline: "Image.Image", actual: "Image.Image"
+) -> Tuple["Image.Image", "Image.Image"]:
+    """Bring two images to a common mode for comparison.
+
+    RGB pairs are compared as they are: converting them to RGBA would only
+    add an opaque alpha band to both, which adds nothing to the distance.
+    Other pairs are compared in RGBA, converting only what isn't RGBA yet.
+
+    Args:
+        baseline: Baseline image
+        actual: Actual image
+
+    Returns:
+        Tuple of (baseline, actual) images, both RGB or both RGBA
+    """
+    if baseline.mode == actual.mode and baseline.mode in ("RGB", "RGBA"):
+        return baseline, actual
+    return _to_rgba(baseline), _to_rgba(actual)
 
-    Uses Euclidean distance in RGBA color space, normalized to 0.0-1.0 range.
+
+def _to_rgba(image: "Image.Image") -> "Image.Image":
+    """Convert an image to RGBA unless it already is."""
+    return image if image.mode == "RGBA" else image.convert("RGBA")
+
+
+def _difference_bbox(
+    baseline_img: "Image.Image", actual_img: "Image.Image"
+) -> Optional[Tuple[int, int, int, int]]:
+    """Find the bounding box of the pixels that differ between two images.
+
+    getbbox() of an RGBA image may only look at its alpha band, so the
+    per-band differences are merged into one band first.
 
     Args:
-        pixel1: First pixel as (R, G, B, A) tuple
-        pixel2: Second pixel as (R, G, B, A) tuple
+        baseline_img: Baseline image in RGB or RGBA mode
+        actual_img: Actual image in the same mode and size as the baseline
 
     Returns:
-        Normalized difference value (0.0 = identical, 1.0 = maximally different)
+        (left, top, right, bottom) box, or None if the images are identical
     """
-    # Ensure both pixels have RGBA components
-    p1 = pixel1 if len(pixel1) == 4 else (*pixel1, 255)
-    p2 = pixel2 if len(pixel2) == 4 else (*pixel2, 255)
+    bands = ImageChops.difference(baseline_img, actual_img).split()
+    merged = bands[0]
+    for band in bands[1:]:
+        merged = ImageChops.lighter(merged, band)
+    return merged.getbbox()
 
-    # Calculate Euclidean distance in RGBA space
-    r_diff = (p1[0] - p2[0]) ** 2
-    g_diff = (p1[1] - p2[1]) ** 2
-    b_diff = (p1[2] - p2[2]) ** 2
-    a_diff = (p1[3] - p2[3]) ** 2
 
-    euclidean_distance = math.sqrt(r_diff + g_diff + b_diff + a_diff)
+def _squared_distance_limit(threshold: float) -> int:
+    """Find the smallest squared RGBA distance that counts as different.
 
-    # Normalize to 0.0-1.0 range (max possible distance is sqrt(4 * 255^2))
-    max_distance = math.sqrt(4 * 255 * 255)
-    normalized_diff = euclidean_distance / max_distance
+    A pixel differs when its normalized distance, sqrt(d2) / _MAX_DISTANCE,
+    exceeds the threshold. Both steps are monotonic, so the differing
+    squared distances d2 (integers up to 4 * 255^2) are exactly those at
+    or above a limit, found here with the same floating point formula.
 
-    return normalized_diff
+    Args:
+        threshold: Validated sensitivity threshold (0.0-1.0)
+
+    Returns:
+        Limit on squared distances; above 4 * 255^2 if no pixel can differ
+    """
+    low, high = 0, _MAX_SQUARED_DISTANCE + 1
+    while low < high:
+        middle = (low + high) // 2
+        if math.sqrt(middle) / _MAX_DISTANCE > threshold:
+            high = middle
+        else:
+            low = middle + 1
+    return low
 
 
 def is_diff_supported() -> bool:
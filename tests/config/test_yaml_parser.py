@@ -1,5 +1,7 @@
 """Tests for YAML rule parser."""
 
+import sys
+
 import pytest
 
 from src.validator.config import (
@@ -28,8 +30,9 @@ def test_bad_yaml(tmp_path):
 
 def test_missing_file():
     """Test error handling for missing file."""
-    with pytest.raises(RuleConfigError, match="Rules file not found"):
+    with pytest.raises(RuleConfigError, match="Rules file not found") as exc_info:
         load_rules("nonexistent.yaml")
+    assert isinstance(exc_info.value.__cause__, FileNotFoundError)
 
 
 def test_empty_file(tmp_path):
@@ -93,6 +96,15 @@ def test_invalid_sheet_config(tmp_path):
         load_rules(yml)
 
 
+def test_sheets_section_not_a_mapping(tmp_path):
+    """Test that a malformed sheets section keeps the underlying error."""
+    yml = tmp_path / "sheet_list.yaml"
+    yml.write_text("sheets:\n  - Sheet1\n  - Sheet2\n")
+    with pytest.raises(RuleConfigError, match="Error parsing configuration") as exc_info:
+        load_rules(yml)
+    assert isinstance(exc_info.value.__cause__, AttributeError)
+
+
 def test_default_values(tmp_path):
     """Test that default values are applied correctly."""
     yml = tmp_path / "minimal.yaml"
@@ -122,3 +134,71 @@ def test_dataclass_types():
     assert sheet_cfg.must_exist is True
     assert sheet_cfg.cells == {}
     assert sheet_cfg.expect_cf_rules == []
+    assert sheet_cfg.objects == []
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+def test_sheet_cfg_has_no_instance_dict():
+    """Test that config records are slotted."""
+    sheet_cfg = SheetCfg()
+    assert not hasattr(sheet_cfg, "__dict__")
+    assert not hasattr(RuleConfig(), "__dict__")
+
+    with pytest.raises(AttributeError):
+        sheet_cfg.must_exsit = True  # Typos no longer create new attributes
+
+
+def test_sheet_names_interned(tmp_path):
+    """Test that sheet names are interned and numeric names are kept as is."""
+    yml = tmp_path / "names.yaml"
+    yml.write_text("sheets:\n  Summary Report:\n    must_exist: true\n  2024: {}\n")
+    cfg = load_rules(yml)
+
+    name = next(key for key in cfg.sheets if isinstance(key, str))
+    assert name is sys.intern("".join(["Summary", " Report"]))
+    assert 2024 in cfg.sheets
+
+
+def test_object_rules_parsed():
+    """Test that object position expectations are loaded into the sheet config."""
+    cfg = load_rules("tests/fixtures/rule_obj.yaml")
+    objects = cfg.sheets["Dashboard"].objects
+    assert [obj["name"] for obj in objects] == ["RefreshButton"]
+    assert objects[0]["expect_position"]["tolerance"] == 5
+
+
+def test_parsed_yaml_cached_until_file_changes(tmp_path):
+    """Test that unchanged rule files are parsed once and edits are picked up."""
+    from src.validator import config as config_module
+
+    yml = tmp_path / "cached.yaml"
+    yml.write_text("sheets:\n  Sheet1:\n    must_exist: true\n")
+    cfg = load_rules(yml)
+    cfg.sheets["Sheet1"].cells["A1"] = {"formula": "=1"}
+
+    keys = [key for key in config_module._YAML_CACHE if key[0] == str(yml.resolve())]
+    assert len(keys) == 1
+    assert load_rules(yml).sheets["Sheet1"].cells == {}
+
+    yml.write_text("sheets:\n  Sheet1:\n    must_exist: false\n  Sheet2: {}\n")
+    cfg = load_rules(yml)
+    assert cfg.sheets["Sheet1"].must_exist is False
+    assert "Sheet2" in cfg.sheets
+
+
+def test_load_rules_reads_file_once(tmp_path):
+    """Test that detecting the rule type doesn't read the file a second time."""
+    from unittest.mock import patch
+
+    from src.validator import config as config_module
+
+    yml = tmp_path / "once.yaml"
+    yml.write_text("sheets:\n  Sheet1:\n    must_exist: true\n")
+
+    with patch.object(
+        config_module, "_read_yaml", wraps=config_module._read_yaml
+    ) as mock_read:
+        cfg = load_rules(yml)
+
+    assert cfg.sheets["Sheet1"].must_exist is True
+    mock_read.assert_called_once()
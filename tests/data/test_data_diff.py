@@ -88,4 +88,59 @@ def test_data_diff_rule_handles_nonexistent_file():
     # Should return error failure
     assert len(failures) == 1
     assert failures[0].type == "diff_error"
-    assert "xlcompare failed" in failures[0].message
\ No newline at end of file
+    assert "nonexistent.xlsx" in failures[0].message
+
+def test_data_diff_rule_detects_deleted_rows():
+    """Test that DataDiffRule reports rows missing from the new workbook."""
+    rule = DataDiffRule("Sheet1", None)
+    
+    old_path = Path("tests/fixtures/new_small_changed.xlsx")
+    new_path = Path("tests/fixtures/old_small.xlsx")
+    
+    failures = rule.run_diff(old_path, new_path)
+    
+    row_deletions = [f for f in failures if f.type == "row_deleted"]
+    assert len(row_deletions) == 1
+    assert "ID=5" in row_deletions[0].message
+    assert row_deletions[0].expected == "Row 6"
+
+
+def test_data_diff_rule_detects_type_only_changes(tmp_path):
+    """Test that values equal across types (1 vs True) are reported as changed."""
+    from openpyxl import Workbook
+
+    paths = []
+    for name, value in (("old.xlsx", 1), ("new.xlsx", True)):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["ID", "Flag", "Qty"])
+        ws.append([1, value, 10])
+        path = tmp_path / name
+        wb.save(path)
+        paths.append(path)
+    
+    rule = DataDiffRule("Sheet", None)
+    failures = rule.run_diff(*paths)
+    
+    assert len(failures) == 1
+    assert failures[0].type == "cell_changed"
+    assert failures[0].cell == "B2"
+    assert failures[0].expected == "1"
+    assert failures[0].found == "True"
+
+
+def test_data_diff_rule_identical_copies_skip_parsing(tmp_path, monkeypatch):
+    """Test that byte-identical workbooks are not parsed at all."""
+    import shutil
+    
+    copy_path = tmp_path / "copy.xlsx"
+    shutil.copyfile("tests/fixtures/old_small.xlsx", copy_path)
+    
+    rule = DataDiffRule("Sheet1", None)
+    
+    def fail_load(path):
+        raise AssertionError("workbook should not be parsed")
+    
+    monkeypatch.setattr(rule, "_load_sheet", fail_load)
+    
+    assert rule.run_diff(Path("tests/fixtures/old_small.xlsx"), copy_path) == []
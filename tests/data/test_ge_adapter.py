@@ -19,7 +19,10 @@ except ImportError:
 from src.data.ge_adapter import (
     ValidationResult,
     run_expectations,
+    run_expectations_df,
+    run_expectations_batch,
     is_ge_supported,
+    worksheet_to_dataframe,
     create_sample_rule_yaml,
 )
 
@@ -176,6 +179,36 @@ class TestRunExpectations:
         assert result_str.success is True
         assert result_path.success is True
 
+    def test_run_expectations_df_matches_file_based_run(self):
+        """Test validating an in-memory DataFrame gives the same result."""
+        df = pd.read_excel(self.excel_path, sheet_name="Data")
+
+        result = run_expectations_df(df, self.rule_path)
+
+        assert isinstance(result, ValidationResult)
+        assert result.success is True
+        assert result.rule_path == str(self.rule_path)
+
+    def test_run_expectations_batch(self):
+        """Test running several rule files against one workbook in parallel."""
+        second_rule_path = self.temp_dir / "second_rule.yaml"
+        second_rule_path.write_text(self.rule_path.read_text())
+
+        results = run_expectations_batch(
+            self.excel_path, [self.rule_path, second_rule_path], max_workers=2
+        )
+
+        assert [r.rule_path for r in results] == [
+            str(self.rule_path),
+            str(second_rule_path),
+        ]
+        assert all(r.success for r in results)
+
+    def test_run_expectations_df_empty_dataframe(self):
+        """Test that an empty DataFrame is rejected like an empty sheet."""
+        with pytest.raises(ValueError, match="contains no data"):
+            run_expectations_df(pd.DataFrame(), self.rule_path)
+
     def test_excel_with_data_containing_nulls(self):
         """Test validation failure when data contains null values."""
         # Create Excel file with null values
@@ -204,6 +237,36 @@ class TestRunExpectations:
         summary = result.get_failure_summary()
         assert "validation failures" in summary
 
+    def test_target_nrows_and_usecols(self):
+        """Test that target.nrows/usecols limit the data that is validated."""
+        limited_excel_path = self.temp_dir / "limited.xlsx"
+        pd.DataFrame(
+            {
+                "id": [1, 2, None],  # Null only in the third row
+                "note": [None, None, None],  # Not read at all
+            }
+        ).to_excel(limited_excel_path, sheet_name="Data", index=False)
+
+        limited_rule_path = self.temp_dir / "limited_rule.yaml"
+        with open(limited_rule_path, "w") as f:
+            f.write(
+                """
+rule_type: data_validation
+target:
+  sheet: Data
+  nrows: 2
+  usecols: [id]
+expectations:
+  - expectation_type: expect_column_values_to_not_be_null
+    kwargs:
+      column: id
+"""
+            )
+
+        result = run_expectations(limited_excel_path, limited_rule_path)
+
+        assert result.success is True
+
     def test_nonexistent_sheet(self):
         """Test error handling for nonexistent sheet name."""
         # Create rule targeting nonexistent sheet
@@ -382,3 +445,64 @@ expectations:
 
         with pytest.raises((yaml.YAMLError, ValueError, RuntimeError)):
             run_expectations("tests/fixtures/data_sample.xlsx", bad_yaml_path)
+
+    @pytest.mark.skipif(pd is None, reason="pandas not available")
+    def test_worksheet_frame_matches_read_excel(self):
+        """Test that in-memory frames match pd.read_excel of the saved file."""
+        from openpyxl import Workbook
+
+        excel_path = self.temp_dir / "semantics.xlsx"
+        source = Workbook()
+        source.active.append(["id", "id", "amount", "double", "status"])
+        source.active.append([1, "a", 1.5, "=A2*2", "#N/A"])
+        source.active.append([2, None, 3, "=A3*2", "ok"])
+        source.save(excel_path)
+
+        for read_options in ({}, {"nrows": 1}, {"usecols": ["id", "double"]}):
+            df = worksheet_to_dataframe(source.active, **read_options)
+            expected = pd.read_excel(excel_path, engine="openpyxl", **read_options)
+            pd.testing.assert_frame_equal(df, expected)
+
+        df = worksheet_to_dataframe(source.active)
+        assert list(df.columns) == ["id", "id.1", "amount", "double", "status"]
+        assert df["double"].isna().all()
+        assert df["amount"].dtype == "float64"
+        assert pd.isna(df.loc[0, "status"])
+
+    @pytest.mark.skipif(pd is None, reason="pandas not available")
+    def test_worksheet_frame_unknown_usecols(self):
+        """Test that unknown usecols raise like pd.read_excel."""
+        from openpyxl import Workbook
+
+        source = Workbook()
+        source.active.append(["id"])
+        source.active.append([1])
+
+        with pytest.raises(ValueError, match="missing"):
+            worksheet_to_dataframe(source.active, usecols=["missing"])
+
+    @pytest.mark.skipif(pd is None, reason="pandas not available")
+    def test_unsized_read_only_worksheet(self):
+        """Test that read-only sheets without dimensions keep rows padded."""
+        from openpyxl import Workbook, load_workbook
+
+        excel_path = self.temp_dir / "ragged.xlsx"
+        source = Workbook()
+        source.active.append(["id", "name"])
+        source.active.append([1])
+        source.active.append([2, "b", "extra"])
+        source.save(excel_path)
+
+        wb = load_workbook(excel_path, read_only=True)
+        try:
+            worksheet = wb.worksheets[0]
+            expected = worksheet_to_dataframe(worksheet)
+
+            # Simulate a file written without a <dimension> tag
+            worksheet.reset_dimensions()
+            df = worksheet_to_dataframe(worksheet)
+        finally:
+            wb.close()
+
+        assert df.shape == (2, 3)
+        pd.testing.assert_frame_equal(df, expected)
@@ -296,6 +296,30 @@ class TestDataValidationRuleIntegration:
         rule = DataValidationRule(str(self.rule_file), None)
         assert rule.rule_file_path == self.rule_file
 
+    def test_data_rules_share_sheet_frames(self):
+        """Test that rules with a shared frame cache build each sheet's DataFrame once."""
+        from unittest.mock import patch
+
+        from openpyxl import load_workbook
+
+        from src.data import DataValidationRule
+        from src.data import data_rule
+
+        pytest.importorskip("great_expectations")
+
+        workbook = load_workbook(self.bad_data_file)
+        frame_cache = {}
+
+        with patch.object(
+            data_rule, "worksheet_to_dataframe", wraps=data_rule.worksheet_to_dataframe
+        ) as to_dataframe:
+            first = DataValidationRule(str(self.rule_file), None, frame_cache).run(workbook)
+            second = DataValidationRule(str(self.rule_file), None, frame_cache).run(workbook)
+
+        assert to_dataframe.call_count == 1
+        assert len(first) > 0
+        assert [f.to_dict() for f in first] == [f.to_dict() for f in second]
+
     def test_validation_failure_serialization(self):
         """Test that ValidationFailure with data validation fields serializes correctly."""
         from src.structural.base import ValidationFailure
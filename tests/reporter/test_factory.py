@@ -145,4 +145,64 @@ def test_create_reporters_default_output_dir():
     
     assert len(reporters) == 1
     assert isinstance(reporters[0], JSONReporter)
-    assert reporters[0].output_dir == Path("reports")
\ No newline at end of file
+    assert reporters[0].output_dir == Path("reports")
+
+def test_reporter_factory_run_all_converts_failures_once(monkeypatch):
+    """Test that run_all shares to_dict() results across reporters."""
+    from src.structural.base import ValidationFailure
+    
+    calls = []
+    original_to_dict = ValidationFailure.to_dict
+    
+    def counting_to_dict(self):
+        calls.append(self)
+        return original_to_dict(self)
+    
+    monkeypatch.setattr(ValidationFailure, "to_dict", counting_to_dict)
+    
+    failures = [ValidationFailure(type="sheet_missing", sheet="Sheet1")]
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reporters = create_reporters("json,xml,md", Path(tmpdir))
+        output_paths = ReporterFactory.run_all(reporters, failures, [], [])
+        
+        assert [p.name for p in output_paths] == ["results.json", "results.xml", "results.md"]
+        assert all(p.exists() for p in output_paths)
+        assert "sheet_missing" in output_paths[1].read_text()
+    
+    assert len(calls) == 1
+
+
+def test_create_reporters_imports_only_requested_formats():
+    """Test that reporter modules are only imported when their format is used."""
+    import subprocess
+    import sys
+    
+    code = (
+        "import sys\n"
+        "from src.reporter import create_reporters\n"
+        "create_reporters('json')\n"
+        "print('src.reporter.json_reporter' in sys.modules,"
+        " 'src.reporter.xml_reporter' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    
+    assert result.stdout.split() == ["True", "False"]
+
+
+def test_reporter_factory_run_all_same_file_formats():
+    """Test that aliases writing the same file still produce a valid report."""
+    from src.structural.base import ValidationFailure
+    
+    failures = [ValidationFailure(type="sheet_missing", sheet="Sheet1")]
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reporters = create_reporters("md,markdown,json", Path(tmpdir))
+        output_paths = ReporterFactory.run_all(reporters, failures, [], [])
+        
+        assert output_paths[0] == output_paths[1]
+        assert output_paths[0].read_text(encoding="utf-8") == reporters[0].generate_report(
+            failures, [], []
+        )
@@ -1,5 +1,6 @@
 """Tests for JSONReporter class."""
 
+import io
 import json
 import tempfile
 from pathlib import Path
@@ -109,4 +110,110 @@ def test_json_reporter_custom_filename():
         output_path = reporter.write_to_file([], [], [], "custom.json")
         
         assert output_path.exists()
-        assert output_path.name == "custom.json"
\ No newline at end of file
+        assert output_path.name == "custom.json"
+
+def test_json_reporter_stdlib_fallback_matches(monkeypatch):
+    """Test that the stdlib encoder produces the same report as orjson."""
+    import src.reporter.json_reporter as json_reporter_module
+    
+    reporter = JSONReporter()
+    failures = [
+        ValidationFailure(
+            type="cf_rule_missing",
+            sheet="Sheet1",
+            range="A1:A10",
+            expected={"type": "colorScale", "colors": ["FF0000", "00FF00"]},
+            found=None,
+            tolerance=5
+        )
+    ]
+    
+    default_result = reporter.generate_report(failures, [], [])
+    monkeypatch.setattr(json_reporter_module, "orjson", None)
+    fallback_result = reporter.generate_report(failures, [], [])
+    
+    assert json.loads(default_result) == json.loads(fallback_result)
+
+
+def test_json_reporter_written_file_matches_generated_report():
+    """Test that the written file is byte-for-byte the generated report."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reporter = JSONReporter(Path(tmpdir))
+        failures = [ValidationFailure(type="test_failure", message="Größe ✓")]
+        
+        output_path = reporter.write_to_file(failures, [], [])
+        
+        expected = reporter.generate_report(failures, [], [])
+        assert output_path.read_bytes() == expected.encode("utf-8")
+
+
+def test_json_reporter_compact_output(monkeypatch):
+    """Test that compact mode writes the same data without whitespace."""
+    import src.reporter.json_reporter as json_reporter_module
+    
+    failures = [ValidationFailure(type="test_failure", sheet="Sheet1", cell="A1")]
+    indented = JSONReporter().generate_report(failures, [], [])
+    
+    compact = JSONReporter(compact=True).generate_report(failures, [], [])
+    monkeypatch.setattr(json_reporter_module, "orjson", None)
+    compact_fallback = JSONReporter(compact=True).generate_report(failures, [], [])
+    
+    for result in (compact, compact_fallback):
+        assert "\n" not in result
+        assert ": " not in result
+        assert json.loads(result) == json.loads(indented)
+
+
+def test_json_reporter_stream_uses_text_newlines(monkeypatch):
+    """Test that both encoders write through the file's newline translation."""
+    import src.reporter.json_reporter as json_reporter_module
+
+    reporter = JSONReporter()
+    failures = [ValidationFailure(type="test_failure", message="Line")]
+
+    contents = []
+    for encoder in (json_reporter_module.orjson, None):
+        monkeypatch.setattr(json_reporter_module, "orjson", encoder)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "report.json"
+            with open(path, "w", encoding="utf-8", newline="\r\n") as f:
+                reporter.generate_report_stream(f, failures, [], [])
+            contents.append(path.read_bytes())
+
+    assert b"\r\n" in contents[0]
+    assert b"\n" not in contents[0].replace(b"\r\n", b"")
+    assert json.loads(contents[0]) == json.loads(contents[1])
+
+
+def test_json_reporter_binary_write_matches_generated_report():
+    """Test that the binary write path encodes the same report."""
+    failures = [ValidationFailure(type="test_failure", message="Größe ✓")]
+
+    for compact in (False, True):
+        reporter = JSONReporter(compact=compact)
+        assert reporter.writes_bytes
+
+        for failure_list in ([], failures):
+            buf = io.BytesIO()
+            reporter.generate_report_bytes_from_dicts(
+                buf, [failure.to_dict() for failure in failure_list], [], []
+            )
+            expected = reporter.generate_report(failure_list, [], [])
+            assert buf.getvalue() == expected.encode("utf-8")
+
+
+def test_json_reporter_text_write_without_orjson(monkeypatch):
+    """Test that report files are written as text when orjson is missing."""
+    import src.reporter.json_reporter as json_reporter_module
+
+    monkeypatch.setattr(json_reporter_module, "orjson", None)
+    failures = [ValidationFailure(type="test_failure", message="Größe ✓")]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reporter = JSONReporter(Path(tmpdir))
+        assert not reporter.writes_bytes
+
+        output_path = reporter.write_to_file(failures, [], [])
+
+        expected = reporter.generate_report(failures, [], [])
+        assert output_path.read_text(encoding="utf-8") == expected
@@ -1,5 +1,6 @@
 """Tests for MarkdownReporter class."""
 
+import io
 import tempfile
 from pathlib import Path
 
@@ -105,8 +106,9 @@ def test_markdown_reporter_format_failure():
         fix_hint="How to fix this"
     )
     
-    lines = reporter._format_failure(1, failure)
-    formatted = "\n".join(lines)
+    buf = io.StringIO()
+    reporter._format_failure(buf.write, 1, failure)
+    formatted = buf.getvalue()
     
     assert "### 1. test_failure" in formatted
     assert "**Message:** Test failure message" in formatted
@@ -1,5 +1,6 @@
 """Tests for XMLReporter class."""
 
+import io
 import tempfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -76,18 +77,18 @@ def test_xml_reporter_generate_report_with_failures():
     assert len(structural) == 1
     
     failure = structural.find("Failure")
-    assert failure.find("type").text == "sheet_missing"
-    assert failure.find("sheet").text == "TestSheet"
-    assert failure.find("message").text == "Sheet does not exist"
-    assert failure.find("fix_hint").text == "Create the sheet"
+    assert failure.get("type") == "sheet_missing"
+    assert failure.get("sheet") == "TestSheet"
+    assert failure.get("message") == "Sheet does not exist"
+    assert failure.get("fix_hint") == "Create the sheet"
     
     # Check data failures
     data = root.find("DataFailures")
     assert len(data) == 1
     
     failure = data.find("Failure")
-    assert failure.find("type").text == "data_validation"
-    assert failure.find("cell").text == "A1"
+    assert failure.get("type") == "data_validation"
+    assert failure.get("cell") == "A1"
 
 
 def test_xml_reporter_write_to_file():
@@ -114,7 +115,7 @@ def test_xml_reporter_write_to_file():
         assert len(structural) == 1
         
         failure = structural.find("Failure")
-        assert failure.find("type").text == "test_failure"
+        assert failure.get("type") == "test_failure"
 
 
 def test_xml_reporter_handles_complex_data():
@@ -134,6 +135,117 @@ def test_xml_reporter_handles_complex_data():
     structural = root.find("StructuralFailures")
     failure_elem = structural.find("Failure")
     
-    assert failure_elem.find("type").text == "complex_failure"
+    assert failure_elem.get("type") == "complex_failure"
     assert failure_elem.find("expected").text == "{'key': 'value'}"
-    assert failure_elem.find("found").text == "None"
\ No newline at end of file
+    assert failure_elem.get("found") == "None"
+
+
+def test_xml_reporter_escapes_control_characters(monkeypatch):
+    """Test that characters XML does not allow are escaped by both writers."""
+    import src.reporter.xml_reporter as xml_reporter_module
+
+    reporter = XMLReporter()
+    failures = [
+        ValidationFailure(
+            type="data_mismatch",
+            expected="A\x0bB",
+            found={"value": "\x00"},
+        )
+    ]
+
+    results = [reporter.generate_report([], failures, [])]
+    monkeypatch.setattr(xml_reporter_module, "HAS_LXML", False)
+    results.append(reporter.generate_report([], failures, []))
+
+    for result in results:
+        failure_elem = ET.fromstring(result).find("DataFailures/Failure")
+        assert failure_elem.get("expected") == "A\\x0bB"
+        assert failure_elem.find("found").text == "{'value': '\\x00'}"
+
+def test_xml_reporter_written_file_matches_generated_report():
+    """Test that the streamed file content matches generate_report output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reporter = XMLReporter(Path(tmpdir))
+        
+        failures = [
+            ValidationFailure(
+                type="test_failure",
+                sheet="Übersicht",
+                expected={"key": "value"},
+                found=None,
+                message="Umsatz < 0 — prüfen",
+            )
+        ]
+        
+        output_path = reporter.write_to_file(failures, failures, [])
+        
+        assert output_path.read_text(encoding="utf-8") == reporter.generate_report(
+            failures, failures, []
+        )
+
+
+def test_xml_reporter_stream_uses_text_newlines():
+    """Test that the declaration and body share the file's newline translation."""
+    reporter = XMLReporter()
+    failures = [ValidationFailure(type="test_failure", message="Line")]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "report.xml"
+        with open(path, "w", encoding="utf-8", newline="\r\n") as f:
+            reporter.generate_report_stream(f, failures, [], [])
+        content = path.read_bytes()
+
+    assert content.count(b"\r\n") > 2
+    assert b"\n" not in content.replace(b"\r\n", b"")
+
+
+def test_xml_reporter_backends_write_same_document(monkeypatch):
+    """Test that lxml, the single-pass writer and the empty report agree."""
+    import src.reporter.xml_reporter as xml_reporter_module
+
+    reporter = XMLReporter()
+    failures = [
+        ValidationFailure(type="test_failure", cell="A1", message="a\tb/>c"),
+        ValidationFailure(type="cf_rule_missing", expected={"type": "colorScale"}),
+    ]
+    expected_empty = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        "<ValidationResults>\n"
+        "  <StructuralFailures />\n"
+        "  <DataFailures />\n"
+        "  <VisualFailures />\n"
+        "</ValidationResults>"
+    )
+    expected = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        "<ValidationResults>\n"
+        "  <StructuralFailures>\n"
+        '    <Failure type="test_failure" cell="A1" message="a&#09;b/&gt;c" />\n'
+        '    <Failure type="cf_rule_missing">\n'
+        "      <expected>{'type': 'colorScale'}</expected>\n"
+        "    </Failure>\n"
+        "  </StructuralFailures>\n"
+        "  <DataFailures />\n"
+        "  <VisualFailures />\n"
+        "</ValidationResults>"
+    )
+
+    for has_lxml in (True, False):
+        monkeypatch.setattr(xml_reporter_module, "HAS_LXML", has_lxml)
+        assert reporter.generate_report([], [], []) == expected_empty
+        assert reporter.generate_report(failures, [], []) == expected
+
+
+def test_xml_reporter_binary_write_matches_generated_report():
+    """Test that the binary write path encodes the same report."""
+    reporter = XMLReporter()
+    assert reporter.writes_bytes
+
+    failures = [ValidationFailure(type="test_failure", sheet="Übersicht", found={"a": 1})]
+    for failure_list in ([], failures):
+        buf = io.BytesIO()
+        reporter.generate_report_bytes_from_dicts(
+            buf, [failure.to_dict() for failure in failure_list], [], []
+        )
+        expected = reporter.generate_report(failure_list, [], [])
+        assert buf.getvalue() == expected.encode("utf-8")
@@ -123,3 +123,32 @@ def test_normalize_formula():
     # Test empty formula
     assert rule._normalize_formula("") == ""
     assert rule._normalize_formula(None) == ""
+
+
+def test_read_only_workbook(tmp_path):
+    """Test that read-only workbooks give the same results as regular ones."""
+    from openpyxl import Workbook
+
+    source = Workbook()
+    sheet = source.active
+    sheet.title = "Summary"
+    for row in range(1, 21):
+        sheet.append([row, row * 2, f"=A{row}+B{row}"])
+    sheet["C7"] = 21
+    path = tmp_path / "many_formulas.xlsx"
+    source.save(path)
+
+    cells = {f"C{row}": {"formula": f"=A{row}+B{row}"} for row in (2, 7, 20)}
+    cells["D30"] = {"formula": "=1"}
+    cells["C1:C2"] = {"formula": "=A1+B1"}
+    rule = CellFormulaRule("Summary", SheetCfg(cells=cells))
+
+    expected = [f.to_dict() for f in rule.run(load_workbook(path))]
+    read_only = load_workbook(path, read_only=True)
+    try:
+        found = [f.to_dict() for f in rule.run(read_only)]
+    finally:
+        read_only.close()
+
+    assert [f["cell"] for f in expected] == ["C7", "D30", "C1:C2"]
+    assert found == expected
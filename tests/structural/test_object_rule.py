@@ -6,13 +6,21 @@ from pathlib import Path
 
 from openpyxl import load_workbook
 
-from src.structural.object_pos import ObjectPositionRule
+from src.structural import object_pos
+from src.structural.object_pos import ObjectPositionRule, run_object_position_rules
 from src.structural.base import ValidationFailure
 
 
 class TestObjectPositionRule:
     """Test cases for ObjectPositionRule."""
 
+    @pytest.fixture(autouse=True)
+    def reset_shared_app(self):
+        """Start each test without a shared Excel instance."""
+        object_pos._shared_app = None
+        yield
+        object_pos._shared_app = None
+
     @pytest.fixture
     def rule_config(self):
         """Create a mock rule configuration."""
@@ -87,7 +95,7 @@ class TestObjectPositionRule:
         mock_sheet = MagicMock()
         mock_sheet.shapes = []  # No shapes
 
-        mock_xw.App.return_value.__enter__.return_value = mock_app
+        mock_xw.App.return_value = mock_app
         mock_app.books.open.return_value = mock_wb
         mock_wb.sheets.__getitem__.return_value = mock_sheet
 
@@ -121,7 +129,7 @@ class TestObjectPositionRule:
         mock_shape.left = 337.5  # 337.5 pt * 1.333 = 450 px
         mock_sheet.shapes = [mock_shape]
 
-        mock_xw.App.return_value.__enter__.return_value = mock_app
+        mock_xw.App.return_value = mock_app
         mock_app.books.open.return_value = mock_wb
         mock_wb.sheets.__getitem__.return_value = mock_sheet
 
@@ -149,7 +157,7 @@ class TestObjectPositionRule:
         )
         mock_sheet.shapes = [mock_shape]
 
-        mock_xw.App.return_value.__enter__.return_value = mock_app
+        mock_xw.App.return_value = mock_app
         mock_app.books.open.return_value = mock_wb
         mock_wb.sheets.__getitem__.return_value = mock_sheet
 
@@ -186,7 +194,7 @@ class TestObjectPositionRule:
         )
         mock_sheet.shapes = [mock_shape]
 
-        mock_xw.App.return_value.__enter__.return_value = mock_app
+        mock_xw.App.return_value = mock_app
         mock_app.books.open.return_value = mock_wb
         mock_wb.sheets.__getitem__.return_value = mock_sheet
 
@@ -275,7 +283,7 @@ class TestObjectPositionRule:
         mock_shape1.left = 337.5
         mock_sheet.shapes = [mock_shape1]  # SaveButton is missing
 
-        mock_xw.App.return_value.__enter__.return_value = mock_app
+        mock_xw.App.return_value = mock_app
         mock_app.books.open.return_value = mock_wb
         mock_wb.sheets.__getitem__.return_value = mock_sheet
 
@@ -290,3 +298,92 @@ class TestObjectPositionRule:
         assert len(result) == 1
         assert result[0].type == "object_missing"
         assert result[0].object == "SaveButton"
+
+    @patch("src.structural.object_pos.xw")
+    def test_rules_share_one_excel_session(self, mock_xw, rule_config):
+        """Test that rules for several sheets save and open the workbook once."""
+        mock_app = MagicMock()
+        mock_wb = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.shapes = []
+
+        mock_xw.App.return_value = mock_app
+        mock_app.books.open.return_value = mock_wb
+        mock_wb.sheets.__getitem__.return_value = mock_sheet
+
+        rules = [
+            ObjectPositionRule("Dashboard", rule_config),
+            ObjectPositionRule("Summary", rule_config),
+        ]
+        workbook = Mock()
+        workbook.sheetnames = ["Dashboard", "Summary"]
+        workbook.save = Mock()
+
+        result = run_object_position_rules(workbook, rules)
+
+        assert [failure.sheet for failure in result] == ["Dashboard", "Summary"]
+        assert workbook.save.call_count == 1
+        assert mock_xw.App.call_count == 1
+        assert mock_app.books.open.call_count == 1
+
+    @patch("src.structural.object_pos.xw")
+    def test_source_path_opened_without_saving(self, mock_xw, rule_config):
+        """Test that a given source file is opened directly instead of a saved copy."""
+        mock_app = MagicMock()
+        mock_wb = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.shapes = []
+
+        mock_xw.App.return_value = mock_app
+        mock_app.books.open.return_value = mock_wb
+        mock_wb.sheets.__getitem__.return_value = mock_sheet
+
+        rule = ObjectPositionRule("Dashboard", rule_config)
+        workbook = Mock()
+        workbook.sheetnames = ["Dashboard"]
+        workbook.save = Mock()
+        source_path = Path("tests/fixtures/obj_ok.xlsx")
+
+        result = rule.run(workbook, source_path)
+
+        assert len(result) == 1
+        workbook.save.assert_not_called()
+        mock_app.books.open.assert_called_once_with(str(source_path.resolve()))
+
+    @patch("src.structural.object_pos.xw")
+    def test_excel_instance_reused_across_runs(self, mock_xw, rule_config):
+        """Test that consecutive runs reuse one Excel instance."""
+        mock_app = MagicMock()
+        mock_xw.App.return_value = mock_app
+        mock_app.books.open.return_value.sheets.__getitem__.return_value.shapes = []
+
+        rule = ObjectPositionRule("Dashboard", rule_config)
+        workbook = Mock()
+        workbook.sheetnames = ["Dashboard"]
+        workbook.save = Mock()
+
+        rule.run(workbook)
+        rule.run(workbook)
+
+        assert mock_xw.App.call_count == 1
+        assert mock_app.books.open.call_count == 2
+        mock_app.quit.assert_not_called()
+
+        object_pos._quit_shared_app()
+        mock_app.quit.assert_called_once_with()
+
+    @patch("src.structural.object_pos.xw")
+    def test_excel_instance_dropped_after_failure(self, mock_xw, rule_config):
+        """Test that a failing Excel instance is quit and replaced on the next run."""
+        mock_app = MagicMock()
+        mock_xw.App.return_value = mock_app
+        mock_app.books.open.side_effect = Exception("Excel went away")
+
+        rule = ObjectPositionRule("Dashboard", rule_config)
+        workbook = Mock()
+        workbook.sheetnames = ["Dashboard"]
+        workbook.save = Mock()
+
+        assert rule.run(workbook) == []
+        mock_app.quit.assert_called_once_with()
+        assert object_pos._shared_app is None
@@ -59,3 +59,13 @@ def test_must_exist_false():
     rule = SheetExistsRule("Summary", sheet_config)
     failures = rule.run(wb)
     assert failures == []
+
+
+def test_check_sheet_names():
+    """Test checking a prebuilt set of sheet names."""
+    cfg = load_rules("tests/fixtures/rule_sheet.yaml")
+    rule = SheetExistsRule("Summary", cfg.sheets["Summary"])
+
+    assert rule.check_sheet_names({"Summary", "Data"}) == []
+    failures = rule.check_sheet_names(frozenset({"Data"}))
+    assert [failure.type for failure in failures] == ["sheet_missing"]
@@ -40,3 +40,29 @@ def test_nonexistent_workbook():
         "does not exist" in result.stderr.lower()
         or "no such file" in result.stderr.lower()
     )
+
+
+def test_formula_rules_run_on_read_only_workbook():
+    """Test that formula rules report mismatches when the workbook is loaded read-only."""
+    result = _run(
+        "tests/fixtures/formula_mismatch.xlsx",
+        "--rules",
+        "tests/fixtures/rule_formula.yaml",
+        "--report",
+        "json",
+    )
+    assert result.returncode == 1
+    assert "1 structural failure(s)" in result.stdout
+
+
+def test_import_does_not_load_data_validation():
+    """Test that importing the CLI leaves Great Expectations unloaded."""
+    code = (
+        "import sys\n"
+        "import src.validator.cli\n"
+        "print('src.data' in sys.modules, 'great_expectations' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
@@ -3,10 +3,13 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from src.validator.cli import (
     run_visual_validation,
     get_baseline_path,
     update_baseline_file,
+    update_baseline_image,
 )
 
 
@@ -27,12 +30,13 @@ class TestRunVisualValidation:
         with patch(
             "src.validator.cli.capture.is_capture_supported"
         ) as mock_supported, patch(
-            "src.validator.cli.capture.capture_sheet_png"
-        ) as mock_capture, patch(
-            "src.validator.cli.update_baseline_file"
+            "src.validator.cli.capture.open_session"
+        ) as mock_open_session, patch(
+            "src.validator.cli.update_baseline_image"
         ) as mock_update:
 
             mock_supported.return_value = True
+            mock_session = mock_open_session.return_value.__enter__.return_value
 
             failures = run_visual_validation(
                 mock_workbook, mock_config, workbook_path, "auto", update_baseline=True
@@ -41,8 +45,9 @@ class TestRunVisualValidation:
             # Should have no failures in update mode
             assert failures == []
 
-            # Should capture screenshots for each sheet
-            assert mock_capture.call_count == 2
+            # Should capture screenshots for each sheet in one session
+            mock_open_session.assert_called_once_with(workbook_path, renderer="auto")
+            assert mock_session.capture.call_count == 2
 
             # Should update baselines for each sheet
             assert mock_update.call_count == 2
@@ -60,8 +65,8 @@ class TestRunVisualValidation:
         with patch(
             "src.validator.cli.capture.is_capture_supported"
         ) as mock_supported, patch(
-            "src.validator.cli.capture.capture_sheet_png"
-        ), patch(
+            "src.validator.cli.capture.open_session"
+        ) as mock_open_session, patch(
             "src.validator.cli.get_baseline_path"
         ) as mock_baseline_path:
 
@@ -81,6 +86,9 @@ class TestRunVisualValidation:
             assert failures[0].type == "visual_baseline_missing"
             assert "missing" in failures[0].message.lower()
 
+            # Without a baseline there is nothing to compare, so no capture
+            mock_open_session.assert_not_called()
+
     def test_validation_mode_visual_diff(self, tmp_path):
         """Test validation mode when visual difference is detected."""
         # Setup mock workbook and config
@@ -94,14 +102,15 @@ class TestRunVisualValidation:
         with patch(
             "src.validator.cli.capture.is_capture_supported"
         ) as mock_supported, patch(
-            "src.validator.cli.capture.capture_sheet_png"
-        ), patch(
+            "src.validator.cli.capture.open_session"
+        ) as mock_open_session, patch(
             "src.validator.cli.get_baseline_path"
         ) as mock_baseline_path, patch(
-            "src.validator.cli.pixel_diff.diff_png"
+            "src.validator.cli.pixel_diff.diff_image"
         ) as mock_diff:
 
             mock_supported.return_value = True
+            mock_session = mock_open_session.return_value.__enter__.return_value
 
             # Mock existing baseline
             mock_baseline = Mock()
@@ -120,6 +129,14 @@ class TestRunVisualValidation:
             assert failures[0].type == "visual_diff"
             assert "5.00%" in failures[0].message
 
+            # The screenshot is compared in memory, never written to disk
+            mock_session.capture.assert_called_once_with("Sheet1")
+            mock_diff.assert_called_once_with(
+                mock_baseline,
+                mock_session.capture.return_value,
+                threshold=0.02,
+            )
+
     def test_validation_mode_visual_pass(self, tmp_path):
         """Test validation mode when visual validation passes."""
         # Setup mock workbook and config
@@ -133,11 +150,11 @@ class TestRunVisualValidation:
         with patch(
             "src.validator.cli.capture.is_capture_supported"
         ) as mock_supported, patch(
-            "src.validator.cli.capture.capture_sheet_png"
+            "src.validator.cli.capture.open_session"
         ), patch(
             "src.validator.cli.get_baseline_path"
         ) as mock_baseline_path, patch(
-            "src.validator.cli.pixel_diff.diff_png"
+            "src.validator.cli.pixel_diff.diff_image"
         ) as mock_diff:
 
             mock_supported.return_value = True
@@ -176,6 +193,23 @@ class TestRunVisualValidation:
             # Should return empty list when capture not supported
             assert failures == []
 
+    def test_skipped_by_environment(self, tmp_path, monkeypatch):
+        """Test SHEETCHECK_SKIP_VISUAL turns visual validation off."""
+        mock_workbook = Mock()
+        mock_workbook.sheetnames = ["Sheet1"]
+        mock_config = Mock()
+
+        workbook_path = tmp_path / "test.xlsx"
+        monkeypatch.setenv("SHEETCHECK_SKIP_VISUAL", "1")
+
+        with patch("src.validator.cli.capture.is_capture_supported") as mock_supported:
+            failures = run_visual_validation(
+                mock_workbook, mock_config, workbook_path, "auto", update_baseline=False
+            )
+
+            assert failures == []
+            mock_supported.assert_not_called()
+
     def test_capture_error_handling(self, tmp_path):
         """Test error handling during screenshot capture."""
         # Setup mock workbook and config
@@ -189,11 +223,19 @@ class TestRunVisualValidation:
         with patch(
             "src.validator.cli.capture.is_capture_supported"
         ) as mock_supported, patch(
-            "src.validator.cli.capture.capture_sheet_png"
-        ) as mock_capture:
+            "src.validator.cli.capture.open_session"
+        ) as mock_open_session, patch(
+            "src.validator.cli.get_baseline_path"
+        ) as mock_baseline_path:
 
             mock_supported.return_value = True
-            mock_capture.side_effect = RuntimeError("Screenshot failed")
+            mock_session = mock_open_session.return_value.__enter__.return_value
+            mock_session.capture.side_effect = RuntimeError("Screenshot failed")
+
+            # Mock existing baseline so the sheet is captured
+            mock_baseline = Mock()
+            mock_baseline.exists.return_value = True
+            mock_baseline_path.return_value = mock_baseline
 
             failures = run_visual_validation(
                 mock_workbook, mock_config, workbook_path, "auto", update_baseline=False
@@ -204,6 +246,87 @@ class TestRunVisualValidation:
             assert failures[0].type == "visual_error"
             assert "Screenshot failed" in failures[0].message
 
+    def test_failures_reported_in_sheet_order(self, tmp_path):
+        """Test background comparisons don't reorder failures."""
+        mock_workbook = Mock()
+        mock_workbook.sheetnames = ["Sheet1", "Sheet2", "Sheet3"]
+        mock_config = Mock()
+
+        workbook_path = tmp_path / "test.xlsx"
+        workbook_path.write_bytes(b"fake xlsx content")
+
+        def capture_side_effect(sheet_name):
+            if sheet_name == "Sheet2":
+                raise RuntimeError("Screenshot failed")
+
+        with patch(
+            "src.validator.cli.capture.is_capture_supported"
+        ) as mock_supported, patch(
+            "src.validator.cli.capture.open_session"
+        ) as mock_open_session, patch(
+            "src.validator.cli.get_baseline_path"
+        ) as mock_baseline_path, patch(
+            "src.validator.cli.pixel_diff.diff_image"
+        ) as mock_diff:
+
+            mock_supported.return_value = True
+            mock_session = mock_open_session.return_value.__enter__.return_value
+            mock_session.capture.side_effect = capture_side_effect
+
+            mock_baseline = Mock()
+            mock_baseline.exists.return_value = True
+            mock_baseline_path.return_value = mock_baseline
+            mock_diff.return_value = 0.05
+
+            failures = run_visual_validation(
+                mock_workbook, mock_config, workbook_path, "auto", update_baseline=False
+            )
+
+            assert [(f.sheet, f.type) for f in failures] == [
+                ("Sheet1", "visual_diff"),
+                ("Sheet2", "visual_error"),
+                ("Sheet3", "visual_diff"),
+            ]
+            assert mock_diff.call_count == 2
+
+
+class TestWorkbookClosed:
+    """Tests for closing the validated workbook."""
+
+    def test_workbook_closed_when_visual_validation_aborts(self, tmp_path):
+        """Test that an aborted validation still releases the workbook file."""
+        import click
+        from click.testing import CliRunner
+
+        from src.validator import cli
+        from src.validator.config import RuleConfig
+
+        workbook_path = tmp_path / "test.xlsx"
+        workbook_path.write_bytes(b"fake xlsx content")
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text("sheets: {}\n")
+
+        mock_wb = Mock()
+        mock_wb.sheetnames = ["Sheet1"]
+
+        with patch.object(
+            cli, "load_rules", return_value=RuleConfig()
+        ), patch.object(
+            cli, "load_workbook", return_value=mock_wb
+        ), patch.object(
+            cli, "run_structural_validation", return_value=[]
+        ), patch.object(
+            cli, "run_data_validation", return_value=[]
+        ), patch.object(
+            cli, "run_visual_validation", side_effect=click.Abort()
+        ):
+            result = CliRunner().invoke(
+                cli.main, [str(workbook_path), "--rules", str(rules_path)]
+            )
+
+        assert result.exit_code != 0
+        mock_wb.close.assert_called_once()
+
 
 class TestGetBaselinePath:
     """Tests for baseline path generation."""
@@ -225,6 +348,43 @@ class TestGetBaselinePath:
         assert path == expected
 
 
+class TestUpdateBaselineImage:
+    """Tests for saving captured images as baselines."""
+
+    def test_update_baseline_image(self, tmp_path):
+        """Test a captured image is written as the baseline PNG."""
+        Image = pytest.importorskip("PIL.Image")
+
+        baseline_path = tmp_path / "baselines" / "sheets" / "test" / "Sheet1.png"
+        image = Image.new("RGB", (4, 3), (10, 20, 30))
+
+        update_baseline_image(image, baseline_path)
+
+        with Image.open(baseline_path) as saved:
+            assert saved.format == "PNG"
+            assert saved.size == (4, 3)
+            assert saved.getpixel((0, 0)) == (10, 20, 30)
+
+    def test_failed_save_keeps_old_baseline(self, tmp_path):
+        """Test an interrupted write leaves the previous baseline untouched."""
+        baseline_path = tmp_path / "Sheet1.png"
+        baseline_path.write_bytes(b"old baseline")
+
+        image = Mock()
+
+        def partial_save(path, format):
+            Path(path).write_bytes(b"trunc")
+            raise OSError("disk full")
+
+        image.save.side_effect = partial_save
+
+        with pytest.raises(OSError, match="disk full"):
+            update_baseline_image(image, baseline_path)
+
+        assert baseline_path.read_bytes() == b"old baseline"
+        assert [p.name for p in tmp_path.iterdir()] == ["Sheet1.png"]
+
+
 class TestUpdateBaselineFile:
     """Tests for baseline file update functionality."""
 
@@ -300,9 +460,9 @@ class TestIntegrationScenario:
         with patch(
             "src.validator.cli.capture.is_capture_supported"
         ) as mock_supported, patch(
-            "src.validator.cli.capture.capture_sheet_png"
+            "src.validator.cli.capture.open_session"
         ), patch(
-            "src.validator.cli.pixel_diff.diff_png"
+            "src.validator.cli.pixel_diff.diff_image"
         ) as mock_diff, patch(
             "src.validator.cli.get_baseline_path"
         ) as mock_baseline_path:
@@ -322,7 +482,7 @@ class TestIntegrationScenario:
             assert failures_validation[0].type == "visual_diff"
 
             # Second run: update baseline mode
-            with patch("src.validator.cli.update_baseline_file") as mock_update:
+            with patch("src.validator.cli.update_baseline_image") as mock_update:
                 failures_update = run_visual_validation(
                     mock_workbook,
                     mock_config,
@@ -334,5 +494,5 @@ class TestIntegrationScenario:
                 # Should pass with no failures in update mode
                 assert failures_update == []
 
-                # Should have called update_baseline_file
+                # Should have saved the capture as the new baseline
                 mock_update.assert_called_once()
@@ -156,9 +156,100 @@ class TestCaptureSheetPng:
                 )
 
 
+class TestOpenSession:
+    """Tests for open_session renderer dispatch."""
+
+    def test_com_session(self, tmp_path):
+        """Test COM sessions keep Excel open for the whole session."""
+        wb_path = tmp_path / "test.xlsx"
+        mock_info = {
+            "com_available": True,
+            "mcp_available": False,
+            "preferred_renderer": "com",
+        }
+
+        with patch("src.visual.capture.get_renderer_info") as mock_info_func, patch(
+            "src.visual.capture_com.CaptureSession"
+        ) as mock_session_class:
+
+            mock_info_func.return_value = mock_info
+
+            session = capture.open_session(wb_path, renderer="auto")
+
+            mock_session_class.assert_called_once_with(wb_path)
+            assert session is mock_session_class.return_value
+
+    def test_mcp_session_captures_each_sheet(self, tmp_path):
+        """Test MCP sessions capture every sheet through one MCP session."""
+        wb_path = tmp_path / "test.xlsx"
+        mock_info = {
+            "com_available": False,
+            "mcp_available": True,
+            "preferred_renderer": "mcp",
+        }
+
+        with patch("src.visual.capture.get_renderer_info") as mock_info_func, patch(
+            "src.visual.capture_mcp.CaptureSession"
+        ) as mock_session_class:
+
+            mock_info_func.return_value = mock_info
+            mcp_session = mock_session_class.return_value
+
+            with capture.open_session(wb_path, renderer="auto") as session:
+                session.capture("Sheet1", tmp_path / "one.png")
+                session.capture("Sheet2", tmp_path / "two.png")
+
+            mock_session_class.assert_called_once_with(wb_path)
+            mcp_session.__enter__.assert_called_once()
+            mcp_session.__exit__.assert_called_once()
+            assert mcp_session.capture.call_count == 2
+            mcp_session.capture.assert_called_with("Sheet2", tmp_path / "two.png")
+
+    def test_mcp_session_capture_to_memory(self, tmp_path):
+        """Test MCP sessions load the rendered PNG when no path is given."""
+        Image = pytest.importorskip("PIL.Image")
+        wb_path = tmp_path / "test.xlsx"
+        mock_info = {
+            "com_available": False,
+            "mcp_available": True,
+            "preferred_renderer": "mcp",
+        }
+
+        def fake_capture(sheet_name, png_path):
+            Image.new("RGB", (3, 2), (1, 2, 3)).save(png_path, "PNG")
+
+        with patch("src.visual.capture.get_renderer_info") as mock_info_func, patch(
+            "src.visual.capture_mcp.CaptureSession"
+        ) as mock_session_class:
+
+            mock_info_func.return_value = mock_info
+            mock_session_class.return_value.capture.side_effect = fake_capture
+
+            with capture.open_session(wb_path) as session:
+                image = session.capture("Sheet1")
+
+        assert image.size == (3, 2)
+        assert image.getpixel((0, 0)) == (1, 2, 3)
+
+    def test_renderer_not_available(self, tmp_path):
+        """Test sessions validate the renderer like single captures."""
+        with patch("src.visual.capture.get_renderer_info") as mock_info_func:
+            mock_info_func.return_value = {"com_available": False}
+
+            with pytest.raises(ImportError, match="COM renderer not available"):
+                capture.open_session(tmp_path / "test.xlsx", renderer="com")
+
+
 class TestGetRendererInfo:
     """Tests for get_renderer_info function."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_probe(self):
+        """Probe renderers again for every test."""
+        capture.clear_renderer_cache()
+        yield
+        capture.clear_renderer_cache()
+
     @patch("platform.system")
     def test_windows_with_com_available(self, mock_platform):
         """Test renderer info on Windows with COM available."""
@@ -226,6 +317,25 @@ class TestGetRendererInfo:
             assert info["mcp_available"] is False
             assert info["preferred_renderer"] == "none"
 
+    @patch("platform.system")
+    def test_probe_is_cached(self, mock_platform):
+        """Test renderers are probed once until the cache is cleared."""
+        mock_platform.return_value = "Linux"
+
+        with patch("src.visual.capture_mcp.is_capture_supported") as mock_mcp_supported:
+            mock_mcp_supported.return_value = True
+
+            info = capture.get_renderer_info()
+            info["mcp_available"] = False  # Callers get their own copy
+
+            assert capture.get_renderer_info()["mcp_available"] is True
+            assert mock_mcp_supported.call_count == 1
+
+            capture.clear_renderer_cache()
+            capture.get_renderer_info()
+
+            assert mock_mcp_supported.call_count == 2
+
     @patch("platform.system")
     def test_import_errors_handled(self, mock_platform):
         """Test that import errors are handled gracefully."""
@@ -5,7 +5,11 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from src.visual.capture_com import capture_sheet_png, is_capture_supported
+from src.visual.capture_com import (
+    CaptureSession,
+    capture_sheet_png,
+    is_capture_supported,
+)
 
 
 class TestCaptureSheetPng:
@@ -166,6 +170,70 @@ class TestCaptureSheetPng:
                         capture_sheet_png("string_path.xlsx", "Sheet1", "out.png")
 
 
+class TestCaptureSession:
+    """Test cases for CaptureSession."""
+
+    @patch("src.visual.capture_com.platform.system", return_value="Windows")
+    @patch("src.visual.capture_com.ImageGrab")
+    @patch("src.visual.capture_com.xw")
+    def test_sheets_share_one_excel_instance(
+        self, mock_xw, mock_imagegrab, mock_platform, tmp_path
+    ):
+        """Test that Excel and the workbook are opened once per session."""
+        test_file = tmp_path / "test.xlsx"
+        test_file.touch()
+
+        mock_app = MagicMock()
+        mock_wb = MagicMock()
+        mock_app.books.open.return_value = mock_wb
+        mock_xw.App.return_value.__enter__.return_value = mock_app
+
+        mock_image = MagicMock()
+        mock_imagegrab.grabclipboard.return_value = mock_image
+
+        def mock_save(path, format):
+            Path(path).write_bytes(b"fake png data" * 100)
+
+        mock_image.save.side_effect = mock_save
+
+        with CaptureSession(test_file) as session:
+            session.capture("Dashboard", tmp_path / "dashboard.png")
+            session.capture("Summary", tmp_path / "summary.png")
+            mock_wb.close.assert_not_called()
+
+        mock_xw.App.assert_called_once()
+        mock_app.books.open.assert_called_once()
+        assert mock_image.save.call_count == 2
+        mock_wb.close.assert_called_once()
+        mock_xw.App.return_value.__exit__.assert_called_once()
+
+    @patch("src.visual.capture_com.platform.system", return_value="Windows")
+    @patch("src.visual.capture_com.ImageGrab")
+    @patch("src.visual.capture_com.xw")
+    def test_capture_to_memory(self, mock_xw, mock_imagegrab, mock_platform, tmp_path):
+        """Test that the clipboard image is returned when no path is given."""
+        test_file = tmp_path / "test.xlsx"
+        test_file.touch()
+
+        mock_app = MagicMock()
+        mock_xw.App.return_value.__enter__.return_value = mock_app
+        mock_image = MagicMock()
+        mock_imagegrab.grabclipboard.return_value = mock_image
+
+        with CaptureSession(test_file) as session:
+            image = session.capture("Dashboard")
+
+        assert image is mock_image
+        mock_image.save.assert_not_called()
+
+    def test_capture_requires_open_session(self, tmp_path):
+        """Test that capturing outside the with block fails."""
+        session = CaptureSession(tmp_path / "test.xlsx")
+
+        with pytest.raises(RuntimeError, match="not open"):
+            session.capture("Sheet1", tmp_path / "out.png")
+
+
 class TestIsCaptureSupported:
     """Test cases for is_capture_supported function."""
 
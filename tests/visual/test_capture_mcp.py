@@ -1,5 +1,8 @@
 """Tests for MCP screenshot capture functionality."""
 
+import os
+import stat
+import time
 from unittest.mock import Mock, patch
 import pytest
 
@@ -116,6 +119,113 @@ class TestCaptureSheetPng:
             assert not png_path.exists()
 
 
+class TestCaptureSession:
+    """Tests for MCP capture sessions and batch capture."""
+
+    def fake_screenshot(self, html_path, png_path):
+        """Write a PNG-sized file holding the rendered HTML."""
+        png_path.write_bytes(html_path.read_bytes() * 1000)
+
+    def test_workbook_converted_once(self, tmp_path):
+        """Test that all sheets come from a single HTML batch."""
+        wb_path = tmp_path / "test.xlsx"
+        wb_path.write_bytes(b"fake xlsx content")
+        pages = {"Sheet1": "<html>one</html>", "Sheet2": "<html>two</html>"}
+
+        with patch(
+            "src.visual.capture_mcp._generate_html_batch", return_value=pages
+        ) as mock_batch, patch(
+            "src.visual.capture_mcp._capture_html_screenshot",
+            side_effect=self.fake_screenshot,
+        ), patch(
+            "src.visual.capture_mcp.MCP_AVAILABLE", True
+        ):
+
+            with capture_mcp.CaptureSession(wb_path) as session:
+                session.capture("Sheet1", tmp_path / "one.png")
+                session.capture("Sheet2", tmp_path / "two.png")
+
+            mock_batch.assert_called_once_with(wb_path, [])
+            assert b"two" in (tmp_path / "two.png").read_bytes()
+
+    def test_unknown_sheet(self, tmp_path):
+        """Test error when the sheet is not in the converted workbook."""
+        wb_path = tmp_path / "test.xlsx"
+        wb_path.write_bytes(b"fake xlsx content")
+
+        with patch(
+            "src.visual.capture_mcp._generate_html_batch",
+            return_value={"Sheet1": "<html></html>"},
+        ), patch("src.visual.capture_mcp.MCP_AVAILABLE", True):
+
+            with capture_mcp.CaptureSession(wb_path) as session:
+                with pytest.raises(ValueError, match="Sheet 'Missing' not found"):
+                    session.capture("Missing", tmp_path / "missing.png")
+
+    def test_sheet_outside_requested_list(self, tmp_path):
+        """Test that sheets not named when opening the session still convert."""
+        wb_path = tmp_path / "test.xlsx"
+        wb_path.write_bytes(b"fake xlsx content")
+
+        with patch(
+            "src.visual.capture_mcp._generate_html_batch",
+            return_value={"Sheet1": "<html>one</html>"},
+        ), patch(
+            "src.visual.capture_mcp._generate_html_from_excel",
+            return_value="<html>two</html>",
+        ) as mock_single, patch(
+            "src.visual.capture_mcp._capture_html_screenshot",
+            side_effect=self.fake_screenshot,
+        ), patch(
+            "src.visual.capture_mcp.MCP_AVAILABLE", True
+        ):
+
+            with capture_mcp.CaptureSession(wb_path, ["Sheet1"]) as session:
+                session.capture("Sheet1", tmp_path / "one.png")
+                session.capture("Sheet2", tmp_path / "two.png")
+                session.capture("Sheet2", tmp_path / "two_again.png")
+
+            mock_single.assert_called_once_with(wb_path, "Sheet2")
+            assert b"two" in (tmp_path / "two.png").read_bytes()
+
+    def test_mcp_not_available(self, tmp_path):
+        """Test error when opening a session without MCP tools."""
+        wb_path = tmp_path / "test.xlsx"
+        wb_path.write_bytes(b"fake xlsx content")
+
+        with patch("src.visual.capture_mcp.MCP_AVAILABLE", False):
+            with pytest.raises(
+                ImportError, match="MCP Puppeteer tools are not available"
+            ):
+                with capture_mcp.CaptureSession(wb_path):
+                    pass
+
+    def test_capture_sheets_png(self, tmp_path):
+        """Test batch capture converts only the requested sheets."""
+        wb_path = tmp_path / "test.xlsx"
+        wb_path.write_bytes(b"fake xlsx content")
+        pages = {"Sheet1": "<html>one</html>", "Sheet2": "<html>two</html>"}
+
+        with patch(
+            "src.visual.capture_mcp._generate_html_batch", return_value=pages
+        ) as mock_batch, patch(
+            "src.visual.capture_mcp._capture_html_screenshot",
+            side_effect=self.fake_screenshot,
+        ) as mock_cap, patch(
+            "src.visual.capture_mcp.MCP_AVAILABLE", True
+        ):
+
+            capture_mcp.capture_sheets_png(
+                wb_path,
+                [("Sheet1", tmp_path / "one.png"), ("Sheet2", tmp_path / "two.png")],
+            )
+
+            mock_batch.assert_called_once_with(wb_path, ["Sheet1", "Sheet2"])
+            assert mock_cap.call_count == 2
+            assert (tmp_path / "one.png").exists()
+            assert (tmp_path / "two.png").exists()
+
+
 class TestGenerateHtmlFromExcel:
     """Tests for HTML generation from Excel."""
 
@@ -244,6 +354,149 @@ class TestGenerateHtmlFromExcel:
                 capture_mcp._generate_html_from_excel(wb_path, "Sheet1")
 
 
+class TestGenerateHtmlBatch:
+    """Tests for batch HTML generation from Excel."""
+
+    def test_batch_output_parsed(self, tmp_path):
+        """Test sheet names are passed with --batch and the JSON is parsed."""
+        wb_path = tmp_path / "test.xlsx"
+        stdout = '{"Sheet1": "<html>one</html>", "Sheet2": "<html>two</html>"}\n'
+
+        with patch(
+            "src.visual.capture_mcp._run_render_script", return_value=stdout
+        ) as mock_run:
+            pages = capture_mcp._generate_html_batch(wb_path, ["Sheet1", "Sheet2"])
+
+        assert pages == {"Sheet1": "<html>one</html>", "Sheet2": "<html>two</html>"}
+        assert mock_run.call_args[0][1] == ["--batch", "Sheet1", "Sheet2"]
+
+    def test_invalid_batch_output(self, tmp_path):
+        """Test error when the helper output is not JSON."""
+        wb_path = tmp_path / "test.xlsx"
+
+        with patch(
+            "src.visual.capture_mcp._run_render_script", return_value="<html></html>"
+        ):
+            with pytest.raises(RuntimeError, match="invalid output"):
+                capture_mcp._generate_html_batch(wb_path, [])
+
+
+class TestHtmlCache:
+    """Tests for the on-disk cache of generated sheet HTML."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Keep cache entries in the test's temporary directory."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(capture_mcp, "_HTML_CACHE_DIR", cache_dir)
+        return cache_dir
+
+    @pytest.fixture
+    def wb_path(self, tmp_path):
+        """Create a fake workbook file."""
+        wb_path = tmp_path / "test.xlsx"
+        wb_path.write_bytes(b"fake xlsx content")
+        return wb_path
+
+    def test_repeated_sheet_uses_cache(self, wb_path, cache_dir):
+        """Test the helper only runs for the first request of a sheet."""
+        with patch(
+            "src.visual.capture_mcp._run_render_script", return_value="<html>1</html>"
+        ) as mock_run:
+            first = capture_mcp._generate_html_from_excel(wb_path, "Sheet1")
+            second = capture_mcp._generate_html_from_excel(wb_path, "Sheet1")
+
+        assert first == second == "<html>1</html>"
+        mock_run.assert_called_once()
+        assert len(list(cache_dir.glob("*.html"))) == 1
+
+    def test_changed_workbook_rendered_again(self, wb_path):
+        """Test that modifying the workbook invalidates its cached HTML."""
+        with patch(
+            "src.visual.capture_mcp._run_render_script",
+            side_effect=["<html>old</html>", "<html>new</html>"],
+        ) as mock_run:
+            capture_mcp._generate_html_from_excel(wb_path, "Sheet1")
+            wb_path.write_bytes(b"changed fake xlsx content")
+            html = capture_mcp._generate_html_from_excel(wb_path, "Sheet1")
+
+        assert html == "<html>new</html>"
+        assert mock_run.call_count == 2
+
+    def test_batch_renders_only_missing_sheets(self, wb_path):
+        """Test batches skip cached sheets and Node.js when all are cached."""
+        capture_mcp._write_cached_html(wb_path, "Sheet1", "<html>one</html>")
+
+        with patch(
+            "src.visual.capture_mcp._run_render_script",
+            return_value='{"Sheet2": "<html>two</html>"}',
+        ) as mock_run:
+            pages = capture_mcp._generate_html_batch(wb_path, ["Sheet1", "Sheet2"])
+            cached_pages = capture_mcp._generate_html_batch(
+                wb_path, ["Sheet1", "Sheet2"]
+            )
+
+        assert pages == cached_pages
+        assert pages == {"Sheet1": "<html>one</html>", "Sheet2": "<html>two</html>"}
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][1] == ["--batch", "Sheet2"]
+
+    def test_session_uses_cached_sheet(self, wb_path):
+        """Test sessions don't convert the workbook for cached sheets."""
+        capture_mcp._write_cached_html(wb_path, "Sheet1", "<html>one</html>")
+
+        with patch("src.visual.capture_mcp._generate_html_batch") as mock_batch:
+            session = capture_mcp.CaptureSession(wb_path)
+            assert session._sheet_html("Sheet1") == "<html>one</html>"
+
+        mock_batch.assert_not_called()
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_cache_dir_private(self, wb_path, cache_dir):
+        """Test the cache directory is created for the current user only."""
+        capture_mcp._write_cached_html(wb_path, "Sheet1", "<html>one</html>")
+
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+        assert capture_mcp._read_cached_html(wb_path, "Sheet1") == "<html>one</html>"
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_shared_cache_dir_ignored(self, wb_path, cache_dir):
+        """Test entries are not trusted once other users can write the directory."""
+        capture_mcp._write_cached_html(wb_path, "Sheet1", "<html>one</html>")
+        cache_dir.chmod(0o777)
+
+        assert capture_mcp._read_cached_html(wb_path, "Sheet1") is None
+
+    def test_prune_expired_entries(self, cache_dir):
+        """Test entries unused for longer than the maximum age are removed."""
+        cache_dir.mkdir(mode=0o700)
+        old_entry = cache_dir / "old.html"
+        new_entry = cache_dir / "new.html"
+        old_entry.write_text("<html>old</html>")
+        new_entry.write_text("<html>new</html>")
+        old_time = time.time() - capture_mcp._HTML_CACHE_MAX_AGE - 60
+        os.utime(old_entry, (old_time, old_time))
+
+        capture_mcp._prune_html_cache()
+
+        assert not old_entry.exists()
+        assert new_entry.exists()
+
+    def test_prune_least_recently_used(self, cache_dir, monkeypatch):
+        """Test the oldest entries are removed while the cache is too large."""
+        monkeypatch.setattr(capture_mcp, "_HTML_CACHE_MAX_BYTES", 2000)
+        cache_dir.mkdir(mode=0o700)
+        now = time.time()
+        for age, name in enumerate(["newest", "middle", "oldest"]):
+            entry = cache_dir / f"{name}.html"
+            entry.write_text("x" * 1000)
+            os.utime(entry, (now - age * 60, now - age * 60))
+
+        capture_mcp._prune_html_cache()
+
+        assert sorted(path.stem for path in cache_dir.iterdir()) == ["middle", "newest"]
+
+
 class TestCaptureHtmlScreenshot:
     """Tests for Puppeteer MCP screenshot capture."""
 
@@ -334,6 +587,11 @@ class TestMcpSuccessCheck:
         result = "Error: Failed to load page"
         assert capture_mcp._is_mcp_success(result) is False
 
+    def test_string_error_any_case(self):
+        """Test error patterns are matched regardless of case."""
+        assert capture_mcp._is_mcp_success("Navigation TIMEOUT") is False
+        assert capture_mcp._is_mcp_success("Connection Refused") is False
+
     def test_none_result(self):
         """Test handling of None result."""
         assert capture_mcp._is_mcp_success(None) is False
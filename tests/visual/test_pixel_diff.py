@@ -1,5 +1,6 @@
 """Tests for pixel-level visual comparison functionality."""
 
+import math
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -12,9 +13,10 @@ except ImportError:
     Image = None
 
 from src.visual.pixel_diff import (
+    diff_image,
     diff_png,
     is_diff_supported,
-    _calculate_pixel_difference,
+    _squared_distance_limit,
 )
 
 
@@ -70,6 +72,76 @@ class TestPixelDiff:
         assert diff_img.mode == "RGBA"
         assert diff_img.size == (10, 10)
 
+    def test_diff_image_matches_diff_png(self):
+        """Test in-memory comparison gives the same ratio as the file form."""
+        actual_img = Image.new("RGBA", (10, 10), (255, 0, 0, 255))
+        actual_img.paste((0, 0, 255, 255), (0, 0, 5, 10))
+        actual_img.save(self.actual_path, "PNG")
+
+        assert diff_image(self.baseline_path, actual_img) == 0.5
+        assert diff_png(self.baseline_path, self.actual_path) == 0.5
+
+    def test_localized_change_uses_full_image_ratio(self):
+        """Test a small changed region against the whole image and overlay."""
+        actual_img = Image.new("RGBA", (10, 10), (255, 0, 0, 255))
+        actual_img.paste((0, 0, 255, 255), (2, 3, 4, 5))
+        actual_img.save(self.actual_path, "PNG")
+
+        diff_ratio = diff_png(
+            self.baseline_path, self.actual_path, diff_output_path=self.diff_path
+        )
+
+        assert diff_ratio == 0.04
+        diff_img = Image.open(self.diff_path)
+        assert diff_img.getpixel((2, 3))[3] == 255
+        assert diff_img.getpixel((9, 9)) == (255, 0, 0, 63)
+
+    def test_changes_spanning_several_tiles(self):
+        """Test that pixels are counted and highlighted across row tiles."""
+        actual_img = Image.new("RGBA", (10, 10), (255, 0, 0, 255))
+        actual_img.paste((0, 0, 255, 255), (1, 1, 3, 9))
+        actual_img.save(self.actual_path, "PNG")
+
+        with patch("src.visual.pixel_diff._TILE_ROWS", 3):
+            diff_ratio = diff_png(
+                self.baseline_path, self.actual_path, diff_output_path=self.diff_path
+            )
+
+        assert diff_ratio == 0.16
+        diff_img = Image.open(self.diff_path)
+        assert all(diff_img.getpixel((2, y))[3] == 255 for y in range(1, 9))
+        assert diff_img.getpixel((2, 9)) == (255, 0, 0, 63)
+
+    def test_rgb_images_match_rgba_comparison(self):
+        """Test RGB images compare as they would after RGBA conversion."""
+        baseline_img = Image.new("RGB", (10, 10), (255, 0, 0))
+        actual_img = Image.new("RGB", (10, 10), (255, 0, 0))
+        actual_img.paste((0, 0, 255), (0, 0, 10, 3))
+        baseline_img.save(self.baseline_path, "PNG")
+
+        diff_ratio = diff_image(
+            self.baseline_path, actual_img, diff_output_path=self.diff_path
+        )
+
+        assert diff_ratio == diff_image(self.baseline_path, actual_img.convert("RGBA"))
+        assert diff_ratio == 0.3
+        diff_img = Image.open(self.diff_path)
+        assert diff_img.mode == "RGBA"
+        assert diff_img.getpixel((5, 5)) == (255, 0, 0, 63)
+
+    def test_alpha_only_change_detected(self):
+        """Test that a change in transparency alone counts as a difference."""
+        self.create_test_image(self.actual_path, color=(255, 0, 0, 0))
+
+        assert diff_png(self.baseline_path, self.actual_path) == 1.0
+
+    def test_diff_image_missing_baseline(self):
+        """Test in-memory comparison without a baseline file."""
+        actual_img = Image.new("RGBA", (10, 10), (255, 0, 0, 255))
+
+        with pytest.raises(FileNotFoundError, match="Baseline image not found"):
+            diff_image(self.temp_dir / "missing.png", actual_img)
+
     def test_completely_different_images(self):
         """Test completely different images return high difference ratio."""
         # Create a blue image as actual
@@ -185,61 +257,80 @@ class TestPixelDiff:
             diff_png(self.baseline_path, self.actual_path)
 
 
-class TestCalculatePixelDifference:
-    """Test cases for pixel difference calculation helper function."""
-
-    def test_identical_pixels(self):
-        """Test that identical pixels return 0.0 difference."""
-        pixel1 = (255, 0, 0, 255)
-        pixel2 = (255, 0, 0, 255)
+class TestPixelThreshold:
+    """Test cases for the per-pixel threshold of the comparison."""
 
-        diff = _calculate_pixel_difference(pixel1, pixel2)
-        assert diff == 0.0
+    @pytest.fixture(autouse=True)
+    def require_pil(self):
+        """Skip when PIL is not available."""
+        if Image is None:
+            pytest.skip("PIL (Pillow) not available")
 
-    def test_maximally_different_pixels(self):
-        """Test maximally different pixels (black vs white with full alpha)."""
+    def diff_pixels(self, tmp_path, baseline_pixel, actual_pixel, threshold):
+        """Compare two single-pixel images (RGB or RGBA by tuple length)."""
+        baseline_path = tmp_path / "baseline.png"
+        mode = "RGBA" if len(baseline_pixel) == 4 else "RGB"
+        Image.new(mode, (1, 1), baseline_pixel).save(baseline_path, "PNG")
+
+        mode = "RGBA" if len(actual_pixel) == 4 else "RGB"
+        actual_img = Image.new(mode, (1, 1), actual_pixel)
+        return diff_image(baseline_path, actual_img, threshold=threshold)
+
+    def test_identical_pixels(self, tmp_path):
+        """Test that identical pixels never differ."""
+        pixel = (255, 0, 0, 255)
+        assert self.diff_pixels(tmp_path, pixel, pixel, 0.0) == 0.0
+
+    def test_pixel_at_threshold_is_not_different(self, tmp_path):
+        """Test a distance exactly at the threshold vs one unit over it."""
+        # Distance 51 normalizes to 51 / 510 == 0.1
+        baseline = (0, 0, 0, 255)
+        assert self.diff_pixels(tmp_path, baseline, (51, 0, 0, 255), 0.1) == 0.0
+        assert self.diff_pixels(tmp_path, baseline, (52, 0, 0, 255), 0.1) == 1.0
+
+    def test_maximally_different_pixels(self, tmp_path):
+        """Test black transparent vs white opaque only passes a 1.0 threshold."""
         pixel1 = (0, 0, 0, 0)  # Transparent black
         pixel2 = (255, 255, 255, 255)  # Opaque white
 
-        diff = _calculate_pixel_difference(pixel1, pixel2)
-        assert diff == 1.0
-
-    def test_rgb_pixels_without_alpha(self):
-        """Test RGB pixels (missing alpha channel)."""
-        pixel1 = (255, 0, 0)  # Red without alpha
-        pixel2 = (0, 255, 0)  # Green without alpha
-
-        diff = _calculate_pixel_difference(pixel1, pixel2)
-        assert 0.0 < diff < 1.0
+        assert self.diff_pixels(tmp_path, pixel1, pixel2, 0.99) == 1.0
+        assert self.diff_pixels(tmp_path, pixel1, pixel2, 1.0) == 0.0
 
-    def test_mixed_rgb_and_rgba_pixels(self):
-        """Test mixing RGB and RGBA pixels."""
-        pixel1 = (255, 0, 0)  # RGB red
-        pixel2 = (255, 0, 0, 255)  # RGBA red with full alpha
+    def test_mixed_rgb_and_rgba_pixels(self, tmp_path):
+        """Test RGB pixels compare as opaque RGBA pixels."""
+        assert self.diff_pixels(tmp_path, (255, 0, 0), (255, 0, 0, 255), 0.0) == 0.0
+        assert self.diff_pixels(tmp_path, (255, 0, 0), (255, 0, 0, 254), 0.0) == 1.0
 
-        diff = _calculate_pixel_difference(pixel1, pixel2)
-        assert diff == 0.0  # Should be identical (RGB treated as RGBA with alpha=255)
-
-    def test_difference_is_symmetric(self):
-        """Test that pixel difference calculation is symmetric."""
+    def test_difference_is_symmetric(self, tmp_path):
+        """Test that swapping baseline and actual gives the same result."""
         pixel1 = (100, 150, 200, 128)
         pixel2 = (50, 75, 225, 255)
 
-        diff1 = _calculate_pixel_difference(pixel1, pixel2)
-        diff2 = _calculate_pixel_difference(pixel2, pixel1)
+        for threshold in (0.1, 0.2, 0.3):
+            assert self.diff_pixels(
+                tmp_path, pixel1, pixel2, threshold
+            ) == self.diff_pixels(tmp_path, pixel2, pixel1, threshold)
+
+
+class TestSquaredDistanceLimit:
+    """Test cases for the squared distance limit of a threshold."""
 
-        assert diff1 == diff2
+    def test_limit_matches_pixel_difference(self):
+        """Test that the limit is the first squared distance over the threshold."""
+        max_distance = math.sqrt(4 * 255 * 255)
 
-    def test_difference_range(self):
-        """Test that differences are always in valid 0.0-1.0 range."""
-        import random
+        for threshold in (0.01, 0.02, 0.1, 0.5, 0.99):
+            limit = _squared_distance_limit(threshold)
+            assert math.sqrt(limit) / max_distance > threshold
+            assert math.sqrt(limit - 1) / max_distance <= threshold
 
-        for _ in range(100):  # Test with random pixel values
-            pixel1 = tuple(random.randint(0, 255) for _ in range(4))
-            pixel2 = tuple(random.randint(0, 255) for _ in range(4))
+    def test_no_pixel_differs_at_full_threshold(self):
+        """Test that a 1.0 threshold puts the limit above any distance."""
+        assert _squared_distance_limit(1.0) > 4 * 255 * 255
 
-            diff = _calculate_pixel_difference(pixel1, pixel2)
-            assert 0.0 <= diff <= 1.0
+    def test_zero_threshold_counts_any_change(self):
+        """Test that a 0.0 threshold counts any nonzero distance."""
+        assert _squared_distance_limit(0.0) == 1
 
 
 class TestIsDiffSupported:
@@ -7,6 +7,7 @@
  * visual validation via Puppeteer MCP screenshot capture.
  * 
  * Usage: node render_html.js input.xlsx [SheetName] > output.html
+ *        node render_html.js input.xlsx --batch [SheetName...] > pages.json
  * 
  * Requirements: npm install xlsx
  */
@@ -15,58 +16,17 @@ const XLSX = require('xlsx');
 const fs = require('fs');
 const path = require('path');
 
-function main() {
-    // Parse command line arguments
-    const args = process.argv.slice(2);
-    if (args.length < 1) {
-        console.error('Usage: node render_html.js input.xlsx [SheetName] > output.html');
-        console.error('');
-        console.error('Examples:');
-        console.error('  node render_html.js data.xlsx Dashboard > dashboard.html');
-        console.error('  node render_html.js data.xlsx > first_sheet.html');
-        process.exit(1);
-    }
-
-    const excelPath = args[0];
-    const sheetName = args[1]; // Optional - uses first sheet if not specified
-
-    // Validate input file exists
-    if (!fs.existsSync(excelPath)) {
-        console.error(`Error: File not found: ${excelPath}`);
-        process.exit(1);
-    }
+function renderSheetHtml(workbook, targetSheetName) {
+    const targetSheet = workbook.Sheets[targetSheetName];
 
-    try {
-        // Read Excel workbook
-        const workbook = XLSX.readFile(excelPath);
-        
-        // Get target sheet
-        let targetSheet;
-        let targetSheetName;
-        
-        if (sheetName) {
-            // Use specified sheet name
-            if (!(sheetName in workbook.Sheets)) {
-                console.error(`Error: Sheet '${sheetName}' not found in workbook`);
-                console.error(`Available sheets: ${Object.keys(workbook.Sheets).join(', ')}`);
-                process.exit(1);
-            }
-            targetSheet = workbook.Sheets[sheetName];
-            targetSheetName = sheetName;
-        } else {
-            // Use first sheet
-            targetSheetName = workbook.SheetNames[0];
-            targetSheet = workbook.Sheets[targetSheetName];
-        }
+    // Convert sheet to HTML
+    const htmlOutput = XLSX.utils.sheet_to_html(targetSheet, {
+        id: 'excel-sheet',
+        editable: false
+    });
 
-        // Convert sheet to HTML
-        const htmlOutput = XLSX.utils.sheet_to_html(targetSheet, {
-            id: 'excel-sheet',
-            editable: false
-        });
-
-        // Create complete HTML document with styling
-        const fullHtml = `<!DOCTYPE html>
+    // Create complete HTML document with styling
+    return `<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -122,9 +82,71 @@ function main() {
     ${htmlOutput}
 </body>
 </html>`;
+}
+
+function checkSheetExists(workbook, sheetName) {
+    if (!(sheetName in workbook.Sheets)) {
+        console.error(`Error: Sheet '${sheetName}' not found in workbook`);
+        console.error(`Available sheets: ${Object.keys(workbook.Sheets).join(', ')}`);
+        process.exit(1);
+    }
+}
+
+function main() {
+    // Parse command line arguments
+    const args = process.argv.slice(2);
+    if (args.length < 1) {
+        console.error('Usage: node render_html.js input.xlsx [SheetName] > output.html');
+        console.error('       node render_html.js input.xlsx --batch [SheetName...] > pages.json');
+        console.error('');
+        console.error('Examples:');
+        console.error('  node render_html.js data.xlsx Dashboard > dashboard.html');
+        console.error('  node render_html.js data.xlsx > first_sheet.html');
+        console.error('  node render_html.js data.xlsx --batch Dashboard Data > pages.json');
+        process.exit(1);
+    }
+
+    const excelPath = args[0];
+    const batch = args[1] === '--batch';
+    const sheetName = args[1]; // Optional - uses first sheet if not specified
+
+    // Validate input file exists
+    if (!fs.existsSync(excelPath)) {
+        console.error(`Error: File not found: ${excelPath}`);
+        process.exit(1);
+    }
+
+    try {
+        // Read Excel workbook
+        const workbook = XLSX.readFile(excelPath);
+
+        if (batch) {
+            // Render the named sheets (all sheets if none are named) from a
+            // single read of the workbook, as a JSON object of sheet -> HTML
+            const sheetNames = args.length > 2 ? args.slice(2) : workbook.SheetNames;
+            const pages = {};
+            for (const name of sheetNames) {
+                checkSheetExists(workbook, name);
+                pages[name] = renderSheetHtml(workbook, name);
+            }
+            console.log(JSON.stringify(pages));
+            return;
+        }
+
+        // Get target sheet
+        let targetSheetName;
+        
+        if (sheetName) {
+            // Use specified sheet name
+            checkSheetExists(workbook, sheetName);
+            targetSheetName = sheetName;
+        } else {
+            // Use first sheet
+            targetSheetName = workbook.SheetNames[0];
+        }
 
         // Output to stdout
-        console.log(fullHtml);
+        console.log(renderSheetHtml(workbook, targetSheetName));
 
     } catch (error) {
         console.error(`Error processing Excel file: ${error.message}`);